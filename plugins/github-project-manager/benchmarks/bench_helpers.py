@@ -0,0 +1,313 @@
+#!/usr/bin/env python3
+"""
+Benchmark harness for gh_project_helpers.py
+
+Times the hot helper functions and the CLI end to end on synthetic
+projects of increasing size, and reports throughput and peak RSS as JSON.
+Each (case, size) pair runs in its own child process, so peak RSS is
+per case rather than the high-water mark of the whole run.
+
+Usage:
+    python3 bench_helpers.py run --sizes 1000 10000 100000 --output results.json
+    python3 bench_helpers.py run --cases count_by_field cli_count_by_field --sizes 1000000
+    python3 bench_helpers.py compare baseline.json results.json --threshold 0.15
+
+compare exits 1 when any case common to both files got slower by more
+than the threshold, so it can gate a change in CI or before a commit.
+
+Generated items files are kept in --workdir (default .bench-data/) and
+reused while their generator spec is unchanged. CLI fetch cases run the
+helpers against fake-gh/gh, with GH_FAKE_LATENCY seconds per call.
+"""
+
+import argparse
+import json
+import os
+import platform
+import resource
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional
+
+BENCH_DIR = Path(__file__).resolve().parent
+HELPERS_PATH = BENCH_DIR.parent / 'helpers' / 'gh_project_helpers.py'
+FAKE_GH_DIR = BENCH_DIR / 'fake-gh'
+
+sys.path.insert(0, str(BENCH_DIR))
+sys.path.insert(0, str(HELPERS_PATH.parent))
+from synthetic_project import SyntheticProject  # noqa: E402
+from gh_project_helpers import GHProjectHelpers  # noqa: E402
+
+# Fixed reference time, so generated files and stale counts are reproducible
+REFERENCE_NOW = '2026-01-01T00:00:00+00:00'
+
+
+def peak_rss_kb(who: int = resource.RUSAGE_SELF) -> int:
+    """Peak resident set size in KiB (ru_maxrss is bytes on macOS, KiB elsewhere)."""
+    peak = resource.getrusage(who).ru_maxrss
+    return peak // 1024 if platform.system() == 'Darwin' else peak
+
+
+def items_file(workdir: Path, size: int, seed: int) -> Path:
+    """Return a generated items file for size items, writing it if missing or stale."""
+    project = SyntheticProject(items=size, seed=seed, now=REFERENCE_NOW)
+    path = workdir / f'items-{size}-{seed}.json'
+    spec_path = path.with_suffix('.spec.json')
+    spec = json.dumps(project.spec(), sort_keys=True)
+    if not path.exists() or not spec_path.exists() or spec_path.read_text() != spec:
+        project.write(str(path))
+        spec_path.write_text(spec)
+    return path
+
+
+def run_cli(args: List[str], env: Optional[Dict[str, str]] = None) -> None:
+    result = subprocess.run([sys.executable, str(HELPERS_PATH)] + args, stdout=subprocess.DEVNULL,
+                            stderr=subprocess.PIPE, text=True, env=env)
+    if result.returncode != 0:
+        raise RuntimeError(f"CLI {' '.join(args[:1])} failed: {result.stderr.strip()}")
+
+
+def fake_gh_env(size: int, seed: int, workdir: Path) -> Dict[str, str]:
+    env = dict(os.environ)
+    env['PATH'] = f"{FAKE_GH_DIR}{os.pathsep}{env.get('PATH', '')}"
+    env['GH_FAKE_PROJECT'] = json.dumps(SyntheticProject(items=size, seed=seed, now=REFERENCE_NOW).spec())
+    env.setdefault('GH_FAKE_LATENCY', '0.05')
+    env['GH_PROJECT_CACHE_DIR'] = str(workdir / 'gh-cache')
+    env['GH_PROJECT_CACHE'] = '0'
+    return env
+
+
+# Cases by name. Kind 'items' functions are timed over a preloaded item
+# list, 'file' ones read the items file themselves and 'cli' ones run
+# gh_project_helpers.py in a subprocess and are timed end to end
+CASES: Dict[str, Callable] = {}
+
+
+def case(name: str, kind: str = 'items'):
+    def register(func: Callable) -> Callable:
+        func.kind = kind
+        CASES[name] = func
+        return func
+    return register
+
+
+@case('load_items', kind='file')
+def bench_load_items(path: Path, **_) -> None:
+    GHProjectHelpers.load_items(path)
+
+
+@case('filter_items')
+def bench_filter_items(items: List[Dict], **_) -> None:
+    GHProjectHelpers.filter_items(items, {'Status': ['Todo', 'In Progress'], 'Priority': 'P1'})
+
+
+@case('group_items_by_field')
+def bench_group_items_by_field(items: List[Dict], **_) -> None:
+    GHProjectHelpers.group_items_by_field(items, 'Status')
+
+
+@case('count_by_field')
+def bench_count_by_field(items: List[Dict], **_) -> None:
+    GHProjectHelpers.count_by_field(items, 'Status')
+
+
+@case('find_stale_items')
+def bench_find_stale_items(items: List[Dict], **_) -> None:
+    GHProjectHelpers.find_stale_items(items, 14, ['Todo', 'In Progress'])
+
+
+@case('format_item_for_display')
+def bench_format_item_for_display(items: List[Dict], **_) -> None:
+    for item in items:
+        GHProjectHelpers.format_item_for_display(item)
+
+
+@case('suggest_priority')
+def bench_suggest_priority(items: List[Dict], **_) -> None:
+    for item in items:
+        content = item.get('content') or {}
+        GHProjectHelpers.suggest_priority(content.get('title', ''), content.get('body', ''),
+                                          GHProjectHelpers.get_item_labels(item))
+
+
+@case('cli_count_by_field', kind='cli')
+def bench_cli_count_by_field(path: Path, **_) -> None:
+    run_cli(['count-by-field', str(path), '--field', 'Status'])
+
+
+@case('cli_filter_items', kind='cli')
+def bench_cli_filter_items(path: Path, **_) -> None:
+    run_cli(['filter-items', str(path), '--field', 'Status', 'Todo'])
+
+
+@case('cli_find_stale', kind='cli')
+def bench_cli_find_stale(path: Path, **_) -> None:
+    run_cli(['find-stale', str(path), '--days', '14'])
+
+
+@case('cli_format_items', kind='cli')
+def bench_cli_format_items(path: Path, **_) -> None:
+    run_cli(['format-items', str(path)])
+
+
+@case('cli_fetch_items', kind='cli')
+def bench_cli_fetch_items(path: Path, size: int, seed: int, workdir: Path) -> None:
+    with tempfile.TemporaryDirectory(dir=workdir) as tmp:
+        run_cli(['fetch-items', '--owner', 'acme', '--project', '1', '--output', f'{tmp}/items.json'],
+                env=fake_gh_env(size, seed, workdir))
+
+
+def run_case(name: str, size: int, seed: int, repeat: int, workdir: Path) -> Dict[str, Any]:
+    """Run one case in this process and return its measurements."""
+    func = CASES[name]
+    path = items_file(workdir, size, seed)
+    kwargs = {'path': path, 'size': size, 'seed': seed, 'workdir': workdir}
+
+    load_seconds = None
+    if func.kind == 'items':
+        start = time.perf_counter()
+        kwargs['items'] = GHProjectHelpers.load_items(path)
+        load_seconds = time.perf_counter() - start
+
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func(**kwargs)
+        timings.append(time.perf_counter() - start)
+
+    best = min(timings)
+    result = {
+        'case': name,
+        'items': size,
+        'seconds': round(best, 6),
+        'median_seconds': round(sorted(timings)[len(timings) // 2], 6),
+        'items_per_second': round(size / best) if best else None,
+        'peak_rss_kb': max(peak_rss_kb(), peak_rss_kb(resource.RUSAGE_CHILDREN)),
+        'repeat': repeat,
+    }
+    if load_seconds is not None:
+        result['load_seconds'] = round(load_seconds, 6)
+    return result
+
+
+def run(cases: List[str], sizes: List[int], seed: int, repeat: int, workdir: Path) -> Dict[str, Any]:
+    """Run every (case, size) pair in a child process and collect the results."""
+    results = []
+    for size in sizes:
+        items_file(workdir, size, seed)
+        for name in cases:
+            child = subprocess.run(
+                [sys.executable, __file__, '_case', name, '--size', str(size), '--seed', str(seed),
+                 '--repeat', str(repeat), '--workdir', str(workdir)],
+                capture_output=True, text=True)
+            if child.returncode != 0:
+                result = {'case': name, 'items': size, 'error': child.stderr.strip().splitlines()[-1:]}
+            else:
+                result = json.loads(child.stdout)
+            print(json.dumps(result), file=sys.stderr, flush=True)
+            results.append(result)
+
+    return {
+        'python': platform.python_version(),
+        'platform': platform.platform(),
+        'seed': seed,
+        'created': time.strftime('%Y-%m-%dT%H:%M:%SZ', time.gmtime()),
+        'results': results,
+    }
+
+
+def compare(baseline: Dict[str, Any], current: Dict[str, Any], threshold: float) -> Dict[str, Any]:
+    """
+    Compare two run() reports case by case.
+
+    Returns:
+        Dict with 'regressions', 'improvements' and 'unchanged' lists; each
+        entry has case, items, both timings and the ratio current/baseline
+    """
+    def keyed(report: Dict[str, Any]) -> Dict[tuple, Dict[str, Any]]:
+        return {(r['case'], r['items']): r for r in report.get('results', []) if 'seconds' in r}
+
+    old, new = keyed(baseline), keyed(current)
+    report = {'threshold': threshold, 'regressions': [], 'improvements': [], 'unchanged': []}
+    for key in sorted(old.keys() & new.keys()):
+        before, after = old[key]['seconds'], new[key]['seconds']
+        ratio = after / before if before else float('inf')
+        entry = {'case': key[0], 'items': key[1], 'baseline_seconds': before, 'seconds': after,
+                 'ratio': round(ratio, 3),
+                 'baseline_peak_rss_kb': old[key].get('peak_rss_kb'), 'peak_rss_kb': new[key].get('peak_rss_kb')}
+        if ratio > 1 + threshold:
+            report['regressions'].append(entry)
+        elif ratio < 1 - threshold:
+            report['improvements'].append(entry)
+        else:
+            report['unchanged'].append(entry)
+    return report
+
+
+def main():
+    """CLI interface for the benchmark harness"""
+    parser = argparse.ArgumentParser(description='Benchmark gh_project_helpers.py')
+    subparsers = parser.add_subparsers(dest='command', help='Command to execute')
+
+    run_parser = subparsers.add_parser('run', help='Run benchmarks and print a JSON report')
+    run_parser.add_argument('--cases', nargs='+', choices=sorted(CASES), default=list(CASES),
+                            help='Cases to run (default: all)')
+    run_parser.add_argument('--sizes', type=int, nargs='+', default=[1000, 10000, 100000],
+                            help='Project sizes in items (default 1000 10000 100000)')
+    run_parser.add_argument('--seed', type=int, default=1, help='Generator seed')
+    run_parser.add_argument('--repeat', type=int, default=3, help='Timed runs per case; the best is reported')
+    run_parser.add_argument('--workdir', default='.bench-data', help='Directory for generated items files')
+    run_parser.add_argument('--output', help='Also write the report to this file')
+    run_parser.add_argument('--compare', metavar='BASELINE', help='Compare against a saved report')
+    run_parser.add_argument('--threshold', type=float, default=0.15,
+                            help='Relative slowdown counted as a regression (default 0.15)')
+
+    compare_parser = subparsers.add_parser('compare', help='Compare two saved reports')
+    compare_parser.add_argument('baseline', help='Baseline report JSON')
+    compare_parser.add_argument('current', help='Current report JSON')
+    compare_parser.add_argument('--threshold', type=float, default=0.15,
+                                help='Relative slowdown counted as a regression (default 0.15)')
+
+    # Internal: one case in a fresh process
+    case_parser = subparsers.add_parser('_case')
+    case_parser.add_argument('name', choices=sorted(CASES))
+    case_parser.add_argument('--size', type=int, required=True)
+    case_parser.add_argument('--seed', type=int, default=1)
+    case_parser.add_argument('--repeat', type=int, default=3)
+    case_parser.add_argument('--workdir', required=True)
+
+    args = parser.parse_args()
+
+    if not args.command:
+        parser.print_help()
+        return 1
+
+    if args.command == '_case':
+        print(json.dumps(run_case(args.name, args.size, args.seed, args.repeat, Path(args.workdir))))
+        return 0
+
+    if args.command == 'run':
+        workdir = Path(args.workdir)
+        workdir.mkdir(parents=True, exist_ok=True)
+        report = run(args.cases, args.sizes, args.seed, args.repeat, workdir)
+        if args.output:
+            Path(args.output).write_text(json.dumps(report, indent=2) + '\n')
+        if args.compare:
+            report['comparison'] = compare(json.loads(Path(args.compare).read_text()), report, args.threshold)
+        print(json.dumps(report, indent=2))
+        return 1 if report.get('comparison', {}).get('regressions') else 0
+
+    if args.command == 'compare':
+        comparison = compare(json.loads(Path(args.baseline).read_text()),
+                             json.loads(Path(args.current).read_text()), args.threshold)
+        print(json.dumps(comparison, indent=2))
+        return 1 if comparison['regressions'] else 0
+
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
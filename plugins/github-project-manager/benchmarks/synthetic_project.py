@@ -0,0 +1,209 @@
+#!/usr/bin/env python3
+"""
+Synthetic GitHub Project generator
+
+Produces realistic project items in the shape gh_project_helpers.py reads
+(gh project item-list --format json with fieldValues), for benchmarking.
+Every item is derived from (seed, index) alone, so any slice of a project
+can be regenerated without the rest - the fake gh uses this to serve
+pages of million-item projects without building them in memory.
+
+Usage:
+    python3 synthetic_project.py --items 100000 --output items.json
+    python3 synthetic_project.py --items 1000 --field Status=5 --field Team=40 --skew 1.5
+
+Distributions:
+    - Single-select fields get the given number of options, weighted
+      Zipf-like (weight 1/(rank+1)^skew), so a few values dominate
+    - Each field is unset for a fraction of items (--unset-rate)
+    - updatedAt ages are exponential with mean --mean-age-days
+    - Content is ~80% issues, ~15% pull requests and ~5% draft issues
+"""
+
+import argparse
+import bisect
+import json
+import random
+import sys
+from datetime import datetime, timedelta, timezone
+from typing import Any, Dict, Iterator, List, Optional
+
+
+class SyntheticProject:
+    """
+    Deterministic generator of project items.
+
+    Example:
+        project = SyntheticProject(items=10000, seed=7)
+        first_page = [project.item(i) for i in range(100)]
+        project.write('items.json')
+    """
+
+    # Option names for well-known fields; other fields get 'Name 1'..'Name N'
+    KNOWN_OPTIONS = {
+        'Status': ['Todo', 'In Progress', 'Done', 'Backlog', 'In Review', 'Blocked', 'Cancelled'],
+        'Priority': ['P2', 'P1', 'P3', 'P0', 'P4'],
+        'Size': ['M', 'S', 'L', 'XS', 'XL'],
+    }
+    DEFAULT_FIELDS = {'Status': 5, 'Priority': 4, 'Size': 5, 'Iteration': 12, 'Team': 8}
+    CONTENT_TYPES = (('Issue', 0.80), ('PullRequest', 0.15), ('DraftIssue', 0.05))
+
+    # Title and body vocabulary, including the words PriorityMatcher looks for
+    TITLE_PREFIXES = ['Fix', 'Add', 'Improve', 'Refactor', 'Investigate', 'Document', 'Remove', 'Update']
+    TITLE_SUBJECTS = ['login flow', 'search index', 'billing page', 'API pagination', 'webhook retries',
+                      'dark mode', 'export to CSV', 'rate limiting', 'onboarding emails', 'audit log']
+    TITLE_MARKERS = ['', '', '', '', '', 'crash in', 'security issue in', 'production outage in',
+                     'regression in', 'nice to have:', 'typo in', 'blocker:', 'performance of']
+    LABELS = ['bug', 'enhancement', 'documentation', 'critical', 'security', 'good first issue',
+              'performance', 'question', 'wontfix', 'tech-debt']
+
+    def __init__(self, items: int = 1000, seed: int = 1, fields: Optional[Dict[str, int]] = None,
+                 skew: float = 1.2, unset_rate: float = 0.1, mean_age_days: float = 30.0,
+                 body_words: int = 20, now: Optional[str] = None, repository: str = 'acme/app'):
+        self.items = items
+        self.seed = seed
+        self.fields = dict(fields or self.DEFAULT_FIELDS)
+        self.skew = skew
+        self.unset_rate = unset_rate
+        self.mean_age_days = mean_age_days
+        self.body_words = body_words
+        self.now = (datetime.fromisoformat(now.replace('Z', '+00:00')) if now
+                    else datetime.now(timezone.utc).replace(microsecond=0))
+        self.repository = repository
+
+        self.options = {name: self.option_names(name, count) for name, count in self.fields.items()}
+        self.cumulative = {name: self.zipf_cumulative(len(names), skew) for name, names in self.options.items()}
+        self.type_cumulative = []
+        total = 0.0
+        for _, share in self.CONTENT_TYPES:
+            total += share
+            self.type_cumulative.append(total)
+
+    @classmethod
+    def from_spec(cls, spec: Dict[str, Any]) -> 'SyntheticProject':
+        """Build a generator from a dict of constructor arguments (e.g. parsed JSON)."""
+        return cls(**spec)
+
+    def spec(self) -> Dict[str, Any]:
+        """Constructor arguments that reproduce this project exactly."""
+        return {'items': self.items, 'seed': self.seed, 'fields': self.fields, 'skew': self.skew,
+                'unset_rate': self.unset_rate, 'mean_age_days': self.mean_age_days,
+                'body_words': self.body_words, 'now': self.now.isoformat(), 'repository': self.repository}
+
+    @classmethod
+    def option_names(cls, field_name: str, count: int) -> List[str]:
+        known = cls.KNOWN_OPTIONS.get(field_name, [])
+        return known[:count] + [f'{field_name} {i}' for i in range(len(known) + 1, count + 1)]
+
+    @staticmethod
+    def zipf_cumulative(count: int, skew: float) -> List[float]:
+        weights = [1.0 / (rank + 1) ** skew for rank in range(count)]
+        total = sum(weights)
+        cumulative, running = [], 0.0
+        for weight in weights:
+            running += weight / total
+            cumulative.append(running)
+        return cumulative
+
+    def item(self, index: int) -> Dict[str, Any]:
+        """Return item number index; the same (seed, index) always gives the same item."""
+        rng = random.Random(self.seed * 1_000_003 + index)
+
+        item_type = self.CONTENT_TYPES[min(bisect.bisect_left(self.type_cumulative, rng.random()),
+                                           len(self.CONTENT_TYPES) - 1)][0]
+        title = ' '.join(word for word in (rng.choice(self.TITLE_MARKERS), rng.choice(self.TITLE_PREFIXES),
+                                           rng.choice(self.TITLE_SUBJECTS)) if word)
+        updated = self.now - timedelta(seconds=int(rng.expovariate(1.0 / (self.mean_age_days * 86400))))
+
+        content: Dict[str, Any] = {'type': item_type, 'title': f'{title} #{index}',
+                                   'updatedAt': updated.strftime('%Y-%m-%dT%H:%M:%SZ')}
+        if item_type != 'DraftIssue':
+            kind = 'issues' if item_type == 'Issue' else 'pull'
+            content['number'] = index + 1
+            content['url'] = f'https://github.com/{self.repository}/{kind}/{index + 1}'
+            content['repository'] = self.repository
+        if self.body_words:
+            words = self.TITLE_SUBJECTS + self.TITLE_MARKERS + self.LABELS
+            content['body'] = ' '.join(rng.choice(words) for _ in range(self.body_words)).strip()
+
+        field_values = []
+        for name, options in self.options.items():
+            if rng.random() < self.unset_rate:
+                continue
+            value = options[min(bisect.bisect_left(self.cumulative[name], rng.random()), len(options) - 1)]
+            key = 'title' if name == 'Iteration' else 'name'
+            field_values.append({key: value, 'field': {'name': name}})
+
+        return {
+            'id': f'PVTI_synthetic_{self.seed}_{index}',
+            'content': content,
+            'fieldValues': field_values,
+            'labels': rng.sample(self.LABELS, rng.choice((0, 0, 1, 1, 2, 3))),
+        }
+
+    def iter_items(self, start: int = 0, stop: Optional[int] = None) -> Iterator[Dict[str, Any]]:
+        """Yield items start..stop-1 (default: all)."""
+        for index in range(start, min(self.items if stop is None else stop, self.items)):
+            yield self.item(index)
+
+    def field_list(self) -> Dict[str, Any]:
+        """Fields in gh project field-list --format json shape."""
+        fields = [{'id': 'PVTF_title', 'name': 'Title', 'type': 'ProjectV2Field'}]
+        for number, (name, options) in enumerate(self.options.items()):
+            field_id = f'PVTSSF_synthetic_{number}'
+            if name == 'Iteration':
+                fields.append({'id': field_id, 'name': name, 'type': 'ProjectV2IterationField'})
+            else:
+                fields.append({'id': field_id, 'name': name, 'type': 'ProjectV2SingleSelectField',
+                               'options': [{'id': f'{field_id}_{i}', 'name': option}
+                                           for i, option in enumerate(options)]})
+        return {'fields': fields, 'totalCount': len(fields)}
+
+    def write(self, path: str) -> int:
+        """Write the project as {"items": [...], "totalCount": N}, one item at a time."""
+        with open(path, 'w') as f:
+            f.write('{"items": [')
+            for index, item in enumerate(self.iter_items()):
+                f.write(',\n' if index else '\n')
+                f.write(json.dumps(item))
+            f.write(f'\n], "totalCount": {self.items}}}\n')
+        return self.items
+
+
+def parse_field(text: str) -> tuple:
+    name, sep, count = text.partition('=')
+    if not sep or not count.isdigit():
+        raise argparse.ArgumentTypeError(f"Expected NAME=OPTIONS, got {text!r}")
+    return name, int(count)
+
+
+def main():
+    """CLI interface for the generator"""
+    parser = argparse.ArgumentParser(description='Generate a synthetic GitHub Project items file')
+    parser.add_argument('--items', type=int, default=1000, help='Number of items')
+    parser.add_argument('--output', required=True, help='JSON file to write ("-" for stdout)')
+    parser.add_argument('--seed', type=int, default=1, help='Random seed')
+    parser.add_argument('--field', type=parse_field, action='append', metavar='NAME=OPTIONS',
+                        help='Single-select field and its option count (can be used multiple times; '
+                             'default Status=5 Priority=4 Size=5 Iteration=12 Team=8)')
+    parser.add_argument('--skew', type=float, default=1.2, help='Zipf exponent for option popularity')
+    parser.add_argument('--unset-rate', type=float, default=0.1, help='Fraction of items missing each field')
+    parser.add_argument('--mean-age-days', type=float, default=30.0, help='Mean days since updatedAt')
+    parser.add_argument('--body-words', type=int, default=20, help='Words per item body (0 for none)')
+    parser.add_argument('--now', help='Reference time for updatedAt (ISO 8601; default: now)')
+    args = parser.parse_args()
+
+    project = SyntheticProject(args.items, args.seed, dict(args.field) if args.field else None, args.skew,
+                               args.unset_rate, args.mean_age_days, args.body_words, args.now)
+    if args.output == '-':
+        for index, item in enumerate(project.iter_items()):
+            sys.stdout.write(('[\n' if index == 0 else ',\n') + json.dumps(item))
+        sys.stdout.write('\n]\n' if project.items else '[]\n')
+    else:
+        project.write(args.output)
+        print(json.dumps({'output': args.output, **project.spec()}))
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
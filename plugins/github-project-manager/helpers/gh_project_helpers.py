@@ -14,12 +14,28 @@ Examples:
     python3 gh_project_helpers.py extract-field-id --field "Priority" fields.json
 """
 
+import gc
 import json
+import marshal
+import os
 import sys
+from array import array
+from collections import Counter
+from itertools import islice
 import subprocess
 import argparse
-from typing import Any, Dict, List, Optional, Union
-from datetime import datetime, timedelta
+import asyncio
+import atexit
+import bisect
+import csv
+import hashlib
+import random
+import re
+import shlex
+import shutil
+import time
+from typing import Any, AsyncIterator, Dict, Iterable, Iterator, List, Optional, TextIO, Union
+from datetime import datetime, timedelta, timezone
 from pathlib import Path
 
 
@@ -31,14 +47,73 @@ class GHProjectError(Exception):
 class GHProjectHelpers:
     """Helper functions for GitHub Projects V2 CLI operations"""
 
+    # Characters read per refill by iter_items()
+    STREAM_CHUNK_SIZE = 1 << 20
+
+    # GraphQL page size limit for ProjectV2.items
+    GRAPHQL_PAGE_SIZE = 100
+
+    # Item content attributes that can be requested through GraphQL
+    CONTENT_FIELDS = ('number', 'title', 'url', 'updatedAt')
+
+    # Keys of format_item_for_display() rows, in display order
+    DISPLAY_COLUMNS = ('id', 'number', 'title', 'type', 'status', 'priority', 'url', 'updated')
+    RENDER_FORMATS = ('json', 'jsonl', 'csv', 'tsv', 'table')
+    # Rows sampled to size table columns before streaming the rest
+    TABLE_SAMPLE_ROWS = 50
+    TABLE_MAX_WIDTH = 60
+
+    # Field and content projections needed by each item command
+    FETCH_PRESETS = {
+        'find-stale': {'fields': ['Status', 'Priority'], 'content': ['number', 'title', 'updatedAt']},
+        'count-by-field': {'fields': ['Status', 'Priority'], 'content': []},
+        'format-items': {'fields': ['Status', 'Priority'], 'content': list(CONTENT_FIELDS)},
+        'triage': {'fields': ['Status', 'Priority'], 'content': ['number', 'title', 'url']},
+    }
+
+    FIELD_VALUE_FRAGMENT = """
+        ... on ProjectV2ItemFieldSingleSelectValue { name field { ... on ProjectV2FieldCommon { name } } }
+        ... on ProjectV2ItemFieldTextValue { text field { ... on ProjectV2FieldCommon { name } } }
+        ... on ProjectV2ItemFieldNumberValue { number field { ... on ProjectV2FieldCommon { name } } }
+        ... on ProjectV2ItemFieldDateValue { date field { ... on ProjectV2FieldCommon { name } } }
+        ... on ProjectV2ItemFieldIterationValue { title field { ... on ProjectV2FieldCommon { name } } }
+    """
+
+    @staticmethod
+    def build_gh_argv(command: Union[str, List[str]], format_json: bool = True) -> List[str]:
+        """
+        Build the argv list for a gh command.
+
+        Args:
+            command: The gh command (without 'gh' prefix) as a string or argv list
+            format_json: Whether to add --format json
+
+        Returns:
+            argv list starting with 'gh'
+        """
+        argv = shlex.split(command) if isinstance(command, str) else list(command)
+        if argv and argv[0] == 'gh':
+            argv = argv[1:]
+        if format_json and '--format' not in argv and not any(a.startswith('--format=') for a in argv):
+            argv += ['--format', 'json']
+        return ['gh'] + argv
+
     @staticmethod
-    def run_gh_command(command: str, format_json: bool = True) -> Union[Dict, str]:
+    def run_gh_command(command: Union[str, List[str]], format_json: bool = True,
+                       use_cache: Optional[bool] = None, timeout: Optional[float] = None) -> Union[Dict, str]:
         """
         Run a gh CLI command and return parsed output.
 
+        The command is split into an argv list and run without a shell.
+        Read-only commands listed in GHResponseCache.TTLS are answered from
+        the on-disk response cache while fresh; mutations invalidate the
+        cached reads they affect. Set GH_PROJECT_CACHE=0 to disable.
+
         Args:
-            command: The gh command to run (without 'gh' prefix)
+            command: The gh command to run (without 'gh' prefix), as a string or argv list
             format_json: Whether to add --format json and parse the output
+            use_cache: Force the response cache on or off (default: environment)
+            timeout: Seconds before the command is killed (optional)
 
         Returns:
             Parsed JSON dict if format_json=True, raw string otherwise
@@ -46,385 +121,4980 @@ class GHProjectHelpers:
         Raises:
             GHProjectError: If command fails
         """
-        full_command = f"gh {command}"
-        if format_json and "--format json" not in command:
-            full_command += " --format json"
+        argv = GHProjectHelpers.build_gh_argv(command, format_json)
+        full_command = shlex.join(argv)
+
+        cache = None
+        if use_cache or (use_cache is None and GHResponseCache.enabled()):
+            cache = GHResponseCache.default()
+
+        if cache is not None:
+            cached = cache.get(full_command)
+            if cached is not None:
+                return json.loads(cached) if format_json else cached
 
         try:
-            result = subprocess.run(
-                full_command,
-                shell=True,
-                capture_output=True,
-                text=True,
-                check=True
-            )
+            result = GHRequestScheduler.default().run(argv, timeout=timeout)
+            if result.returncode != 0:
+                raise subprocess.CalledProcessError(result.returncode, argv, result.stdout, result.stderr)
 
-            if format_json:
-                return json.loads(result.stdout)
-            return result.stdout
+            parsed = GHCallTracer.parse_json(result) if format_json else result.stdout
 
         except subprocess.CalledProcessError as e:
             error_msg = e.stderr if e.stderr else str(e)
             raise GHProjectError(f"Command failed: {full_command}\nError: {error_msg}")
+        except subprocess.TimeoutExpired:
+            raise GHProjectError(f"Command timed out after {timeout}s: {full_command}")
+        except FileNotFoundError:
+            raise GHProjectError("gh CLI not found on PATH")
+        except json.JSONDecodeError as e:
+            raise GHProjectError(f"Failed to parse JSON output: {e}")
+
+        if cache is not None:
+            cache.put(full_command, result.stdout)
+        GHResponseCache.invalidate_for(full_command)
+
+        return parsed
+
+    @staticmethod
+    async def run_gh_command_async(command: Union[str, List[str]], format_json: bool = True,
+                                   timeout: Optional[float] = None,
+                                   use_cache: Optional[bool] = None) -> Dict[str, Any]:
+        """
+        Run one gh command with asyncio.create_subprocess_exec.
+
+        Unlike run_gh_command(), failures are reported in the result
+        instead of raised, so one bad call does not cancel its siblings.
+
+        Args:
+            command: The gh command (without 'gh' prefix), as a string or argv list
+            format_json: Whether to add --format json and parse the output
+            timeout: Seconds before the command is killed (optional)
+            use_cache: Force the response cache on or off (default: environment)
+
+        Returns:
+            Dict with 'argv', 'ok', 'returncode', 'elapsed', 'data' and 'error'
+        """
+        argv = GHProjectHelpers.build_gh_argv(command, format_json)
+        full_command = shlex.join(argv)
+        result = {'argv': argv, 'ok': False, 'returncode': None, 'elapsed': 0.0, 'data': None, 'error': None}
+
+        cache = None
+        if use_cache or (use_cache is None and GHResponseCache.enabled()):
+            cache = GHResponseCache.default()
+
+        if cache is not None:
+            cached = cache.get(full_command)
+            if cached is not None:
+                result.update(ok=True, returncode=0, cached=True,
+                              data=json.loads(cached) if format_json else cached)
+                return result
+
+        start = time.monotonic()
+        try:
+            completed = await GHRequestScheduler.default().run_async(argv, timeout=timeout)
+        except FileNotFoundError:
+            result['error'] = "gh CLI not found on PATH"
+            return result
+        except asyncio.TimeoutError:
+            result.update(elapsed=time.monotonic() - start,
+                          error=f"Command timed out after {timeout}s: {full_command}")
+            return result
+
+        output = completed.stdout
+        result['elapsed'] = time.monotonic() - start
+        result['returncode'] = completed.returncode
+
+        if completed.returncode != 0:
+            error_msg = completed.stderr or f"exit status {completed.returncode}"
+            result['error'] = f"Command failed: {full_command}\nError: {error_msg}"
+            return result
+
+        try:
+            result['data'] = GHCallTracer.parse_json(completed) if format_json else output
+        except json.JSONDecodeError as e:
+            result['error'] = f"Failed to parse JSON output: {e}"
+            return result
+
+        result['ok'] = True
+        if cache is not None:
+            cache.put(full_command, output)
+        GHResponseCache.invalidate_for(full_command)
+        return result
+
+    @staticmethod
+    async def iter_gh_commands(commands: Iterable[Union[str, List[str]]], max_concurrency: int = 8,
+                               timeout: Optional[float] = None,
+                               format_json: bool = True) -> AsyncIterator[Dict[str, Any]]:
+        """
+        Run gh commands concurrently and yield results as they complete.
+
+        At most max_concurrency processes run at once, so the network
+        latency of fan-out operations overlaps instead of adding up.
+
+        Args:
+            commands: gh commands (without 'gh' prefix), strings or argv lists
+            max_concurrency: Maximum processes in flight
+            timeout: Per-call timeout in seconds (optional)
+            format_json: Whether to add --format json and parse the output
+
+        Yields:
+            Result dicts from run_gh_command_async() with an added 'index'
+        """
+        semaphore = asyncio.Semaphore(max(1, max_concurrency))
+
+        async def run_one(index: int, command: Union[str, List[str]]) -> Dict[str, Any]:
+            async with semaphore:
+                result = await GHProjectHelpers.run_gh_command_async(command, format_json, timeout)
+            result['index'] = index
+            return result
+
+        tasks = [asyncio.ensure_future(run_one(i, command)) for i, command in enumerate(commands)]
+        try:
+            for next_done in asyncio.as_completed(tasks):
+                yield await next_done
+        finally:
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+
+    @staticmethod
+    async def run_gh_commands(commands: Iterable[Union[str, List[str]]], max_concurrency: int = 8,
+                              timeout: Optional[float] = None, format_json: bool = True,
+                              ordered: bool = True) -> List[Dict[str, Any]]:
+        """
+        Run gh commands concurrently and collect their results.
+
+        Args:
+            commands: gh commands (without 'gh' prefix), strings or argv lists
+            max_concurrency: Maximum processes in flight
+            timeout: Per-call timeout in seconds (optional)
+            format_json: Whether to add --format json and parse the output
+            ordered: Return results in command order (else completion order)
+
+        Returns:
+            List of result dicts from run_gh_command_async()
+        """
+        results = [result async for result in
+                   GHProjectHelpers.iter_gh_commands(commands, max_concurrency, timeout, format_json)]
+        if ordered:
+            results.sort(key=lambda result: result['index'])
+        return results
+
+    @staticmethod
+    def run_gh_commands_sync(commands: Iterable[Union[str, List[str]]], max_concurrency: int = 8,
+                             timeout: Optional[float] = None, format_json: bool = True,
+                             ordered: bool = True) -> List[Dict[str, Any]]:
+        """
+        Blocking wrapper around run_gh_commands() for synchronous callers.
+
+        Example:
+            results = GHProjectHelpers.run_gh_commands_sync(
+                [f"project view {n} --owner my-org" for n in (1, 2, 3)], max_concurrency=4)
+        """
+        return asyncio.run(GHProjectHelpers.run_gh_commands(
+            list(commands), max_concurrency, timeout, format_json, ordered))
+
+    @staticmethod
+    def run_gh_graphql(query: str, variables: Optional[Dict[str, Any]] = None,
+                       allow_errors: bool = False) -> Dict:
+        """
+        Run a GraphQL query through gh api graphql.
+
+        Arguments are passed as an argv list, so the query text needs no
+        shell quoting. Strings are sent with -f, everything else with -F.
+
+        Args:
+            query: GraphQL query text
+            variables: Query variables (None values are omitted)
+            allow_errors: Return the full response, including 'errors', instead
+                          of raising when some fields fail (partial results)
+
+        Returns:
+            The 'data' member of the response, or the whole response if allow_errors
+
+        Raises:
+            GHProjectError: If gh fails or the response carries errors
+        """
+        argv = ['gh', 'api', 'graphql', '-f', f'query={query}']
+        for name, value in (variables or {}).items():
+            if value is None:
+                continue
+            if isinstance(value, str):
+                argv += ['-f', f'{name}={value}']
+            else:
+                argv += ['-F', f'{name}={json.dumps(value)}']
+
+        try:
+            result = GHRequestScheduler.default().run(argv)
+            if result.returncode != 0:
+                raise subprocess.CalledProcessError(result.returncode, argv, result.stdout, result.stderr)
+            response = GHCallTracer.parse_json(result)
+        except FileNotFoundError:
+            raise GHProjectError("gh CLI not found on PATH")
+        except subprocess.CalledProcessError as e:
+            # gh exits non-zero on GraphQL errors but still prints the body
+            response = None
+            if allow_errors and e.stdout:
+                try:
+                    response = json.loads(e.stdout)
+                except json.JSONDecodeError:
+                    pass
+            if not isinstance(response, dict):
+                error_msg = e.stderr if e.stderr else str(e)
+                raise GHProjectError(f"Command failed: gh api graphql\nError: {error_msg}")
         except json.JSONDecodeError as e:
             raise GHProjectError(f"Failed to parse JSON output: {e}")
 
-    @staticmethod
-    def parse_project_list(json_data: Union[str, List[Dict]]) -> List[Dict]:
+        GHRequestScheduler.default().observe_graphql(response)
+
+        if allow_errors:
+            return response
+
+        if response.get('errors'):
+            messages = '; '.join(err.get('message', str(err)) for err in response['errors'])
+            raise GHProjectError(f"GraphQL query failed: {messages}")
+
+        return response.get('data') or {}
+
+    @staticmethod
+    def build_items_query(owner_type: str, fields: Optional[List[str]] = None,
+                          content: Optional[List[str]] = None) -> str:
+        """
+        Build a paginated ProjectV2.items query with field projection.
+
+        Args:
+            owner_type: 'organization', 'user' or 'viewer'
+            fields: Only fetch these field values (None fetches all of them)
+            content: Content attributes to fetch (default CONTENT_FIELDS)
+
+        Returns:
+            GraphQL query text taking $number, $first, $after (and $login)
+        """
+        item_selection = GHProjectHelpers.build_item_selection(fields, content)
+
+        if owner_type == 'viewer':
+            head, owner = 'query($number: Int!, $first: Int!, $after: String)', 'viewer'
+        elif owner_type in ('organization', 'user'):
+            head = 'query($login: String!, $number: Int!, $first: Int!, $after: String)'
+            owner = f'{owner_type}(login: $login)'
+        else:
+            raise GHProjectError(f"Unknown owner type: {owner_type}")
+
+        return f"""{head} {{
+  rateLimit {{ remaining resetAt }}
+  {owner} {{
+    projectV2(number: $number) {{
+      items(first: $first, after: $after) {{
+        totalCount
+        pageInfo {{ hasNextPage endCursor }}
+        nodes {{ {item_selection} }}
+      }}
+    }}
+  }}
+}}"""
+
+    @staticmethod
+    def build_item_selection(fields: Optional[List[str]] = None,
+                             content: Optional[List[str]] = None) -> str:
+        """
+        Build the GraphQL selection for one ProjectV2Item.
+
+        Passing fields=[] and content=[] selects only the id, updatedAt and
+        content type, which is what change detection needs.
+
+        Args:
+            fields: Only fetch these field values (None fetches all of them)
+            content: Content attributes to fetch (default CONTENT_FIELDS)
+
+        Returns:
+            Selection set text (without braces)
+        """
+        if content is None:
+            content = list(GHProjectHelpers.CONTENT_FIELDS)
+        unknown = [name for name in content if name not in GHProjectHelpers.CONTENT_FIELDS]
+        if unknown:
+            raise GHProjectError(f"Unknown content fields: {', '.join(unknown)}")
+
+        if fields is None:
+            field_selection = f"fieldValues(first: 50) {{ nodes {{ {GHProjectHelpers.FIELD_VALUE_FRAGMENT} }} }}"
+        else:
+            field_selection = ' '.join(
+                f"f{i}: fieldValueByName(name: {json.dumps(name)}) {{ {GHProjectHelpers.FIELD_VALUE_FRAGMENT} }}"
+                for i, name in enumerate(fields)
+            )
+
+        issue_attrs = ' '.join(content)
+        draft_attrs = ' '.join(name for name in content if name in ('title', 'updatedAt'))
+        content_selection = '__typename'
+        if issue_attrs:
+            content_selection += f" ... on Issue {{ {issue_attrs} }} ... on PullRequest {{ {issue_attrs} }}"
+        if draft_attrs:
+            content_selection += f" ... on DraftIssue {{ {draft_attrs} }}"
+
+        return f"id updatedAt content {{ {content_selection} }} {field_selection}"
+
+    @staticmethod
+    def fetch_items_by_id(ids: List[str], fields: Optional[List[str]] = None,
+                          content: Optional[List[str]] = None, batch_size: int = 100) -> Iterator[Dict]:
+        """
+        Fetch specific project items by node id, batch_size ids per request.
+
+        Args:
+            ids: ProjectV2Item node ids
+            fields: Only fetch these field values (None fetches all of them)
+            content: Content attributes to fetch (default CONTENT_FIELDS)
+            batch_size: Ids per nodes() request (max 100)
+
+        Yields:
+            Normalized items; ids that no longer resolve are skipped
+        """
+        selection = GHProjectHelpers.build_item_selection(fields, content)
+        batch_size = min(batch_size, GHProjectHelpers.GRAPHQL_PAGE_SIZE)
+
+        for start in range(0, len(ids), batch_size):
+            batch = ids[start:start + batch_size]
+            query = (f"query {{ rateLimit {{ remaining resetAt }} "
+                     f"nodes(ids: {json.dumps(batch)}) {{ ... on ProjectV2Item {{ {selection} }} }} }}")
+            response = GHProjectHelpers.run_gh_graphql(query, allow_errors=True)
+            if response.get('errors') and not response.get('data'):
+                messages = '; '.join(err.get('message', str(err)) for err in response['errors'])
+                raise GHProjectError(f"GraphQL query failed: {messages}")
+
+            for node in (response.get('data') or {}).get('nodes') or []:
+                if node and node.get('id'):
+                    yield GHProjectHelpers.normalize_graphql_item(node)
+
+    @staticmethod
+    def normalize_graphql_item(node: Dict) -> Dict:
+        """
+        Convert a GraphQL ProjectV2Item node to the item shape used by the helpers.
+
+        Args:
+            node: Item node from build_items_query() results
+
+        Returns:
+            Dict with 'id', 'content', 'fieldValues' and the item's 'updatedAt'
+        """
+        content = dict(node.get('content') or {})
+        if '__typename' in content:
+            content['type'] = content.pop('__typename')
+
+        if 'fieldValues' in node:
+            raw_values = (node['fieldValues'] or {}).get('nodes') or []
+        else:
+            raw_values = [value for key, value in node.items() if key.startswith('f') and key[1:].isdigit()]
+
+        # Empty nodes are values of types the fragment does not select
+        field_values = [value for value in raw_values if value and value.get('field')]
+
+        item = {'id': node.get('id'), 'content': content, 'fieldValues': field_values}
+        if node.get('updatedAt'):
+            item['updatedAt'] = node['updatedAt']
+        return item
+
+    @staticmethod
+    def iter_project_item_pages(owner: str, number: int, fields: Optional[List[str]] = None,
+                                content: Optional[List[str]] = None,
+                                page_size: Optional[int] = None) -> Iterator[Dict]:
+        """
+        Page through a project's items with cursor-based GraphQL queries.
+
+        The owner may be '@me', an organization login or a user login;
+        organizations are tried first.
+
+        Args:
+            owner: Project owner
+            number: Project number
+            fields: Only fetch these field values (None fetches all of them)
+            content: Content attributes to fetch (default CONTENT_FIELDS)
+            page_size: Items per request (max GRAPHQL_PAGE_SIZE)
+
+        Yields:
+            Dicts with 'items' (normalized), 'totalCount' and 'endCursor' per page
+
+        Raises:
+            GHProjectError: If the project cannot be found or a query fails
+        """
+        page_size = min(page_size or GHProjectHelpers.GRAPHQL_PAGE_SIZE, GHProjectHelpers.GRAPHQL_PAGE_SIZE)
+        owner_types = ['viewer'] if owner == '@me' else ['organization', 'user']
+        variables = {'number': number, 'first': page_size, 'after': None}
+        if owner != '@me':
+            variables['login'] = owner
+
+        query = None
+        cursor = None
+
+        while True:
+            variables['after'] = cursor
+
+            if query is None:
+                # Resolve the owner type on the first page
+                for owner_type in owner_types:
+                    candidate = GHProjectHelpers.build_items_query(owner_type, fields, content)
+                    try:
+                        data = GHProjectHelpers.run_gh_graphql(candidate, variables)
+                    except GHProjectError:
+                        if owner_type == owner_types[-1]:
+                            raise
+                        continue
+                    project = (data.get(owner_type) or {}).get('projectV2')
+                    if project:
+                        query = candidate
+                        break
+                else:
+                    raise GHProjectError(f"Project {number} not found for owner {owner}")
+            else:
+                data = GHProjectHelpers.run_gh_graphql(query, variables)
+                project = (data.get(owner_type) or {}).get('projectV2') or {}
+
+            items = project.get('items') or {}
+            page_info = items.get('pageInfo') or {}
+            cursor = page_info.get('endCursor')
+
+            yield {
+                'items': [GHProjectHelpers.normalize_graphql_item(node) for node in items.get('nodes') or []],
+                'totalCount': items.get('totalCount'),
+                'endCursor': cursor,
+            }
+
+            if not page_info.get('hasNextPage') or not cursor:
+                return
+
+    @staticmethod
+    def fetch_project_items(owner: str, number: int, output_path: Union[str, Path],
+                            fields: Optional[List[str]] = None, content: Optional[List[str]] = None,
+                            page_size: Optional[int] = None, limit: Optional[int] = None) -> Dict:
+        """
+        Fetch all items of a project to a JSON file, page by page.
+
+        Each page is written as soon as it arrives, so memory use does not
+        grow with the project size. The file has the same {'items': [...]}
+        shape as gh project item-list and is readable by iter_items(). It
+        is written to a temporary name and moved into place when complete.
+
+        Args:
+            owner: Project owner ('@me', organization or user login)
+            number: Project number
+            output_path: File to write
+            fields: Only fetch these field values (None fetches all of them)
+            content: Content attributes to fetch (default CONTENT_FIELDS)
+            page_size: Items per request (max GRAPHQL_PAGE_SIZE)
+            limit: Stop after this many items (optional)
+
+        Returns:
+            Dict with 'output', 'items', 'pages' and 'totalCount'
+        """
+        output_path = Path(output_path)
+        tmp_path = output_path.with_name(output_path.name + '.part')
+        written = 0
+        pages = 0
+        total = None
+
+        try:
+            with open(tmp_path, 'w', encoding='utf-8') as out:
+                out.write('{"items": [')
+                for page in GHProjectHelpers.iter_project_item_pages(owner, number, fields, content, page_size):
+                    pages += 1
+                    total = page['totalCount']
+                    for item in page['items']:
+                        if limit is not None and written >= limit:
+                            break
+                        out.write(',\n' if written else '\n')
+                        out.write(json.dumps(item))
+                        written += 1
+                    if limit is not None and written >= limit:
+                        break
+                out.write(f'\n], "totalCount": {json.dumps(total)}}}\n')
+            os.replace(tmp_path, output_path)
+        finally:
+            if tmp_path.exists():
+                tmp_path.unlink()
+
+        return {'output': str(output_path), 'items': written, 'pages': pages, 'totalCount': total}
+
+    @staticmethod
+    def iter_items(path: Union[str, Path], chunk_size: Optional[int] = None,
+                   use_cache: bool = True) -> Iterator[Dict]:
+        """
+        Stream project items from a JSON export one at a time.
+
+        Accepts either a top-level array of items or an object with an
+        'items' array (the shape of gh project item-list --format json).
+        Only the item currently being decoded is held in memory, so huge
+        exports are processed in constant space.
+
+        If the file has a current binary cache (see ItemsBinaryCache and
+        the 'cache-items' command), items are streamed from it instead;
+        otherwise reading a large file to the end writes one.
+
+        Args:
+            path: Path to the JSON file
+            chunk_size: Characters to read per refill (default STREAM_CHUNK_SIZE)
+            use_cache: Read from a current binary cache when there is one, and
+                       write one when reading a large file to the end
+
+        Yields:
+            Item dicts in file order
+
+        Raises:
+            GHProjectError: If the file is not a JSON array or object
+        """
+        if use_cache:
+            cached = ItemsBinaryCache.iter_cached(path)
+            if cached is not None:
+                yield from cached
+                return
+            if ItemsBinaryCache.should_build(path):
+                yield from ItemsBinaryCache.write_through(
+                    path, GHProjectHelpers.iter_items(path, chunk_size, use_cache=False))
+                return
+
+        decoder = json.JSONDecoder()
+        chunk_size = chunk_size or GHProjectHelpers.STREAM_CHUNK_SIZE
+
+        with open(path, encoding='utf-8') as f:
+            buf = ''
+            pos = 0
+            eof = False
+
+            def fill(need_more: bool = False) -> None:
+                # Drop consumed input and append the next chunk
+                nonlocal buf, pos, eof
+                if eof:
+                    if need_more:
+                        raise GHProjectError(f"Unexpected end of JSON in {path}")
+                    return
+                chunk = f.read(chunk_size if not need_more else max(chunk_size, len(buf) - pos))
+                if not chunk:
+                    eof = True
+                buf = buf[pos:] + chunk
+                pos = 0
+
+            def skip_ws() -> str:
+                # Advance past whitespace and return the next character ('' at EOF)
+                nonlocal pos
+                while True:
+                    while pos < len(buf) and buf[pos] in ' \t\r\n':
+                        pos += 1
+                    if pos < len(buf) or eof:
+                        return buf[pos] if pos < len(buf) else ''
+                    fill()
+
+            def expect(chars: str) -> str:
+                nonlocal pos
+                ch = skip_ws()
+                if ch not in chars or not ch:
+                    raise GHProjectError(f"Expected one of {chars!r} in {path}, got {ch!r}")
+                pos += 1
+                return ch
+
+            def decode() -> Any:
+                # Decode one complete value, reading more input until it fits.
+                # A number cut off at the buffer edge still decodes ('12' of
+                # '12.5'), so a value only counts once the character after it
+                # is known not to continue it.
+                nonlocal pos
+                skip_ws()
+                while True:
+                    try:
+                        value, end = decoder.raw_decode(buf, pos)
+                        if eof or (end < len(buf) and buf[end] not in '0123456789.eE+-'):
+                            pos = end
+                            return value
+                    except json.JSONDecodeError as e:
+                        if eof:
+                            raise GHProjectError(f"Failed to parse JSON in {path}: {e}")
+                    fill(need_more=True)
+
+            def iter_array() -> Iterator[Any]:
+                nonlocal pos
+                expect('[')
+                if skip_ws() == ']':
+                    pos += 1
+                    return
+                while True:
+                    yield decode()
+                    if pos > chunk_size:
+                        fill()
+                    if expect(',]') == ']':
+                        return
+
+            fill()
+            first = skip_ws()
+
+            if first == '[':
+                yield from iter_array()
+            elif first == '{':
+                expect('{')
+                if skip_ws() == '}':
+                    return
+                while True:
+                    key = decode()
+                    expect(':')
+                    if key == 'items' and skip_ws() == '[':
+                        yield from iter_array()
+                    else:
+                        decode()
+                    if expect(',}') == '}':
+                        return
+            else:
+                raise GHProjectError(f"Expected a JSON array or object in {path}")
+
+    @staticmethod
+    def load_items(path: Union[str, Path]) -> List[Dict]:
+        """
+        Load all project items from a JSON export into a list.
+
+        Args:
+            path: Path to the JSON file (array or {'items': [...]} object)
+
+        Returns:
+            List of item dicts
+        """
+        return list(GHProjectHelpers.iter_items(path))
+
+    @staticmethod
+    def write_json_array(values: Iterable[Any], out: TextIO = None) -> int:
+        """
+        Write values as an indented JSON array as they are produced.
+
+        Output is identical to print(json.dumps(list(values), indent=2)),
+        but nothing is buffered beyond the current value.
+
+        Args:
+            values: Iterable of JSON-serializable values
+            out: Stream to write to (default sys.stdout)
+
+        Returns:
+            Number of values written
+        """
+        out = out or sys.stdout
+        count = 0
+
+        for value in values:
+            out.write('[\n  ' if count == 0 else ',\n  ')
+            out.write(json.dumps(value, indent=2).replace('\n', '\n  '))
+            count += 1
+
+        out.write('[]\n' if count == 0 else '\n]\n')
+        return count
+
+    @staticmethod
+    def render_rows(rows: Iterable[Dict[str, Any]], fmt: str = 'json',
+                    columns: Optional[List[str]] = None, limit: Optional[int] = None,
+                    out: TextIO = None) -> int:
+        """
+        Write display rows as they are produced, projected to the given columns.
+
+        Formats:
+            json   indented JSON array (same as write_json_array)
+            jsonl  one JSON object per line
+            csv    header row, then RFC 4180 rows
+            tsv    header row, then tab-separated rows (tabs/newlines in values become spaces)
+            table  aligned plain-text columns; widths come from the first
+                   TABLE_SAMPLE_ROWS rows and longer values are truncated
+
+        Args:
+            rows: Iterable of dicts (e.g. format_item_for_display() results)
+            fmt: Output format
+            columns: Keys to keep, in order (default: all keys of each row)
+            limit: Stop after this many rows
+            out: Stream to write to (default sys.stdout)
+
+        Returns:
+            Number of rows written
+
+        Raises:
+            GHProjectError: For an unknown format or column
+        """
+        if fmt not in GHProjectHelpers.RENDER_FORMATS:
+            raise GHProjectError(f"Unknown format: {fmt} (expected one of {', '.join(GHProjectHelpers.RENDER_FORMATS)})")
+        out = out or sys.stdout
+        rows = iter(rows if limit is None else islice(rows, limit))
+
+        def project(row: Dict[str, Any]) -> Dict[str, Any]:
+            try:
+                return {column: row[column] for column in columns}
+            except KeyError as e:
+                raise GHProjectError(f"Unknown column {e.args[0]!r} (available: {', '.join(row)})")
+
+        if columns:
+            rows = map(project, rows)
+
+        if fmt == 'json':
+            return GHProjectHelpers.write_json_array(rows, out)
+
+        if fmt == 'jsonl':
+            count = 0
+            for row in rows:
+                out.write(json.dumps(row) + '\n')
+                count += 1
+            return count
+
+        first = next(rows, None)
+        if first is None:
+            if columns and fmt != 'table':
+                out.write(('\t' if fmt == 'tsv' else ',').join(columns) + '\n')
+            return 0
+        header = list(first)
+
+        def cell(value: Any) -> str:
+            return '' if value is None else str(value)
+
+        if fmt == 'csv':
+            writer = csv.writer(out, lineterminator='\n')
+            writer.writerow(header)
+            writer.writerow([cell(first[key]) for key in header])
+            count = 1
+            for row in rows:
+                writer.writerow([cell(row.get(key)) for key in header])
+                count += 1
+            return count
+
+        if fmt == 'tsv':
+            def tsv_line(values: Iterable[Any]) -> str:
+                return '\t'.join(' '.join(cell(value).split()) if isinstance(value, str) else cell(value)
+                                 for value in values) + '\n'
+
+            out.write(tsv_line(header))
+            out.write(tsv_line(first[key] for key in header))
+            count = 1
+            for row in rows:
+                out.write(tsv_line(row.get(key) for key in header))
+                count += 1
+            return count
+
+        # table: size columns from a sample, then stream
+        sample = [first] + list(islice(rows, GHProjectHelpers.TABLE_SAMPLE_ROWS - 1))
+        widths = [min(GHProjectHelpers.TABLE_MAX_WIDTH,
+                      max(len(key), *(len(cell(row.get(key))) for row in sample))) for key in header]
+
+        def table_line(values: Iterable[Any]) -> str:
+            cells = []
+            for value, width in zip(values, widths):
+                text = ' '.join(cell(value).split())
+                if len(text) > width:
+                    text = text[:width - 1] + '…'
+                cells.append(text.ljust(width))
+            return '  '.join(cells).rstrip() + '\n'
+
+        out.write(table_line(header))
+        out.write('  '.join('-' * width for width in widths) + '\n')
+        count = 0
+        for row in sample:
+            out.write(table_line(row.get(key) for key in header))
+            count += 1
+        for row in rows:
+            out.write(table_line(row.get(key) for key in header))
+            count += 1
+        return count
+
+    @staticmethod
+    def parse_project_list(json_data: Union[str, List[Dict]]) -> List[Dict]:
+        """
+        Parse project list JSON and return formatted project info.
+
+        Args:
+            json_data: Raw JSON string or parsed list
+
+        Returns:
+            List of dicts with project info
+        """
+        if isinstance(json_data, str):
+            data = json.loads(json_data)
+        else:
+            data = json_data
+
+        projects = []
+        for project in data:
+            projects.append({
+                'number': project.get('number'),
+                'id': project.get('id'),
+                'title': project.get('title'),
+                'url': project.get('url'),
+                'created': project.get('createdAt'),
+                'updated': project.get('updatedAt')
+            })
+
+        return projects
+
+    @staticmethod
+    def get_item_field_values(item: Dict) -> Dict[str, Any]:
+        """
+        Map field names to values for a single project item.
+
+        Field values fetched through GraphQL carry the field name under
+        'field.name'; older exports only have 'name'. When an item has
+        several values for the same field, the first one wins.
+
+        Args:
+            item: Project item dict
+
+        Returns:
+            Dict mapping field names to values
+
+        Example:
+            {'Status': 'In Progress', 'Priority': 'P1', 'Estimate': 3}
+        """
+        values = {}
+
+        for fv in item.get('fieldValues', []):
+            field = fv.get('field')
+            field_name = field.get('name') if isinstance(field, dict) else None
+            if field_name is None:
+                field_name = fv.get('name')
+
+            if field_name is None or field_name in values:
+                continue
+
+            values[field_name] = (fv.get('name') or fv.get('text') or fv.get('number')
+                                  or fv.get('date') or fv.get('title'))
+
+        return values
+
+    @staticmethod
+    def filter_items(items: List[Dict], filters: Dict[str, Any],
+                     index: Optional['ProjectItemIndex'] = None) -> List[Dict]:
+        """
+        Filter project items based on field values.
+
+        Args:
+            items: List of project items
+            filters: Dict of field_name: expected_value pairs
+            index: Prebuilt ProjectItemIndex over items (optional)
+
+        Returns:
+            Filtered list of items
+
+        Examples:
+            filter_items(items, {'Status': 'In Progress', 'Priority': 'P1'})
+            filter_items(items, {'Status': ['Backlog', 'Todo']})  # Multiple values
+        """
+        if not filters:
+            return list(items)
+
+        if index is None:
+            index = ProjectItemIndex(items)
+
+        return index.filter(filters)
+
+    @staticmethod
+    def matches_filters(values: Dict[str, Any], filters: Dict[str, Any]) -> bool:
+        """
+        Check an item's field values against filters.
+
+        Args:
+            values: Field values from get_item_field_values()
+            filters: Dict of field_name: expected_value pairs (values may be lists)
+
+        Returns:
+            True if every filter matches
+        """
+        for field_name, expected_value in filters.items():
+            if field_name not in values:
+                return False
+            actual_value = values[field_name]
+            if isinstance(expected_value, list):
+                if actual_value not in expected_value:
+                    return False
+            elif actual_value != expected_value:
+                return False
+        return True
+
+    @staticmethod
+    def iter_filtered_items(items: Iterable[Dict], filters: Dict[str, Any]) -> Iterator[Dict]:
+        """
+        Lazily filter a stream of items without building an index.
+
+        Args:
+            items: Iterable of project items (e.g. from iter_items())
+            filters: Dict of field_name: expected_value pairs
+
+        Yields:
+            Matching items in input order
+        """
+        for item in items:
+            if GHProjectHelpers.matches_filters(GHProjectHelpers.get_item_field_values(item), filters):
+                yield item
+
+    @staticmethod
+    def filter_items_missing_field(items: List[Dict], field_name: str,
+                                   index: Optional['ProjectItemIndex'] = None) -> List[Dict]:
+        """
+        Filter items that are missing a specific field value.
+
+        Args:
+            items: List of project items
+            field_name: Name of the field to check
+            index: Prebuilt ProjectItemIndex over items (optional)
+
+        Returns:
+            Items without the specified field set
+        """
+        if index is not None:
+            return [index.items[pos] for pos in index.missing(field_name)]
+
+        return [item for item in items
+                if field_name not in GHProjectHelpers.get_item_field_values(item)]
+
+    @staticmethod
+    def extract_field_info(fields: List[Dict], field_name: str) -> Optional[Dict]:
+        """
+        Extract field ID and metadata for a specific field.
+
+        Args:
+            fields: List of project fields from gh project field-list
+            field_name: Name of the field to find
+
+        Returns:
+            Dict with field info or None if not found
+
+        Example return:
+            {
+                'id': 'PVTF_...',
+                'name': 'Priority',
+                'dataType': 'SINGLE_SELECT',
+                'options': [
+                    {'id': 'abc123', 'name': 'P0'},
+                    {'id': 'def456', 'name': 'P1'}
+                ]
+            }
+        """
+        for field in fields:
+            if field.get('name') == field_name:
+                return {
+                    'id': field.get('id'),
+                    'name': field.get('name'),
+                    'dataType': field.get('dataType'),
+                    'options': field.get('options', [])
+                }
+        return None
+
+    @staticmethod
+    def get_option_id(field_info: Dict, option_name: str) -> Optional[str]:
+        """
+        Get the option ID for a single-select field value.
+
+        Args:
+            field_info: Field info dict from extract_field_info()
+            option_name: Name of the option (e.g., 'P1', 'In Progress')
+
+        Returns:
+            Option ID string or None if not found
+        """
+        options = field_info.get('options', [])
+        for option in options:
+            if option.get('name') == option_name:
+                return option.get('id')
+        return None
+
+    @staticmethod
+    def build_field_map(fields: List[Dict]) -> Dict[str, Dict]:
+        """
+        Index a project's fields by name, with options indexed by name.
+
+        Replaces repeated extract_field_info()/get_option_id() scans when
+        many lookups are made against the same field list.
+
+        Args:
+            fields: List of project fields from gh project field-list
+
+        Returns:
+            Dict mapping field names to {'id', 'dataType', 'options': {name: id}}
+        """
+        field_map = {}
+        for field in fields:
+            name = field.get('name')
+            if name is None or name in field_map:
+                continue
+            field_map[name] = {
+                'id': field.get('id'),
+                'dataType': field.get('dataType') or field.get('type'),
+                'options': {opt.get('name'): opt.get('id') for opt in field.get('options', [])}
+            }
+        return field_map
+
+    @staticmethod
+    def build_field_value_input(field_info: Dict, value: Any,
+                                value_type: Optional[str] = None) -> Optional[str]:
+        """
+        Build the GraphQL 'value' input for updateProjectV2ItemFieldValue.
+
+        Single-select fields take an option name, resolved with get_option_id().
+        gh field-list does not distinguish text, number and date fields, so
+        other fields are typed by value_type ('text', 'number', 'date',
+        'iteration') or else by the JSON type of the value.
+
+        Args:
+            field_info: Field info dict from extract_field_info()
+            value: Value to set
+            value_type: Explicit value type (optional)
+
+        Returns:
+            GraphQL input object literal, or None if the option is unknown
+        """
+        data_type = (field_info.get('dataType') or '').upper()
+        if field_info.get('options') or data_type in ('SINGLE_SELECT', 'PROJECTV2SINGLESELECTFIELD'):
+            option_id = GHProjectHelpers.get_option_id(field_info, str(value))
+            return None if option_id is None else f"{{singleSelectOptionId: {json.dumps(option_id)}}}"
+
+        if value_type is None:
+            if data_type in ('NUMBER', 'DATE', 'TEXT'):
+                value_type = data_type.lower()
+            elif data_type in ('ITERATION', 'PROJECTV2ITERATIONFIELD'):
+                value_type = 'iteration'
+            elif isinstance(value, (int, float)) and not isinstance(value, bool):
+                value_type = 'number'
+            else:
+                value_type = 'text'
+
+        if value_type == 'number':
+            return f"{{number: {json.dumps(float(value))}}}"
+        if value_type == 'date':
+            return f"{{date: {json.dumps(str(value))}}}"
+        if value_type == 'iteration':
+            return f"{{iterationId: {json.dumps(str(value))}}}"
+        return f"{{text: {json.dumps(str(value))}}}"
+
+    @staticmethod
+    def bulk_update_fields(project_id: str, rows: Iterable[Dict], fields: Optional[List[Dict]] = None,
+                           batch_size: int = 50, dry_run: bool = False,
+                           schema: Optional[tuple] = None) -> Iterator[Dict]:
+        """
+        Update many item fields with alias-batched GraphQL mutations.
+
+        Field and option ids are resolved once per distinct name through
+        extract_field_info()/get_option_id(), from the given field list or,
+        with schema, from FieldSchemaCache. A cached schema is refreshed once
+        per field when a row names a field or option it does not know, so
+        options created since it was cached are accepted. Up to batch_size
+        updateProjectV2ItemFieldValue (or clearProjectV2ItemFieldValue for
+        null values) mutations are packed into each request under aliases,
+        and each row's outcome is read back from its alias.
+
+        Args:
+            project_id: Project node id (PVT_...)
+            rows: Dicts with 'item_id', 'field', 'value' and optional 'type'
+            fields: Project fields from gh project field-list
+            batch_size: Mutations per request
+            dry_run: Resolve and report rows without sending mutations
+            schema: (owner, project number) to resolve ids through
+                    FieldSchemaCache instead of fields
+
+        Yields:
+            Per-row result dicts with 'ok' and, on failure, 'error'
+        """
+        if fields is None and schema is None:
+            raise GHProjectError("bulk_update_fields needs fields or schema")
+        schema_cache = FieldSchemaCache.default() if schema is not None else None
+        refreshed = set()
+
+        def resolve_field(field_name: str, refresh: bool = False) -> Optional[Dict]:
+            if schema_cache is None:
+                return GHProjectHelpers.extract_field_info(fields, field_name)
+            if refresh:
+                field = schema_cache.fields(*schema, refresh=True).get(field_name)
+            else:
+                field = schema_cache.field(*schema, field_name)
+            if field is None:
+                return None
+            return {'id': field['id'], 'name': field_name, 'dataType': field['dataType'],
+                    'options': [{'id': option_id, 'name': name} for name, option_id in field['options'].items()]}
+
+        field_infos: Dict[str, Optional[Dict]] = {}
+        inputs: Dict[tuple, Optional[str]] = {}
+        batch: List[tuple] = []
+        line = 0
+        requests = 0
+
+        def flush() -> Iterator[Dict]:
+            nonlocal requests
+            if not batch:
+                return
+            mutation = 'mutation {\n' + '\n'.join(
+                f"  u{i}: {op}(input: {{projectId: {json.dumps(project_id)}, "
+                f"itemId: {json.dumps(result['item_id'])}, fieldId: {json.dumps(field_id)}"
+                f"{', value: ' + value_input if value_input else ''}}}) {{ projectV2Item {{ id }} }}"
+                for i, (result, op, field_id, value_input) in enumerate(batch)
+            ) + '\n}'
+
+            if dry_run:
+                for result, *_ in batch:
+                    result['ok'] = True
+                    result['dry_run'] = True
+                    yield result
+                batch.clear()
+                return
+
+            requests += 1
+            try:
+                response = GHProjectHelpers.run_gh_graphql(mutation, allow_errors=True)
+                request_error = None
+            except GHProjectError as e:
+                response, request_error = {}, str(e)
+
+            errors = {}
+            for err in response.get('errors') or []:
+                alias = (err.get('path') or [None])[0]
+                errors.setdefault(alias, err.get('message', str(err)))
+            data = response.get('data') or {}
+
+            for i, (result, *_) in enumerate(batch):
+                alias = f'u{i}'
+                result['request'] = requests
+                if request_error or not data.get(alias):
+                    result['ok'] = False
+                    result['error'] = request_error or errors.get(alias) or errors.get(None) or 'No result returned'
+                else:
+                    result['ok'] = True
+                yield result
+            batch.clear()
+
+        for row in rows:
+            line += 1
+            result = {'line': line, 'item_id': row.get('item_id'), 'field': row.get('field'),
+                      'value': row.get('value')}
+
+            field_name = row.get('field')
+            if not result['item_id'] or not field_name:
+                result.update(ok=False, error="Row needs 'item_id' and 'field'")
+                yield result
+                continue
+
+            if field_name not in field_infos:
+                field_infos[field_name] = resolve_field(field_name)
+            field_info = field_infos[field_name]
+            if field_info is None:
+                result.update(ok=False, error=f"Unknown field: {field_name}")
+                yield result
+                continue
+
+            value = row.get('value')
+            if value is None:
+                batch.append((result, 'clearProjectV2ItemFieldValue', field_info['id'], None))
+            else:
+                key = (field_name, json.dumps(value), row.get('type'))
+                if key not in inputs:
+                    try:
+                        inputs[key] = GHProjectHelpers.build_field_value_input(field_info, value, row.get('type'))
+                    except (TypeError, ValueError):
+                        result.update(ok=False, error=f"Invalid {row.get('type') or 'number'} value: {value}")
+                        yield result
+                        continue
+                if inputs[key] is None and schema_cache is not None and field_name not in refreshed:
+                    # The option may have been created after the schema was cached
+                    refreshed.add(field_name)
+                    field_info = field_infos[field_name] = resolve_field(field_name, refresh=True) or field_info
+                    for stale_key in [k for k in inputs if k[0] == field_name]:
+                        del inputs[stale_key]
+                    inputs[key] = GHProjectHelpers.build_field_value_input(field_info, value, row.get('type'))
+                if inputs[key] is None:
+                    result.update(ok=False, error=f"Unknown option for {field_name}: {value}")
+                    yield result
+                    continue
+                batch.append((result, 'updateProjectV2ItemFieldValue', field_info['id'], inputs[key]))
+
+            if len(batch) >= batch_size:
+                yield from flush()
+
+        yield from flush()
+
+        if not dry_run:
+            GHResponseCache.default().invalidate(GHResponseCache.INVALIDATES['project item-edit'])
+
+    @staticmethod
+    def display_value(value: Any) -> str:
+        """
+        Render a field value as the string key used for grouping.
+
+        Args:
+            value: Field value from get_item_field_values()
+
+        Returns:
+            The value as a string ('' when the field has no value)
+        """
+        if value is None:
+            return ''
+        return value if isinstance(value, str) else str(value)
+
+    @staticmethod
+    def group_items_by_field(items: List[Dict], field_name: str,
+                             index: Optional['ProjectItemIndex'] = None) -> Dict[str, List[Dict]]:
+        """
+        Group items by a field value (e.g., Status, Priority).
+
+        Args:
+            items: List of project items, or a ProjectItemStore
+            field_name: Name of field to group by
+            index: Prebuilt ProjectItemIndex over items (optional)
+
+        Returns:
+            Dict mapping field values to lists of items
+
+        Example:
+            {
+                'In Progress': [item1, item2],
+                'Done': [item3, item4],
+                'Backlog': [item5]
+            }
+        """
+        if isinstance(items, ProjectItemStore):
+            return items.group_items_by_field(field_name)
+
+        if index is None:
+            rows = (GHProjectHelpers.get_item_field_values(item) for item in items)
+        else:
+            items, rows = index.items, index.values
+
+        groups = {}
+
+        for item, row in zip(items, rows):
+            if field_name in row:
+                field_value = GHProjectHelpers.display_value(row[field_name])
+            else:
+                field_value = 'Unset'
+
+            if field_value not in groups:
+                groups[field_value] = []
+
+            groups[field_value].append(item)
+
+        return groups
+
+    @staticmethod
+    def count_by_field(items: List[Dict], field_name: str,
+                       index: Optional['ProjectItemIndex'] = None) -> Dict[str, int]:
+        """
+        Count items by field value.
+
+        Args:
+            items: Iterable of project items, or a ProjectItemStore
+            field_name: Name of field to count by
+            index: Prebuilt ProjectItemIndex over items (optional)
+
+        Returns:
+            Dict mapping field values to counts
+        """
+        if isinstance(items, ProjectItemStore):
+            return items.count_by_field(field_name)
+
+        if index is not None:
+            return GHProjectHelpers.group_counts(index.field_values(field_name), len(index))
+
+        counts = {}
+
+        for item in items:
+            values = GHProjectHelpers.get_item_field_values(item)
+            if field_name in values:
+                key = GHProjectHelpers.display_value(values[field_name])
+            else:
+                key = 'Unset'
+            counts[key] = counts.get(key, 0) + 1
+
+        return counts
+
+    @staticmethod
+    def group_counts(value_counts: Dict[Any, int], total: int) -> Dict[str, int]:
+        """
+        Convert raw per-value counts into count_by_field() output.
+
+        Values are rendered with display_value() and items without the
+        field are reported under 'Unset'.
+
+        Args:
+            value_counts: Dict mapping raw field values to counts
+            total: Total number of items counted
+
+        Returns:
+            Dict mapping display values to counts
+        """
+        counts = {}
+        for value, count in value_counts.items():
+            key = GHProjectHelpers.display_value(value)
+            counts[key] = counts.get(key, 0) + count
+
+        unset = total - sum(value_counts.values())
+        if unset:
+            counts['Unset'] = counts.get('Unset', 0) + unset
+
+        return counts
+
+    @staticmethod
+    def parse_timestamp(value: Optional[str]) -> Optional[datetime]:
+        """
+        Parse a GitHub ISO 8601 timestamp into an aware datetime.
+
+        Args:
+            value: Timestamp such as '2024-01-31T12:00:00Z' (naive values are taken as local time)
+
+        Returns:
+            Aware datetime, or None if value is empty or malformed
+        """
+        if not value or not isinstance(value, str):
+            return None
+        try:
+            parsed = datetime.fromisoformat(value.replace('Z', '+00:00'))
+        except ValueError:
+            return None
+        return parsed if parsed.tzinfo else parsed.astimezone()
+
+    @staticmethod
+    def age_bucket_labels(thresholds: List[int]) -> List[str]:
+        """
+        Label the age buckets delimited by ascending day thresholds.
+
+        Example:
+            age_bucket_labels([7, 14, 30]) -> ['<7d', '7-14d', '14-30d', '>=30d']
+        """
+        labels = [f'<{thresholds[0]}d']
+        labels += [f'{low}-{high}d' for low, high in zip(thresholds, thresholds[1:])]
+        labels.append(f'>={thresholds[-1]}d')
+        return labels
+
+    @staticmethod
+    def aggregate_items(items: Iterable[Dict], fields: Optional[List[str]] = None,
+                        pivot: Optional[tuple] = ('Status', 'Priority'),
+                        stale_days: Optional[List[int]] = None,
+                        stale_statuses: Optional[List[str]] = None,
+                        required_fields: Optional[List[str]] = None) -> Dict[str, Any]:
+        """
+        Compute a full status report in a single pass over the items.
+
+        Only counters are kept; no per-group item lists are built.
+
+        Args:
+            items: Iterable of project items (e.g. from iter_items())
+            fields: Fields to count by value (default Status and Priority)
+            pivot: (row_field, column_field) for a cross-tab, or None
+            stale_days: Ascending age thresholds in days (default 7, 14, 30)
+            stale_statuses: Only bucket items with these statuses by age (optional)
+            required_fields: Fields whose absence is counted (default: fields)
+
+        Returns:
+            Report dict with 'total', 'fields', 'pivot', 'types', 'stale' and 'missing'
+
+        Example:
+            {
+                'total': 120,
+                'fields': {'Status': {'Todo': 40, ...}, 'Priority': {...}},
+                'pivot': {'rows': 'Status', 'columns': 'Priority',
+                          'counts': {'Todo': {'P0': 2, 'P1': 10, ...}, ...}},
+                'types': {'Issue': 100, 'PullRequest': 15, 'DraftIssue': 5},
+                'stale': {'thresholds': [7, 14, 30],
+                          'buckets': {'<7d': 60, '7-14d': 20, '14-30d': 25, '>=30d': 10},
+                          'older_than': {'7': 55, '14': 35, '30': 10}, 'no_timestamp': 5},
+                'missing': {'Status': 3, 'Priority': 17}
+            }
+        """
+        fields = list(fields) if fields else ['Status', 'Priority']
+        required_fields = list(required_fields) if required_fields is not None else fields
+        thresholds = sorted(stale_days) if stale_days else [7, 14, 30]
+        stale_statuses = set(stale_statuses) if stale_statuses else None
+
+        labels = GHProjectHelpers.age_bucket_labels(thresholds)
+        # Bucket lower bounds in seconds, so bisect finds an age's bucket
+        bounds = [days * 86400 for days in thresholds]
+
+        field_counts = {name: {} for name in fields}
+        pivot_counts: Dict[str, Dict[str, int]] = {}
+        types: Dict[str, int] = {}
+        buckets = dict.fromkeys(labels, 0)
+        no_timestamp = 0
+        missing = dict.fromkeys(required_fields, 0)
+        total = 0
+        now = datetime.now().astimezone()
+        display = GHProjectHelpers.display_value
+
+        for item in items:
+            total += 1
+            values = GHProjectHelpers.get_item_field_values(item)
+            content = item.get('content') or {}
+
+            for name in fields:
+                key = display(values[name]) if name in values else 'Unset'
+                counts = field_counts[name]
+                counts[key] = counts.get(key, 0) + 1
+
+            for name in required_fields:
+                if name not in values:
+                    missing[name] += 1
+
+            if pivot:
+                row_field, column_field = pivot
+                row = display(values[row_field]) if row_field in values else 'Unset'
+                column = display(values[column_field]) if column_field in values else 'Unset'
+                pivot_row = pivot_counts.setdefault(row, {})
+                pivot_row[column] = pivot_row.get(column, 0) + 1
+
+            item_type = content.get('type') or 'Unknown'
+            types[item_type] = types.get(item_type, 0) + 1
+
+            if stale_statuses is not None and values.get('Status') not in stale_statuses:
+                continue
+            updated = GHProjectHelpers.parse_timestamp(content.get('updatedAt') or item.get('updatedAt'))
+            if updated is None:
+                no_timestamp += 1
+                continue
+            age = (now - updated).total_seconds()
+            buckets[labels[bisect.bisect_right(bounds, age)]] += 1
+
+        # Cumulative counts: items at least N days old
+        older_than = {}
+        running = 0
+        for days, label in zip(reversed(thresholds), reversed(labels[1:])):
+            running += buckets[label]
+            older_than[str(days)] = running
+
+        return {
+            'total': total,
+            'fields': field_counts,
+            'pivot': {'rows': pivot[0], 'columns': pivot[1], 'counts': pivot_counts} if pivot else None,
+            'types': types,
+            'stale': {
+                'thresholds': thresholds,
+                'statuses': sorted(stale_statuses) if stale_statuses is not None else None,
+                'buckets': buckets,
+                'older_than': dict(reversed(list(older_than.items()))),
+                'no_timestamp': no_timestamp,
+            },
+            'missing': missing,
+        }
+
+    @staticmethod
+    def find_stale_items(items: List[Dict], days: int = 7, status_filter: Optional[List[str]] = None,
+                         index: Optional['ProjectItemIndex'] = None,
+                         timeline: Optional['ProjectItemTimeline'] = None) -> List[Dict]:
+        """
+        Find items that haven't been updated in N days.
+
+        Args:
+            items: List of project items
+            days: Number of days to consider stale
+            status_filter: Only check items with these statuses (optional)
+            index: Prebuilt ProjectItemIndex over items (optional)
+            timeline: Prebuilt ProjectItemTimeline over items (optional); only the
+                stale items are then visited, so repeated thresholds stay cheap
+
+        Returns:
+            List of stale items with additional metadata
+        """
+        if timeline is not None and timeline.group_field == 'Status':
+            now = time.time()
+            stale = []
+            for pos in sorted(timeline.older_than(days, now)):
+                if status_filter and timeline.groups[pos] not in status_filter:
+                    continue
+                stale_item = items[pos].copy()
+                updated_at_str = stale_item['content']['updatedAt']
+                updated = GHProjectHelpers.parse_timestamp(updated_at_str)
+                stale_item['days_stale'] = int((now - updated.timestamp()) // 86400)
+                stale_item['last_updated'] = updated_at_str.split('T')[0]
+                stale.append(stale_item)
+            return stale
+
+        if status_filter and index is not None:
+            items = [index.items[pos] for pos in index.query({'Status': status_filter})]
+            status_filter = None
+
+        return list(GHProjectHelpers.iter_stale_items(items, days, status_filter))
+
+    @staticmethod
+    def iter_stale_items(items: Iterable[Dict], days: int = 7,
+                         status_filter: Optional[List[str]] = None) -> Iterator[Dict]:
+        """
+        Lazily yield items that haven't been updated in N days.
+
+        Args:
+            items: Iterable of project items (e.g. from iter_items())
+            days: Number of days to consider stale
+            status_filter: Only check items with these statuses (optional)
+
+        Yields:
+            Stale items with additional metadata, in input order
+        """
+        now = datetime.now().astimezone()
+        threshold = now - timedelta(days=days)
+
+        for item in items:
+            # Check status filter if provided
+            if status_filter:
+                item_status = GHProjectHelpers.get_item_field_values(item).get('Status')
+                if item_status not in status_filter:
+                    continue
+
+            # Check update timestamp
+            updated_at_str = (item.get('content') or {}).get('updatedAt')
+            updated_at = GHProjectHelpers.parse_timestamp(updated_at_str)
+            if updated_at is None or updated_at >= threshold:
+                continue
+
+            stale_item = item.copy()
+            stale_item['days_stale'] = (now - updated_at).days
+            stale_item['last_updated'] = updated_at_str.split('T')[0]
+            yield stale_item
+
+    @staticmethod
+    def format_item_for_display(item: Dict) -> Dict[str, str]:
+        """
+        Format an item for human-readable display.
+
+        Args:
+            item: Project item dict
+
+        Returns:
+            Dict with formatted fields
+        """
+        content = item.get('content', {})
+
+        # Extract field values
+        values = GHProjectHelpers.get_item_field_values(item)
+        status = values.get('Status')
+        priority = values.get('Priority')
+
+        return {
+            'id': item.get('id'),
+            'number': content.get('number', 'draft'),
+            'title': content.get('title', 'Untitled'),
+            'type': content.get('type', 'Unknown'),
+            'status': status or 'Unset',
+            'priority': priority or 'Unset',
+            'url': content.get('url', ''),
+            'updated': content.get('updatedAt', '').split('T')[0] if content.get('updatedAt') else ''
+        }
+
+    @staticmethod
+    def extract_owner_from_repo(repo: str) -> str:
+        """
+        Extract owner from repository string.
+
+        Args:
+            repo: Repository string (e.g., 'owner/repo', 'https://github.com/owner/repo')
+
+        Returns:
+            Owner name
+
+        Examples:
+            'owner/repo' -> 'owner'
+            'https://github.com/owner/repo' -> 'owner'
+        """
+        if '/' not in repo:
+            raise ValueError(f"Invalid repository format: {repo}")
+
+        # Handle URL format
+        if repo.startswith('http'):
+            repo = repo.split('github.com/')[-1]
+
+        # Extract owner
+        parts = repo.split('/')
+        return parts[0]
+
+    @staticmethod
+    def suggest_priority(title: str, body: str = "", labels: List[str] = None) -> tuple[str, str]:
+        """
+        Suggest a priority based on keywords in title, body, and labels.
+
+        Args:
+            title: Issue/item title
+            body: Issue/item body
+            labels: List of label names
+
+        Returns:
+            Tuple of (priority, reason)
+        """
+        priority, reason, _ = PriorityMatcher.default().score(title, body, labels)
+        return priority, reason
+
+    @staticmethod
+    def get_item_labels(item: Dict) -> List[str]:
+        """
+        Return label names of an item, from either the item or its content.
+
+        Accepts label lists of strings or of {'name': ...} dicts, and
+        GraphQL {'nodes': [...]} connections.
+        """
+        content = item.get('content') or {}
+        labels = item.get('labels') or content.get('labels') or []
+        if isinstance(labels, dict):
+            labels = labels.get('nodes') or []
+        return [label.get('name', '') if isinstance(label, dict) else str(label) for label in labels]
+
+    @staticmethod
+    def suggest_priorities(items: Iterable[Dict], workers: int = 1, chunk_size: int = 2000,
+                           only_missing: bool = False) -> Iterator[Dict]:
+        """
+        Suggest priorities for many items with one precompiled matcher.
+
+        Large inputs are scored in chunks across a process pool; results
+        are yielded in input order.
+
+        Args:
+            items: Iterable of project items
+            workers: Worker processes (1 scores in this process)
+            chunk_size: Items per unit of work
+            only_missing: Skip items that already have a Priority value
+
+        Yields:
+            Dicts with 'id', 'priority', 'reason', 'matched' and 'current'
+        """
+        def chunks() -> Iterator[List[tuple]]:
+            chunk = []
+            for item in items:
+                current = GHProjectHelpers.get_item_field_values(item).get('Priority')
+                if only_missing and current is not None:
+                    continue
+                content = item.get('content') or {}
+                chunk.append((item.get('id'), current, content.get('title') or '', content.get('body') or '',
+                              GHProjectHelpers.get_item_labels(item)))
+                if len(chunk) >= chunk_size:
+                    yield chunk
+                    chunk = []
+            if chunk:
+                yield chunk
+
+        if workers <= 1:
+            for chunk in chunks():
+                yield from PriorityMatcher.score_rows(chunk)
+            return
+
+        from concurrent.futures import ProcessPoolExecutor
+
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            # Keep a bounded window of chunks in flight so memory stays flat
+            pending = []
+            for chunk in chunks():
+                pending.append(pool.submit(PriorityMatcher.score_rows, chunk))
+                if len(pending) >= workers * 2:
+                    yield from pending.pop(0).result()
+            for future in pending:
+                yield from future.result()
+
+    @staticmethod
+    def project_report(owner: str, number: int, source: str = 'fetch',
+                       fields: Optional[List[str]] = None, pivot: Optional[tuple] = ('Status', 'Priority'),
+                       stale_days: Optional[List[int]] = None,
+                       required_fields: Optional[List[str]] = None) -> Dict[str, Any]:
+        """
+        Build the aggregate report of one project.
+
+        Args:
+            owner: Project owner
+            number: Project number
+            source: 'fetch' (stream items over GraphQL, projected to what the
+                    report needs), 'sync' (delta-sync the local snapshot, then
+                    read it) or 'snapshot' (read the local snapshot as is)
+            fields, pivot, stale_days, required_fields: As for aggregate_items()
+
+        Returns:
+            aggregate_items() report plus 'seconds' spent on the project
+        """
+        start = time.monotonic()
+        if source == 'fetch':
+            wanted = list(dict.fromkeys((fields or ['Status', 'Priority']) + list(pivot or ())
+                                        + (required_fields or [])))
+            items = (item for page in GHProjectHelpers.iter_project_item_pages(owner, number, wanted, ['updatedAt'])
+                     for item in page['items'])
+        elif source in ('sync', 'snapshot'):
+            store = ProjectSnapshotStore()
+            if source == 'sync':
+                store.sync(owner, number)
+            items = store.iter_items(owner, number)
+        else:
+            raise GHProjectError(f"Unknown report source: {source}")
+
+        report = GHProjectHelpers.aggregate_items(items, fields, pivot, stale_days, None, required_fields)
+        report['seconds'] = round(time.monotonic() - start, 3)
+        GHCallTracer.default().flush()
+        return report
+
+    @staticmethod
+    def _init_org_worker(rate: float, mutation_rate: float, trace: Optional[str], trace_format: str) -> None:
+        # Each worker gets its share of the request rate, so the pool as a
+        # whole stays within the limits a single process would keep
+        GHRequestScheduler._default = GHRequestScheduler(rate=rate, mutation_rate=mutation_rate)
+        GHCallTracer.configure(trace, trace_format)
+
+    @staticmethod
+    def merge_reports(reports: Iterable[Dict[str, Any]]) -> Dict[str, Any]:
+        """
+        Sum aggregate_items() reports into one portfolio-wide report.
+
+        Counts, pivot cells, types, stale buckets and missing-field counts
+        are added up; thresholds are taken from the first report.
+        """
+        def add(target: Dict[str, Any], counts: Dict[str, Any]) -> None:
+            for key, value in counts.items():
+                if isinstance(value, dict):
+                    add(target.setdefault(key, {}), value)
+                elif isinstance(value, (int, float)) and not isinstance(value, bool):
+                    target[key] = target.get(key, 0) + value
+
+        merged: Dict[str, Any] = {'total': 0, 'fields': {}, 'pivot': None, 'types': {}, 'stale': None,
+                                  'missing': {}}
+        for report in reports:
+            merged['total'] += report.get('total', 0)
+            for name in ('fields', 'types', 'missing'):
+                add(merged[name], report.get(name) or {})
+            if report.get('pivot'):
+                if merged['pivot'] is None:
+                    merged['pivot'] = {'rows': report['pivot']['rows'], 'columns': report['pivot']['columns'],
+                                       'counts': {}}
+                add(merged['pivot']['counts'], report['pivot']['counts'])
+            if report.get('stale'):
+                if merged['stale'] is None:
+                    merged['stale'] = {'thresholds': report['stale']['thresholds'],
+                                       'statuses': report['stale'].get('statuses'),
+                                       'buckets': {}, 'older_than': {}, 'no_timestamp': 0}
+                stale = merged['stale']
+                add(stale['buckets'], report['stale'].get('buckets') or {})
+                add(stale['older_than'], report['stale'].get('older_than') or {})
+                stale['no_timestamp'] += report['stale'].get('no_timestamp', 0)
+        return merged
+
+    @staticmethod
+    def org_report(owner: str, workers: int = 4, source: str = 'fetch',
+                   fields: Optional[List[str]] = None, pivot: Optional[tuple] = ('Status', 'Priority'),
+                   stale_days: Optional[List[int]] = None, required_fields: Optional[List[str]] = None,
+                   limit: int = 100, include_closed: bool = False,
+                   numbers: Optional[List[int]] = None) -> Iterator[Dict[str, Any]]:
+        """
+        Report on every project of an owner, one worker process per project.
+
+        Projects are fetched and aggregated in parallel, so the whole report
+        takes about as long as the slowest project. Sections are yielded as
+        projects finish, followed by the merged summary.
+
+        Args:
+            owner: Organization or user login ('@me' for the viewer)
+            workers: Worker processes (projects handled at once)
+            source: Where items come from, see project_report()
+            fields, pivot, stale_days, required_fields: As for aggregate_items()
+            limit: Maximum number of projects to list
+            include_closed: Also report on closed projects
+            numbers: Only these project numbers (skips listing projects)
+
+        Yields:
+            {'project': {...}, 'report': {...}} or {'project': {...}, 'error': '...'}
+            per project in completion order, then {'summary': {...}}
+        """
+        if numbers:
+            projects = [{'number': number, 'title': None} for number in numbers]
+        else:
+            command = ['project', 'list', '--owner', owner, '--limit', str(limit)]
+            if include_closed:
+                command.append('--closed')
+            listed = GHProjectHelpers.run_gh_command(command)
+            listed = listed.get('projects', []) if isinstance(listed, dict) else listed
+            projects = [project for project in GHProjectHelpers.parse_project_list(listed)
+                        if project.get('number') is not None]
+
+        start = time.monotonic()
+        reports = []
+        failed = []
+
+        def section(project: Dict[str, Any], future) -> Dict[str, Any]:
+            info = {'number': project['number'], 'title': project.get('title')}
+            try:
+                report = future.result()
+            except Exception as e:
+                failed.append(project['number'])
+                return {'project': info, 'error': str(e)}
+            reports.append(report)
+            return {'project': info, 'report': report}
+
+        workers = max(1, min(workers, len(projects) or 1))
+        scheduler = GHRequestScheduler.default()
+        tracer = GHCallTracer.default()
+        from concurrent.futures import ProcessPoolExecutor, as_completed
+
+        with ProcessPoolExecutor(max_workers=workers, initializer=GHProjectHelpers._init_org_worker,
+                                 initargs=(scheduler.rate / workers, scheduler.mutation_rate / workers,
+                                           tracer.path, tracer.format)) as pool:
+            futures = {pool.submit(GHProjectHelpers.project_report, owner, project['number'], source,
+                                   fields, pivot, stale_days, required_fields): project
+                       for project in projects}
+            for future in as_completed(futures):
+                yield section(futures[future], future)
+
+        summary = GHProjectHelpers.merge_reports(reports)
+        summary.update(owner=owner, projects=len(projects), failed=failed,
+                       seconds=round(time.monotonic() - start, 3),
+                       slowest_project_seconds=max((report['seconds'] for report in reports), default=0))
+        yield {'summary': summary}
+
+
+class PriorityMatcher:
+    """
+    Precompiled keyword matcher behind suggest_priority().
+
+    All tier keywords are compiled into one regular expression, so an
+    item's text is scanned once instead of once per keyword. Keywords
+    match at word starts and allow common inflections ('bugs', 'added',
+    'urgently'), so 'debug' or 'address' no longer count as 'bug' or 'add'.
+    The highest tier with any match wins.
+    """
+
+    # (priority, reason, keywords), highest priority first
+    RULES = (
+        ('P0', 'Critical keywords detected (blocking, security, urgent)',
+         ('critical', 'blocking', 'urgent', 'security', 'production down', 'data loss', 'outage', 'severe')),
+        ('P1', 'Bug or high-priority keywords detected',
+         ('bug', 'error', 'broken', 'failing', 'regression', 'important')),
+        ('P2', 'Enhancement or feature keywords detected',
+         ('enhancement', 'feature', 'improve', 'add')),
+    )
+    DEFAULT = ('P3', 'Standard priority (no high-urgency indicators)')
+    SUFFIXES = '(?:s|es|d|ed|ing|ly|ment|ments)?'
+
+    _default = None
+
+    def __init__(self, rules: tuple = RULES):
+        self.rules = rules
+        self.keywords: List[tuple] = []
+        alternatives = []
+        for tier, (_, _, keywords) in enumerate(rules):
+            for keyword in keywords:
+                group = f'k{len(self.keywords)}'
+                self.keywords.append((tier, keyword))
+                pattern = r'\s+'.join(re.escape(word) for word in keyword.split())
+                alternatives.append(f'(?P<{group}>{pattern})')
+        self.pattern = re.compile(r'\b(?:' + '|'.join(alternatives) + r')' + self.SUFFIXES + r'\b',
+                                  re.IGNORECASE)
+
+    @classmethod
+    def default(cls) -> 'PriorityMatcher':
+        """Return the shared matcher for the built-in rules."""
+        if cls._default is None:
+            cls._default = cls()
+        return cls._default
+
+    def score(self, title: str, body: str = "", labels: Optional[List[str]] = None) -> tuple:
+        """
+        Score one item.
+
+        Returns:
+            Tuple of (priority, reason, matched keywords of the winning tier)
+        """
+        text = f"{title} {body}\n{' '.join(labels or [])}"
+        best = len(self.rules)
+        matched: Dict[int, List[str]] = {}
+
+        for match in self.pattern.finditer(text):
+            tier, keyword = self.keywords[int(match.lastgroup[1:])]
+            terms = matched.setdefault(tier, [])
+            if keyword not in terms:
+                terms.append(keyword)
+            best = min(best, tier)
+
+        if best == len(self.rules):
+            return self.DEFAULT[0], self.DEFAULT[1], []
+        priority, reason, _ = self.rules[best]
+        return priority, reason, matched[best]
+
+    @staticmethod
+    def score_rows(rows: List[tuple]) -> List[Dict]:
+        """Score (id, current, title, body, labels) rows; runs in worker processes."""
+        matcher = PriorityMatcher.default()
+        results = []
+        for item_id, current, title, body, labels in rows:
+            priority, reason, matched = matcher.score(title, body, labels)
+            results.append({'id': item_id, 'priority': priority, 'reason': reason,
+                            'matched': matched, 'current': current})
+        return results
+
+
+class ProjectItemIndex:
+    """
+    Field-value index over a list of project items.
+
+    Built in one pass: every item's fieldValues are flattened into a
+    field name -> value map, and an inverted index from (field, value) to
+    item positions is kept alongside. Multi-field filters are answered by
+    intersecting position sets instead of rescanning every item.
+
+    Example:
+        index = ProjectItemIndex(items)
+        index.filter({'Status': ['Todo', 'Backlog'], 'Priority': 'P1'})
+    """
+
+    def __init__(self, items: List[Dict]):
+        self.items = items
+        self.values: List[Dict[str, Any]] = []
+        self.postings: Dict[str, Dict[Any, List[int]]] = {}
+
+        for pos, item in enumerate(items):
+            row = GHProjectHelpers.get_item_field_values(item)
+            self.values.append(row)
+
+            for field_name, value in row.items():
+                by_value = self.postings.get(field_name)
+                if by_value is None:
+                    by_value = self.postings[field_name] = {}
+                bucket = by_value.get(value)
+                if bucket is None:
+                    by_value[value] = [pos]
+                else:
+                    bucket.append(pos)
+
+    def __len__(self) -> int:
+        return len(self.items)
+
+    def value(self, pos: int, field_name: str) -> Any:
+        """Return the value of field_name for the item at pos, or None."""
+        return self.values[pos].get(field_name)
+
+    def field_values(self, field_name: str) -> Dict[Any, int]:
+        """Return the distinct values of a field with their item counts."""
+        return {value: len(bucket) for value, bucket in self.postings.get(field_name, {}).items()}
+
+    def positions(self, field_name: str, expected: Any) -> set:
+        """
+        Return positions of items whose field matches any expected value.
+
+        Args:
+            field_name: Field to look up
+            expected: A single value or a list of accepted values
+
+        Returns:
+            Set of item positions
+        """
+        expected_values = expected if isinstance(expected, list) else [expected]
+        by_value = self.postings.get(field_name, {})
+
+        if len(expected_values) == 1:
+            return set(by_value.get(expected_values[0], ()))
+
+        matched = set()
+        for value in expected_values:
+            matched.update(by_value.get(value, ()))
+        return matched
+
+    def query(self, filters: Dict[str, Any]) -> List[int]:
+        """
+        Return sorted positions of items matching every filter.
+
+        Filters are evaluated smallest candidate set first, so the
+        intersection shrinks as quickly as possible.
+
+        Args:
+            filters: Dict of field_name: expected_value pairs (values may be lists)
+
+        Returns:
+            Sorted list of item positions
+        """
+        if not filters:
+            return list(range(len(self.items)))
+
+        candidates = sorted((self.positions(name, expected) for name, expected in filters.items()), key=len)
+
+        matched = candidates[0]
+        for other in candidates[1:]:
+            if not matched:
+                break
+            matched = matched & other
+
+        return sorted(matched)
+
+    def filter(self, filters: Dict[str, Any]) -> List[Dict]:
+        """Return the items matching every filter, in original order."""
+        return [self.items[pos] for pos in self.query(filters)]
+
+    def missing(self, field_name: str) -> List[int]:
+        """Return positions of items that have no value for field_name."""
+        return [pos for pos, row in enumerate(self.values) if field_name not in row]
+
+
+class ProjectItemTimeline:
+    """
+    Items ordered by content.updatedAt, for staleness queries.
+
+    Timestamps are parsed once into epoch seconds and kept sorted
+    alongside item positions, so "updated more than N days ago" is a
+    bisect over the array rather than a pass over every item. Each
+    Status value gets its own sorted array, so per-status age histograms
+    cost a few bisects per bucket.
+
+    Example:
+        timeline = ProjectItemTimeline(items)
+        timeline.stale(14)            # [('PVTI_..', 40), ...] oldest first
+        timeline.histogram([7, 14, 30])
+    """
+
+    def __init__(self, items: Iterable[Dict], group_field: str = 'Status'):
+        def rows() -> Iterator[tuple]:
+            for item in items:
+                values = GHProjectHelpers.get_item_field_values(item)
+                group = GHProjectHelpers.display_value(values[group_field]) if group_field in values else 'Unset'
+                yield item.get('id'), group, (item.get('content') or {}).get('updatedAt')
+
+        self._build(rows(), group_field)
+
+    @classmethod
+    def from_store(cls, store: 'ProjectItemStore', group_field: str = 'Status') -> 'ProjectItemTimeline':
+        """
+        Build a timeline from a ProjectItemStore's columns, without item dicts.
+
+        Positions are the store's, so they index the items the store was built from.
+        """
+        column = store.columns.get(group_field)
+        values = store.value_tables.get(group_field)
+
+        def rows() -> Iterator[tuple]:
+            for pos, record in enumerate(store.records):
+                code = column[pos] if column is not None else 0
+                group = GHProjectHelpers.display_value(values[code]) if code else 'Unset'
+                yield record.id, group, record.updated_at
+
+        timeline = cls.__new__(cls)
+        timeline._build(rows(), group_field)
+        return timeline
+
+    def _build(self, rows: Iterable[tuple], group_field: str) -> None:
+        # rows: (id, group, updatedAt string) per item, in item order
+        self.group_field = group_field
+        self.ids: List[Any] = []
+        self.groups: List[str] = []
+        self.undated: Dict[str, int] = {}
+        dated = []
+
+        for pos, (item_id, group, updated_at) in enumerate(rows):
+            self.ids.append(item_id)
+            self.groups.append(sys.intern(group))
+
+            updated = GHProjectHelpers.parse_timestamp(updated_at)
+            if updated is None:
+                self.undated[group] = self.undated.get(group, 0) + 1
+            else:
+                dated.append((updated.timestamp(), pos))
+
+        dated.sort()
+        self.epochs = array('d', (epoch for epoch, _ in dated))
+        self.positions = array('L', (pos for _, pos in dated))
+
+        # Per-group sorted epochs for histograms
+        self.group_epochs: Dict[str, array] = {}
+        for epoch, pos in dated:
+            group = self.groups[pos]
+            column = self.group_epochs.get(group)
+            if column is None:
+                column = self.group_epochs[group] = array('d')
+            column.append(epoch)
+
+    def __len__(self) -> int:
+        return len(self.ids)
+
+    @staticmethod
+    def cutoff(days: float, now: Optional[float] = None) -> float:
+        """Epoch seconds N days before now."""
+        return (time.time() if now is None else now) - days * 86400
+
+    def older_than(self, days: float, now: Optional[float] = None) -> List[int]:
+        """Return positions of items last updated more than N days ago, oldest first."""
+        return list(self.positions[:bisect.bisect_left(self.epochs, self.cutoff(days, now))])
+
+    def stale(self, days: float, status_filter: Optional[List[str]] = None,
+              now: Optional[float] = None) -> List[tuple]:
+        """
+        Return (id, days_stale) for items not updated in N days, oldest first.
+
+        Args:
+            days: Number of days to consider stale
+            status_filter: Only include items in these groups (optional)
+            now: Reference epoch seconds (default: current time)
+        """
+        now = time.time() if now is None else now
+        end = bisect.bisect_left(self.epochs, self.cutoff(days, now))
+        wanted = set(status_filter) if status_filter else None
+        return [(self.ids[pos], int((now - epoch) // 86400))
+                for epoch, pos in zip(self.epochs[:end], self.positions[:end])
+                if wanted is None or self.groups[pos] in wanted]
+
+    def histogram(self, thresholds: List[int], status_filter: Optional[List[str]] = None,
+                  top: int = 0, now: Optional[float] = None) -> Dict[str, Any]:
+        """
+        Bucket item ages per group in one step.
+
+        Args:
+            thresholds: Age thresholds in days
+            status_filter: Only report these groups (optional)
+            top: Also list this many oldest items per group as {'id', 'days_stale'}
+            now: Reference epoch seconds (default: current time)
+
+        Returns:
+            Dict with 'thresholds', 'groupField' and per-group 'groups' entries
+            holding 'total', 'buckets', 'olderThan', 'undated' and 'oldest'
+
+        Example:
+            {'thresholds': [7, 30], 'groupField': 'Status',
+             'groups': {'Todo': {'total': 40, 'buckets': {'<7d': 10, '7-30d': 20, '>=30d': 10},
+                                 'olderThan': {'7': 30, '30': 10}, 'undated': 0,
+                                 'oldest': [{'id': 'PVTI_..', 'days_stale': 92}]}}}
+        """
+        now = time.time() if now is None else now
+        thresholds = sorted(thresholds)
+        labels = GHProjectHelpers.age_bucket_labels(thresholds)
+        names = list(self.group_epochs) + [name for name in self.undated if name not in self.group_epochs]
+        if status_filter:
+            names = [name for name in names if name in status_filter]
+
+        groups = {}
+        for name in names:
+            epochs = self.group_epochs.get(name, array('d'))
+            # Items older than each threshold, newest threshold first
+            older = [bisect.bisect_left(epochs, self.cutoff(days, now)) for days in thresholds]
+            counts = [len(epochs) - older[0]]
+            counts += [newer - older_ for newer, older_ in zip(older, older[1:])]
+            counts.append(older[-1])
+
+            entry = {
+                'total': len(epochs) + self.undated.get(name, 0),
+                'buckets': dict(zip(labels, counts)),
+                'olderThan': {str(days): count for days, count in zip(thresholds, older)},
+                'undated': self.undated.get(name, 0),
+            }
+            if top:
+                entry['oldest'] = [{'id': item_id, 'days_stale': days_stale}
+                                   for item_id, days_stale in self.stale(0, [name], now)[:top]]
+            groups[name] = entry
+
+        return {'thresholds': thresholds, 'groupField': self.group_field, 'groups': groups}
+
+
+class ProjectItemRecord:
+    """Compact, slotted copy of the item attributes used for display"""
+
+    __slots__ = ('id', 'number', 'title', 'type', 'url', 'updated_at')
+
+    def __init__(self, item: Dict):
+        content = item.get('content') or {}
+        self.id = item.get('id')
+        self.number = content.get('number')
+        self.title = content.get('title')
+        item_type = content.get('type')
+        self.type = sys.intern(item_type) if isinstance(item_type, str) else item_type
+        self.url = content.get('url')
+        self.updated_at = content.get('updatedAt')
+
+    @classmethod
+    def from_values(cls, values: tuple) -> 'ProjectItemRecord':
+        """Build a record from attribute values in __slots__ order."""
+        record = cls.__new__(cls)
+        record.id, record.number, record.title, record.type, record.url, record.updated_at = values
+        return record
+
+    def to_item(self, field_values: Dict[str, Any]) -> Dict:
+        """Rebuild a minimal gh-shaped item dict from this record."""
+        content = {}
+        for key, value in (('number', self.number), ('title', self.title), ('type', self.type),
+                           ('url', self.url), ('updatedAt', self.updated_at)):
+            if value is not None:
+                content[key] = value
+
+        return {
+            'id': self.id,
+            'content': content,
+            'fieldValues': [
+                {'name' if isinstance(value, str) else 'number': value, 'field': {'name': name}}
+                for name, value in field_values.items()
+            ]
+        }
+
+
+class ProjectItemStore:
+    """
+    Columnar in-memory store for project items.
+
+    Each field is kept as an array of small integer codes, one per item,
+    backed by a per-field table of interned values (code 0 means the item
+    has no value for that field). Display attributes are kept in slotted
+    ProjectItemRecord objects instead of the raw nested gh dicts, so
+    repeated strings like 'Status' or 'In Progress' are stored once.
+
+    count_by_field() and group_items_by_field() run as integer bincounts
+    over the code arrays.
+
+    Example:
+        store = ProjectItemStore(GHProjectHelpers.iter_items('items.json'))
+        store.count_by_field('Status')
+    """
+
+    def __init__(self, items: Iterable[Dict] = ()):
+        self.records: List[ProjectItemRecord] = []
+        self.columns: Dict[str, array] = {}
+        self.value_tables: Dict[str, List[Any]] = {}
+        self.value_codes: Dict[str, Dict[Any, int]] = {}
+
+        for item in items:
+            self.append(item)
+
+    def __len__(self) -> int:
+        return len(self.records)
+
+    def append(self, item: Dict) -> None:
+        """Add one item to the store."""
+        pos = len(self.records)
+        self.records.append(ProjectItemRecord(item))
+        values = GHProjectHelpers.get_item_field_values(item)
+
+        for field_name in self.columns:
+            code = self.encode(field_name, values.pop(field_name)) if field_name in values else 0
+            # encode() may have widened the column, so look it up afterwards
+            self.columns[field_name].append(code)
+
+        # Fields seen for the first time get a column backfilled with 'unset'
+        for field_name, value in values.items():
+            field_name = sys.intern(field_name)
+            self.value_tables[field_name] = [None]
+            self.value_codes[field_name] = {}
+            self.columns[field_name] = array('H', bytes(2 * pos))
+            code = self.encode(field_name, value)
+            self.columns[field_name].append(code)
+
+    def to_state(self) -> Dict[str, Any]:
+        """Return the store as plain lists, dicts and bytes (marshal-safe)."""
+        return {
+            'records': [[getattr(record, name) for record in self.records]
+                        for name in ProjectItemRecord.__slots__],
+            'columns': {name: (column.typecode, column.tobytes()) for name, column in self.columns.items()},
+            'value_tables': self.value_tables,
+        }
+
+    @classmethod
+    def from_state(cls, state: Dict[str, Any]) -> 'ProjectItemStore':
+        """Rebuild a store from to_state() output."""
+        store = cls()
+        store.records = [ProjectItemRecord.from_values(values) for values in zip(*state['records'])]
+        for name, (typecode, data) in state['columns'].items():
+            column = store.columns[name] = array(typecode)
+            column.frombytes(data)
+        store.value_tables = state['value_tables']
+        store.value_codes = {name: {value: code for code, value in enumerate(table) if code}
+                             for name, table in store.value_tables.items()}
+        return store
+
+    def encode(self, field_name: str, value: Any) -> int:
+        """Return the code for a field value, interning it on first use."""
+        codes = self.value_codes[field_name]
+        code = codes.get(value)
+        if code is None:
+            values = self.value_tables[field_name]
+            code = codes[value] = len(values)
+            values.append(sys.intern(value) if isinstance(value, str) else value)
+            if code == 0xFFFF and self.columns[field_name].typecode == 'H':
+                self.columns[field_name] = array('L', self.columns[field_name])
+        return code
+
+    def value(self, pos: int, field_name: str) -> Any:
+        """Return the value of field_name for the item at pos, or None."""
+        column = self.columns.get(field_name)
+        return self.value_tables[field_name][column[pos]] if column is not None else None
+
+    def item_field_values(self, pos: int) -> Dict[str, Any]:
+        """Return the field name -> value map for the item at pos."""
+        return {name: self.value_tables[name][column[pos]]
+                for name, column in self.columns.items() if column[pos]}
+
+    def to_item(self, pos: int) -> Dict:
+        """Rebuild a minimal gh-shaped item dict for the item at pos."""
+        return self.records[pos].to_item(self.item_field_values(pos))
+
+    def bincount(self, field_name: str) -> Dict[int, int]:
+        """Return item counts per code for a field, in first-seen order."""
+        column = self.columns.get(field_name)
+        if column is None:
+            return {0: len(self)} if self.records else {}
+        return dict(Counter(column))
+
+    def count_by_field(self, field_name: str) -> Dict[str, int]:
+        """Count items by field value; same output as GHProjectHelpers.count_by_field()."""
+        values = self.value_tables.get(field_name, [None])
+        counts = {}
+        for code, count in self.bincount(field_name).items():
+            key = GHProjectHelpers.display_value(values[code]) if code else 'Unset'
+            counts[key] = counts.get(key, 0) + count
+        return counts
+
+    def group_positions(self, field_name: str) -> Dict[str, List[int]]:
+        """Group item positions by display value of a field."""
+        column = self.columns.get(field_name)
+        if column is None:
+            return {'Unset': list(range(len(self)))} if self.records else {}
+
+        values = self.value_tables[field_name]
+        by_code: Dict[int, List[int]] = {}
+        for pos, code in enumerate(column):
+            bucket = by_code.get(code)
+            if bucket is None:
+                by_code[code] = [pos]
+            else:
+                bucket.append(pos)
+
+        groups = {}
+        for code, positions in by_code.items():
+            key = GHProjectHelpers.display_value(values[code]) if code else 'Unset'
+            groups.setdefault(key, []).extend(positions)
+        return groups
+
+    def group_items_by_field(self, field_name: str) -> Dict[str, List[Dict]]:
+        """Group items by field value; items are rebuilt with to_item()."""
+        return {key: [self.to_item(pos) for pos in positions]
+                for key, positions in self.group_positions(field_name).items()}
+
+    def format_item_for_display(self, pos: int) -> Dict[str, str]:
+        """Format the item at pos; same output as GHProjectHelpers.format_item_for_display()."""
+        record = self.records[pos]
+        status = self.value(pos, 'Status')
+        priority = self.value(pos, 'Priority')
+        return {
+            'id': record.id,
+            'number': record.number if record.number is not None else 'draft',
+            'title': record.title if record.title is not None else 'Untitled',
+            'type': record.type if record.type is not None else 'Unknown',
+            'status': status or 'Unset',
+            'priority': priority or 'Unset',
+            'url': record.url if record.url is not None else '',
+            'updated': record.updated_at.split('T')[0] if record.updated_at else ''
+        }
+
+
+class GHRequestScheduler:
+    """
+    Rate-limit-aware gate that every gh subprocess goes through.
+
+    - Token buckets pace requests: one for reads and a slower one for
+      mutations, which GitHub's secondary limits restrict separately.
+    - The remaining primary budget is tracked from gh api rate_limit and
+      from rateLimit selections in GraphQL responses; when it runs low,
+      calls wait for the reset instead of failing.
+    - Calls rejected for rate limiting, abuse detection or transient 5xx
+      errors are retried with jittered exponential backoff, so a large
+      sync resumes where it was throttled rather than dying halfway.
+      Mutations are retried only when explicitly throttled: after a 5xx
+      or timeout the change may already have been applied, and repeating
+      it could create duplicate items.
+
+    Tunable through GH_RATE_LIMIT_RPS, GH_RATE_LIMIT_MUTATION_RPS,
+    GH_RATE_LIMIT_RETRIES and GH_RATE_LIMIT_MAX_WAIT.
+    """
+
+    # Substrings of gh errors that mean "slow down and retry"
+    THROTTLE_PATTERNS = (
+        'rate limit', 'abuse detection', 'secondary rate', 'submitted too quickly',
+        'http 429', 'too many requests',
+    )
+    TRANSIENT_PATTERNS = ('http 502', 'http 503', 'http 504', 'timeout awaiting')
+
+    # Subcommands of other gh commands (issue, pr, label, ...) that change state
+    MUTATING_VERBS = frozenset((
+        'create', 'edit', 'delete', 'close', 'reopen', 'comment', 'merge', 'add', 'remove', 'archive',
+        'unarchive', 'transfer', 'lock', 'unlock', 'pin', 'unpin', 'copy', 'link', 'unlink', 'ready',
+        'review', 'develop', 'rename', 'clone', 'fork', 'sync',
+    ))
+    API_BODY_FLAGS = ('-f', '-F', '--field', '--raw-field', '--input')
+
+    # Keep this much primary budget in reserve before waiting for the reset
+    BUDGET_RESERVE = 50
+
+    _default = None
+
+    def __init__(self, rate: float = None, mutation_rate: float = None, burst: int = 20,
+                 max_retries: int = None, base_delay: float = 1.0, max_delay: float = 60.0,
+                 max_wait: float = None):
+        self.rate = rate if rate is not None else float(os.environ.get('GH_RATE_LIMIT_RPS', 10))
+        self.mutation_rate = (mutation_rate if mutation_rate is not None
+                              else float(os.environ.get('GH_RATE_LIMIT_MUTATION_RPS', 1)))
+        self.burst = burst
+        self.max_retries = (max_retries if max_retries is not None
+                            else int(os.environ.get('GH_RATE_LIMIT_RETRIES', 6)))
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+        self.max_wait = max_wait if max_wait is not None else float(os.environ.get('GH_RATE_LIMIT_MAX_WAIT', 3600))
+
+        now = time.monotonic()
+        self._buckets = {
+            'read': [float(burst), now, self.rate, float(burst)],
+            'mutation': [float(max(1, burst // 4)), now, self.mutation_rate, float(max(1, burst // 4))],
+        }
+        self.budget: Dict[str, Dict[str, float]] = {}
+        self.stats = {'calls': 0, 'retries': 0, 'throttled': 0, 'waited': 0.0}
+
+    @classmethod
+    def default(cls) -> 'GHRequestScheduler':
+        """Return the process-wide scheduler."""
+        if cls._default is None:
+            cls._default = cls()
+        return cls._default
+
+    @staticmethod
+    def classify(argv: List[str]) -> Dict[str, str]:
+        """
+        Return the bucket ('read' or 'mutation') and budget resource for a call.
+
+        Args:
+            argv: gh argv list
+
+        Returns:
+            Dict with 'bucket' and 'resource' ('graphql' or 'core')
+        """
+        if argv[1:3] == ['api', 'graphql']:
+            query = next((arg[6:] for arg in argv if arg.startswith('query=')), '')
+            bucket = 'mutation' if query.lstrip().startswith('mutation') else 'read'
+            return {'bucket': bucket, 'resource': 'graphql'}
+
+        family = GHResponseCache.parse_command(shlex.join(argv))['family']
+        if argv[1:2] == ['api']:
+            # gh api sends a POST when given body fields, unless a method is named
+            method = next((argv[i + 1] for i, arg in enumerate(argv[:-1]) if arg in ('-X', '--method')),
+                          'POST' if any(arg in GHRequestScheduler.API_BODY_FLAGS for arg in argv) else 'GET')
+            mutating = method.upper() != 'GET'
+        elif argv[1:2] == ['project']:
+            mutating = family in GHResponseCache.INVALIDATES
+        else:
+            mutating = family.partition(' ')[2] in GHRequestScheduler.MUTATING_VERBS
+        bucket = 'mutation' if mutating else 'read'
+        # gh project commands are GraphQL calls under the hood
+        resource = 'graphql' if argv[1:2] == ['project'] else 'core'
+        return {'bucket': bucket, 'resource': resource}
+
+    def _take(self, bucket_name: str) -> float:
+        """Take a token from a bucket; return seconds to wait first (0 if available)."""
+        bucket = self._buckets[bucket_name]
+        tokens, last, rate, capacity = bucket
+        now = time.monotonic()
+        tokens = min(capacity, tokens + (now - last) * rate)
+        bucket[1] = now
+
+        if tokens >= 1:
+            bucket[0] = tokens - 1
+            return 0.0
+
+        # Reserve the token now so concurrent callers queue behind it
+        bucket[0] = tokens - 1
+        return (1 - tokens) / rate if rate > 0 else 0.0
+
+    def _budget_wait(self, resource: str) -> float:
+        """Seconds to wait for the primary budget of a resource to reset."""
+        budget = self.budget.get(resource)
+        if not budget or budget['remaining'] > self.BUDGET_RESERVE:
+            return 0.0
+        wait = budget['reset'] - time.time()
+        if wait <= 0:
+            self.budget.pop(resource, None)
+            return 0.0
+        return min(wait + 1, self.max_wait)
+
+    def _spend(self, resource: str) -> None:
+        budget = self.budget.get(resource)
+        if budget:
+            budget['remaining'] -= 1
+
+    def observe_graphql(self, response: Dict) -> None:
+        """Update the GraphQL budget from a response's rateLimit selection, if any."""
+        rate_limit = ((response or {}).get('data') or {}).get('rateLimit')
+        if not rate_limit or 'remaining' not in rate_limit:
+            return
+        reset = rate_limit.get('resetAt')
+        try:
+            reset_ts = datetime.fromisoformat(reset.replace('Z', '+00:00')).timestamp() if reset else None
+        except ValueError:
+            reset_ts = None
+        self.budget['graphql'] = {'remaining': rate_limit['remaining'],
+                                  'reset': reset_ts or time.time() + 3600}
+
+    def refresh_budget(self) -> Dict[str, Dict[str, float]]:
+        """
+        Load remaining budgets from gh api rate_limit (which costs no budget itself).
+
+        Returns:
+            Dict mapping resource names to {'remaining', 'reset'}
+        """
+        argv = ['gh', 'api', 'rate_limit']
+        try:
+            started, clock = time.time(), time.perf_counter()
+            result = subprocess.run(argv, capture_output=True, text=True)
+            result.trace = GHCallTracer.default().record(argv, started, time.perf_counter() - clock,
+                                                         result.returncode, result.stdout, result.stderr)
+            resources = GHCallTracer.parse_json(result).get('resources', {}) if result.returncode == 0 else {}
+        except (OSError, json.JSONDecodeError):
+            resources = {}
+
+        for name in ('core', 'graphql'):
+            if name in resources:
+                self.budget[name] = {'remaining': resources[name].get('remaining', 0),
+                                     'reset': resources[name].get('reset', time.time() + 60)}
+        return self.budget
+
+    def retry_delay(self, attempt: int, output: str, resource: str, bucket: str = 'read') -> Optional[float]:
+        """
+        Decide whether a failed call should be retried, and after how long.
+
+        Args:
+            attempt: Number of retries already made
+            output: Combined stderr/stdout of the failed call
+            resource: Budget resource of the call
+            bucket: 'read' or 'mutation'; mutations are not retried after
+                    transient errors, which may follow an applied change
+
+        Returns:
+            Seconds to wait before retrying, or None to give up
+        """
+        if attempt >= self.max_retries:
+            return None
+
+        text = output.lower()
+        throttled = any(pattern in text for pattern in self.THROTTLE_PATTERNS)
+        if not throttled and (bucket == 'mutation'
+                              or not any(pattern in text for pattern in self.TRANSIENT_PATTERNS)):
+            return None
+
+        if throttled:
+            self.stats['throttled'] += 1
+            # A spent primary budget only comes back at the reset time
+            if 'secondary' not in text and 'abuse' not in text and 'quickly' not in text:
+                self.refresh_budget()
+                wait = self._budget_wait(resource)
+                if wait:
+                    return wait
+
+        # Full jitter: uniform in [0, min(max_delay, base * 2^attempt)], at least base/2
+        ceiling = min(self.max_delay, self.base_delay * (2 ** attempt))
+        return max(self.base_delay / 2, random.uniform(0, ceiling))
+
+    def _before_call(self, argv: List[str]) -> tuple:
+        kind = self.classify(argv)
+        wait = max(self._take(kind['bucket']), self._budget_wait(kind['resource']))
+        return kind, wait
+
+    def run(self, argv: List[str], timeout: Optional[float] = None) -> subprocess.CompletedProcess:
+        """
+        Run a gh argv list, pacing and retrying around rate limits.
+
+        Args:
+            argv: argv list starting with 'gh'
+            timeout: Per-attempt timeout in seconds (optional)
+
+        Returns:
+            CompletedProcess of the last attempt (text mode, not checked)
+
+        Raises:
+            subprocess.TimeoutExpired: If an attempt times out
+            FileNotFoundError: If gh is not installed
+        """
+        attempt = 0
+        while True:
+            kind, wait = self._before_call(argv)
+            if wait:
+                self.stats['waited'] += wait
+                time.sleep(wait)
+
+            self.stats['calls'] += 1
+            tracer = GHCallTracer.default()
+            started, clock = time.time(), time.perf_counter()
+            try:
+                result = subprocess.run(argv, capture_output=True, text=True, timeout=timeout)
+            except subprocess.TimeoutExpired:
+                tracer.record(argv, started, time.perf_counter() - clock, None, attempt=attempt)
+                raise
+            result.trace = tracer.record(argv, started, time.perf_counter() - clock, result.returncode,
+                                         result.stdout, result.stderr, attempt)
+            self._spend(kind['resource'])
+            if result.returncode == 0:
+                return result
+
+            delay = self.retry_delay(attempt, f"{result.stderr}\n{result.stdout[:4096]}", kind['resource'],
+                                     kind['bucket'])
+            if delay is None:
+                return result
+
+            attempt += 1
+            self.stats['retries'] += 1
+            self.stats['waited'] += delay
+            time.sleep(delay)
+
+    async def run_async(self, argv: List[str], timeout: Optional[float] = None) -> subprocess.CompletedProcess:
+        """
+        Async counterpart of run(), built on asyncio.create_subprocess_exec.
+
+        Raises:
+            asyncio.TimeoutError: If an attempt times out
+            FileNotFoundError: If gh is not installed
+        """
+        attempt = 0
+        while True:
+            kind, wait = self._before_call(argv)
+            if wait:
+                self.stats['waited'] += wait
+                await asyncio.sleep(wait)
+
+            self.stats['calls'] += 1
+            tracer = GHCallTracer.default()
+            started, clock = time.time(), time.perf_counter()
+            proc = await asyncio.create_subprocess_exec(
+                *argv, stdout=asyncio.subprocess.PIPE, stderr=asyncio.subprocess.PIPE)
+            try:
+                stdout, stderr = await asyncio.wait_for(proc.communicate(), timeout)
+            except (asyncio.TimeoutError, asyncio.CancelledError):
+                if proc.returncode is None:
+                    proc.kill()
+                    await asyncio.shield(proc.wait())
+                tracer.record(argv, started, time.perf_counter() - clock, None, attempt=attempt)
+                raise
+
+            self._spend(kind['resource'])
+            result = subprocess.CompletedProcess(argv, proc.returncode,
+                                                 stdout.decode('utf-8', errors='replace'),
+                                                 stderr.decode('utf-8', errors='replace'))
+            result.trace = tracer.record(argv, started, time.perf_counter() - clock, result.returncode,
+                                         result.stdout, result.stderr, attempt)
+            if result.returncode == 0:
+                return result
+
+            delay = self.retry_delay(attempt, f"{result.stderr}\n{result.stdout[:4096]}", kind['resource'],
+                                     kind['bucket'])
+            if delay is None:
+                return result
+
+            attempt += 1
+            self.stats['retries'] += 1
+            self.stats['waited'] += delay
+            await asyncio.sleep(delay)
+
+
+class GHCallTracer:
+    """
+    Opt-in instrumentation of gh subprocess calls.
+
+    Every attempt made through GHRequestScheduler is recorded with its
+    redacted argv, wall time, exit status, stdout/stderr size and, where
+    the output is parsed, JSON parse time. Calls are aggregated per
+    command family (e.g. 'project item-list', 'api graphql mutation')
+    into latency histograms; the slowest calls are kept verbatim.
+
+    Enable with GH_PROJECT_TRACE=PATH (or the CLI's --trace PATH). The
+    trace is written at exit, merged into PATH if it already holds a
+    trace, so one file can collect every helper process of a workflow.
+    GH_PROJECT_TRACE_FORMAT=chrome writes a Chrome trace (chrome://tracing,
+    Perfetto) instead of the JSON summary.
+    """
+
+    # Latency histogram bucket upper bounds in milliseconds (last bucket is open)
+    BUCKETS_MS = (10, 25, 50, 100, 250, 500, 1000, 2500, 5000, 10000, 30000)
+    SLOWEST = 20
+    MAX_ARG_CHARS = 200
+    FORMATS = ('summary', 'chrome')
+
+    TOKEN_PATTERN = re.compile(r'\b(gh[pousr]_[A-Za-z0-9]{20,}|github_pat_[A-Za-z0-9_]{20,})')
+    SECRET_KEY_PATTERN = re.compile(r'^([\w.-]*(?:token|secret|password|passwd|auth|key)[\w.-]*)=.*',
+                                    re.IGNORECASE | re.DOTALL)
+    # gh flags whose next argument is a value, not a subcommand
+    VALUE_FLAGS = ('-H', '--header', '-f', '--raw-field', '-F', '--field', '-X', '--method', '--owner',
+                   '--format', '-q', '--jq', '-t', '--template', '--hostname', '-R', '--repo')
+
+    _default = None
+
+    def __init__(self, path: Optional[str] = None, trace_format: str = 'summary'):
+        if trace_format not in self.FORMATS:
+            raise GHProjectError(f"Unknown trace format: {trace_format} (expected summary or chrome)")
+        self.path = path
+        self.format = trace_format
+        self.enabled = bool(path)
+        self.pid = os.getpid()
+        self.stats: Dict[str, Dict[str, Any]] = {}
+        self.slowest: List[Dict[str, Any]] = []
+        self.events: List[Dict[str, Any]] = []
+
+    @classmethod
+    def default(cls) -> 'GHCallTracer':
+        """Return the process-wide tracer, configured from GH_PROJECT_TRACE on first use."""
+        if cls._default is None:
+            cls.configure(os.environ.get('GH_PROJECT_TRACE'),
+                          os.environ.get('GH_PROJECT_TRACE_FORMAT', 'summary'))
+        return cls._default
+
+    @classmethod
+    def configure(cls, path: Optional[str], trace_format: str = 'summary') -> 'GHCallTracer':
+        """Replace the process-wide tracer; an enabled tracer writes its trace at exit."""
+        cls._default = cls(path, trace_format)
+        if cls._default.enabled:
+            atexit.register(cls._default.write)
+        return cls._default
+
+    @classmethod
+    def redact(cls, argv: List[str]) -> List[str]:
+        """
+        Return argv safe to store: tokens, secret-looking key=value pairs and
+        Authorization headers are replaced, and long arguments truncated.
+        """
+        redacted = []
+        for i, arg in enumerate(argv):
+            if i and argv[i - 1] in ('-H', '--header') and arg.split(':', 1)[0].strip().lower() in (
+                    'authorization', 'proxy-authorization'):
+                arg = arg.split(':', 1)[0] + ': [REDACTED]'
+            arg = cls.TOKEN_PATTERN.sub('[REDACTED]', arg)
+            arg = cls.SECRET_KEY_PATTERN.sub(r'\1=[REDACTED]', arg) if not arg.startswith('query=') else arg
+            if len(arg) > cls.MAX_ARG_CHARS:
+                arg = arg[:cls.MAX_ARG_CHARS] + f'...[{len(arg) - cls.MAX_ARG_CHARS} more chars]'
+            redacted.append(arg)
+        return redacted
+
+    @staticmethod
+    def family(argv: List[str]) -> str:
+        """Command family of a gh argv list, e.g. 'project view' or 'api graphql mutation'."""
+        words = []
+        skip = False
+        for arg in argv[1:]:
+            if skip or arg.startswith('-'):
+                skip = not skip and arg in GHCallTracer.VALUE_FLAGS
+                continue
+            words.append(arg)
+            if len(words) == 2:
+                break
+        family = ' '.join(words)
+        if words == ['api', 'graphql'] and GHRequestScheduler.classify(argv)['bucket'] == 'mutation':
+            family += ' mutation'
+        return family
+
+    def record(self, argv: List[str], started: float, seconds: float, returncode: Optional[int],
+               stdout: str = '', stderr: str = '', attempt: int = 0) -> Optional[Dict[str, Any]]:
+        """
+        Record one gh call attempt.
+
+        Args:
+            argv: argv list starting with 'gh'
+            started: Start time (epoch seconds)
+            seconds: Wall time of the attempt
+            returncode: Exit status (None if the call timed out)
+            stdout: Captured stdout
+            stderr: Captured stderr
+            attempt: Retry attempt number (0 for the first try)
+
+        Returns:
+            The call record (pass it to record_parse()), or None when disabled
+        """
+        if not self.enabled:
+            return None
+
+        family = self.family(argv)
+        call = {
+            'command': family,
+            'argv': self.redact(argv),
+            'started': round(started, 6),
+            'seconds': round(seconds, 6),
+            'returncode': returncode,
+            'stdout_bytes': len(stdout.encode('utf-8', errors='replace')) if stdout else 0,
+            'stderr_bytes': len(stderr.encode('utf-8', errors='replace')) if stderr else 0,
+            'attempt': attempt,
+            'pid': self.pid,
+        }
+
+        stats = self.stats.get(family)
+        if stats is None:
+            stats = self.stats[family] = {
+                'calls': 0, 'failed': 0, 'retries': 0, 'seconds': 0.0, 'min_seconds': None,
+                'max_seconds': 0.0, 'stdout_bytes': 0, 'parse_seconds': 0.0,
+                'buckets': [0] * (len(self.BUCKETS_MS) + 1),
+            }
+        stats['calls'] += 1
+        stats['failed'] += returncode != 0
+        stats['retries'] += attempt > 0
+        stats['seconds'] += seconds
+        stats['min_seconds'] = seconds if stats['min_seconds'] is None else min(stats['min_seconds'], seconds)
+        stats['max_seconds'] = max(stats['max_seconds'], seconds)
+        stats['stdout_bytes'] += call['stdout_bytes']
+        stats['buckets'][bisect.bisect_left(self.BUCKETS_MS, seconds * 1000)] += 1
+
+        self.slowest.append(call)
+        if len(self.slowest) > 4 * self.SLOWEST:
+            self.slowest = sorted(self.slowest, key=lambda c: -c['seconds'])[:self.SLOWEST]
+        if self.format == 'chrome':
+            self.events.append(call)
+        return call
+
+    def record_parse(self, call: Optional[Dict[str, Any]], seconds: float) -> None:
+        """Add the JSON parse time of a recorded call's output."""
+        if call is None:
+            return
+        call['parse_seconds'] = round(seconds, 6)
+        self.stats[call['command']]['parse_seconds'] += seconds
+
+    def flush(self) -> Optional[str]:
+        """Write what was recorded so far and start over (for long-lived worker processes)."""
+        path = self.write()
+        self.stats, self.slowest, self.events = {}, [], []
+        return path
+
+    @staticmethod
+    def parse_json(result: subprocess.CompletedProcess) -> Any:
+        """json.loads(result.stdout), timing the parse if the call was traced."""
+        start = time.perf_counter()
+        data = json.loads(result.stdout)
+        GHCallTracer.default().record_parse(getattr(result, 'trace', None), time.perf_counter() - start)
+        return data
+
+    @classmethod
+    def percentile_ms(cls, buckets: List[int], fraction: float) -> Optional[float]:
+        """Upper bound of the histogram bucket holding the given fraction of calls."""
+        total = sum(buckets)
+        if not total:
+            return None
+        rank = fraction * total
+        running = 0
+        for bound, count in zip(cls.BUCKETS_MS + (None,), buckets):
+            running += count
+            if running >= rank:
+                return bound
+        return None
+
+    def summary(self, previous: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+        """
+        Return the JSON summary, merged with a previously written one.
+
+        Per command: calls, failed, retries, total/mean/min/max seconds,
+        stdout bytes, parse seconds, the histogram ('le_ms' bucket bounds
+        with counts) and p50/p95/p99 as bucket upper bounds in ms.
+        """
+        merged: Dict[str, Dict[str, Any]] = {}
+        previous = previous or {}
+        for source in (previous.get('commands') or {}, self.stats):
+            for family, stats in source.items():
+                target = merged.setdefault(family, {
+                    'calls': 0, 'failed': 0, 'retries': 0, 'seconds': 0.0, 'min_seconds': None,
+                    'max_seconds': 0.0, 'stdout_bytes': 0, 'parse_seconds': 0.0,
+                    'buckets': [0] * (len(self.BUCKETS_MS) + 1),
+                })
+                for key in ('calls', 'failed', 'retries', 'seconds', 'stdout_bytes', 'parse_seconds'):
+                    target[key] += stats.get(key, 0)
+                if stats.get('min_seconds') is not None:
+                    target['min_seconds'] = (stats['min_seconds'] if target['min_seconds'] is None
+                                             else min(target['min_seconds'], stats['min_seconds']))
+                target['max_seconds'] = max(target['max_seconds'], stats.get('max_seconds', 0.0))
+                counts = stats.get('buckets') or [bucket['count'] for bucket in stats.get('histogram', [])]
+                target['buckets'] = [a + b for a, b in zip(target['buckets'], counts)]
+
+        commands = {}
+        for family, stats in sorted(merged.items(), key=lambda entry: -entry[1]['seconds']):
+            buckets = stats.pop('buckets')
+            stats['seconds'] = round(stats['seconds'], 6)
+            stats['parse_seconds'] = round(stats['parse_seconds'], 6)
+            stats['mean_seconds'] = round(stats['seconds'] / stats['calls'], 6) if stats['calls'] else None
+            for name, fraction in (('p50_ms', 0.5), ('p95_ms', 0.95), ('p99_ms', 0.99)):
+                stats[name] = self.percentile_ms(buckets, fraction)
+            stats['histogram'] = [{'le_ms': bound, 'count': count}
+                                  for bound, count in zip(self.BUCKETS_MS + (None,), buckets)]
+            commands[family] = stats
+
+        slowest = sorted((previous.get('slowest') or []) + self.slowest, key=lambda c: -c['seconds'])
+        return {
+            'processes': previous.get('processes', 0) + 1,
+            'calls': sum(stats['calls'] for stats in commands.values()),
+            'seconds': round(sum(stats['seconds'] for stats in commands.values()), 6),
+            'commands': commands,
+            'slowest': slowest[:self.SLOWEST],
+        }
+
+    def chrome_events(self) -> List[Dict[str, Any]]:
+        """
+        Return recorded calls as Chrome trace 'X' events.
+
+        Concurrent calls are spread over lanes (tids), so overlapping
+        async calls show side by side instead of as false nesting.
+        """
+        events = []
+        lanes: List[float] = []
+        for call in sorted(self.events, key=lambda c: c['started']):
+            end = call['started'] + call['seconds']
+            lane = next((i for i, busy_until in enumerate(lanes) if busy_until <= call['started']), len(lanes))
+            if lane == len(lanes):
+                lanes.append(end)
+            else:
+                lanes[lane] = end
+            args = {key: value for key, value in call.items() if key not in ('command', 'started', 'seconds', 'pid')}
+            events.append({'name': call['command'], 'cat': 'gh', 'ph': 'X', 'pid': self.pid, 'tid': lane,
+                           'ts': round(call['started'] * 1e6), 'dur': round(call['seconds'] * 1e6),
+                           'args': args})
+        return events
+
+    def write(self, path: Optional[str] = None) -> Optional[str]:
+        """
+        Write the trace, merging with the trace already at path.
+
+        Returns:
+            The path written, or None if nothing was recorded
+        """
+        path = path or self.path
+        if not path or not self.stats:
+            return None
+
+        # Worker processes (org-report) may merge into the same trace at once
+        lock_path = f"{path}.lock"
+        lock = self._lock(lock_path)
+        try:
+            return self._merge_into(path)
+        finally:
+            if lock is not None:
+                # Removed while still held; waiters notice and lock afresh
+                try:
+                    os.unlink(lock_path)
+                except OSError:
+                    pass
+                lock.close()
+
+    @staticmethod
+    def _lock(lock_path: str):
+        # Exclusive lock on lock_path, or None where flock is unavailable.
+        # The holder deletes the file when done, so a waiter that gets the
+        # lock of a deleted file retries on the current one.
+        try:
+            import fcntl
+        except ImportError:
+            return None
+        while True:
+            try:
+                lock = open(lock_path, 'a')
+            except OSError:
+                return None
+            try:
+                fcntl.flock(lock, fcntl.LOCK_EX)
+            except OSError:
+                lock.close()
+                return None
+            try:
+                if os.fstat(lock.fileno()).st_ino == os.stat(lock_path).st_ino:
+                    return lock
+            except OSError:
+                pass
+            lock.close()
+
+    def _merge_into(self, path: str) -> Optional[str]:
+        try:
+            with open(path) as f:
+                previous = json.load(f)
+        except (OSError, json.JSONDecodeError):
+            previous = {}
+
+        if self.format == 'chrome':
+            events = previous.get('traceEvents', []) if isinstance(previous, dict) else []
+            document = {'traceEvents': events + self.chrome_events(), 'displayTimeUnit': 'ms'}
+        else:
+            document = self.summary(previous if isinstance(previous, dict) and 'commands' in previous else None)
+
+        tmp_path = f"{path}.{self.pid}.tmp"
+        try:
+            with open(tmp_path, 'w') as f:
+                json.dump(document, f, indent=2)
+                f.write('\n')
+            os.replace(tmp_path, path)
+        except OSError as e:
+            print(f"Warning: could not write gh trace {path}: {e}", file=sys.stderr)
+            return None
+        finally:
+            if os.path.exists(tmp_path):
+                os.unlink(tmp_path)
+        return path
+
+
+class GHResponseCache:
+    """
+    TTL-bounded, size-bounded on-disk cache of gh command output.
+
+    Entries are keyed by the normalized command line. Only read-only
+    commands listed in TTLS are cached, each with its own time to live.
+    Running a mutation through run_gh_command() drops the cached reads it
+    affects (see INVALIDATES), scoped to the same project when the scope
+    is known. Least recently used entries are evicted once the cache grows
+    past max_entries or max_bytes. A hit records its access time in
+    memory only; those times are folded into the index by the next put(),
+    so reads never rewrite index.json.
+
+    The cache is on by default (GH_PROJECT_CACHE=0 turns it off) and the
+    root is .gh-project-cache in the current directory unless
+    GH_PROJECT_CACHE_DIR says otherwise; that directory belongs in the
+    .gitignore of repositories the helpers run in.
+
+    Layout:
+        <root>/responses/index.json   entry metadata
+        <root>/responses/<key>.out    raw command output
+    """
+
+    ROOT_DIR = '.gh-project-cache'
+
+    # Seconds each read-only command stays fresh
+    TTLS = {
+        'project list': 300,
+        'project view': 300,
+        'project field-list': 3600,
+        'project item-list': 60,
+    }
+
+    # Cached command families dropped after each mutation
+    INVALIDATES = {
+        'project create': ('project list',),
+        'project copy': ('project list',),
+        'project edit': ('project list', 'project view'),
+        'project close': ('project list', 'project view'),
+        'project delete': ('project list', 'project view', 'project field-list', 'project item-list'),
+        'project link': ('project view',),
+        'project unlink': ('project view',),
+        'project field-create': ('project field-list', 'project view'),
+        'project field-delete': ('project field-list', 'project view', 'project item-list'),
+        'project item-add': ('project item-list', 'project view'),
+        'project item-create': ('project item-list', 'project view'),
+        'project item-edit': ('project item-list',),
+        'project item-archive': ('project item-list', 'project view'),
+        'project item-delete': ('project item-list', 'project view'),
+    }
+
+    _default = None
+
+    def __init__(self, root: Union[str, Path, None] = None, max_entries: int = 500,
+                 max_bytes: int = 64 * 1024 * 1024):
+        self.root = Path(root or os.environ.get('GH_PROJECT_CACHE_DIR') or self.ROOT_DIR)
+        self.dir = self.root / 'responses'
+        self.index_path = self.dir / 'index.json'
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        # Access times of hits not yet written to the index
+        self._accessed: Dict[str, float] = {}
+
+    @classmethod
+    def default(cls) -> 'GHResponseCache':
+        """Return the process-wide cache instance."""
+        if cls._default is None:
+            cls._default = cls()
+        return cls._default
+
+    @staticmethod
+    def enabled() -> bool:
+        """Whether caching is enabled (GH_PROJECT_CACHE is not '0')."""
+        return os.environ.get('GH_PROJECT_CACHE', '1') != '0'
+
+    @staticmethod
+    def parse_command(command: str) -> Dict[str, Any]:
+        """
+        Normalize a gh command line.
+
+        Args:
+            command: Command line, with or without the leading 'gh'
+
+        Returns:
+            Dict with 'argv' (normalized tokens), 'family' (e.g. 'project item-list')
+            and 'scope' ('owner:number', a project id, or None)
+        """
+        tokens = shlex.split(command)
+        if tokens and tokens[0] == 'gh':
+            tokens = tokens[1:]
+
+        # --flag=value and --flag value are the same command
+        argv = []
+        for token in tokens:
+            if token.startswith('--') and '=' in token:
+                argv.extend(token.split('=', 1))
+            else:
+                argv.append(token)
+
+        positionals = []
+        options = {}
+        i = 0
+        while i < len(argv):
+            token = argv[i]
+            if token.startswith('-'):
+                if i + 1 < len(argv) and not argv[i + 1].startswith('-'):
+                    options[token] = argv[i + 1]
+                    i += 1
+                else:
+                    options[token] = True
+            else:
+                positionals.append(token)
+            i += 1
+
+        family = ' '.join(positionals[:2])
+        scope = None
+        if '--project-id' in options:
+            scope = str(options['--project-id'])
+        elif len(positionals) > 2:
+            scope = f"{options.get('--owner', '@me')}:{positionals[2]}"
+
+        return {'argv': argv, 'family': family, 'scope': scope}
+
+    @staticmethod
+    def cache_key(command: str) -> str:
+        """Return the cache key for a command line."""
+        argv = GHResponseCache.parse_command(command)['argv']
+        return hashlib.sha256(json.dumps(argv).encode('utf-8')).hexdigest()[:32]
+
+    def _load_index(self) -> Dict[str, Dict]:
+        try:
+            with open(self.index_path) as f:
+                return json.load(f)
+        except (OSError, json.JSONDecodeError):
+            return {}
+
+    def _save_index(self, index: Dict[str, Dict]) -> None:
+        self.dir.mkdir(parents=True, exist_ok=True)
+        tmp_path = self.index_path.with_name(self.index_path.name + f'.{os.getpid()}.tmp')
+        with open(tmp_path, 'w') as f:
+            json.dump(index, f)
+        os.replace(tmp_path, self.index_path)
+
+    def _drop(self, index: Dict[str, Dict], key: str) -> None:
+        index.pop(key, None)
+        self._accessed.pop(key, None)
+        try:
+            (self.dir / f'{key}.out').unlink()
+        except OSError:
+            pass
+
+    def get(self, command: str) -> Optional[str]:
+        """
+        Return cached output for a command if present and fresh.
+
+        Args:
+            command: Full gh command line
+
+        Returns:
+            Raw command output, or None on a miss
+        """
+        parsed = self.parse_command(command)
+        if parsed['family'] not in self.TTLS:
+            return None
+
+        key = self.cache_key(command)
+        index = self._load_index()
+        entry = index.get(key)
+        if entry is None:
+            return None
+
+        now = time.time()
+        try:
+            if entry['expires'] <= now:
+                raise OSError('expired')
+            with open(self.dir / f'{key}.out', encoding='utf-8') as f:
+                output = f.read()
+        except OSError:
+            self._drop(index, key)
+            self._save_index(index)
+            return None
+
+        self._accessed[key] = now
+        return output
+
+    def put(self, command: str, output: str, ttl: Optional[float] = None) -> bool:
+        """
+        Store command output if the command is cacheable.
+
+        Args:
+            command: Full gh command line
+            output: Raw command output
+            ttl: Override the per-command time to live (seconds)
+
+        Returns:
+            True if the output was cached
+        """
+        parsed = self.parse_command(command)
+        ttl = ttl if ttl is not None else self.TTLS.get(parsed['family'])
+        if not ttl:
+            return False
+
+        key = self.cache_key(command)
+        self.dir.mkdir(parents=True, exist_ok=True)
+        with open(self.dir / f'{key}.out', 'w', encoding='utf-8') as f:
+            f.write(output)
+
+        now = time.time()
+        index = self._load_index()
+        for hit, accessed in self._accessed.items():
+            if hit in index:
+                index[hit]['accessed'] = max(index[hit]['accessed'], accessed)
+        self._accessed.clear()
+        index[key] = {
+            'command': ' '.join(parsed['argv']),
+            'family': parsed['family'],
+            'scope': parsed['scope'],
+            'size': len(output.encode('utf-8')),
+            'expires': now + ttl,
+            'accessed': now,
+        }
+        self._evict(index, now)
+        self._save_index(index)
+        return True
+
+    def _evict(self, index: Dict[str, Dict], now: float) -> None:
+        for key in [key for key, entry in index.items() if entry['expires'] <= now]:
+            self._drop(index, key)
+
+        total = sum(entry['size'] for entry in index.values())
+        for key in sorted(index, key=lambda k: index[k]['accessed']):
+            if len(index) <= self.max_entries and total <= self.max_bytes:
+                break
+            total -= index[key]['size']
+            self._drop(index, key)
+
+    def invalidate(self, families: Optional[Iterable[str]] = None, scope: Optional[str] = None) -> int:
+        """
+        Drop cached entries.
+
+        Args:
+            families: Only drop these command families (default: all)
+            scope: Only drop entries for this project scope; entries with an
+                   unknown scope are always dropped (default: all scopes)
+
+        Returns:
+            Number of entries dropped
+        """
+        families = set(families) if families is not None else None
+        index = self._load_index()
+        dropped = [key for key, entry in index.items()
+                   if (families is None or entry['family'] in families)
+                   and (scope is None or entry['scope'] in (scope, None))]
+        for key in dropped:
+            self._drop(index, key)
+        if dropped:
+            self._save_index(index)
+        return len(dropped)
+
+    @classmethod
+    def invalidate_for(cls, command: str) -> int:
+        """
+        Drop cached reads affected by a mutation command.
+
+        Project ids and owner:number scopes cannot be matched against each
+        other, so a mutation scoped by --project-id drops the affected
+        families for every project.
+
+        Args:
+            command: Full gh command line that was just run
+
+        Returns:
+            Number of entries dropped
+        """
+        parsed = cls.parse_command(command)
+        families = cls.INVALIDATES.get(parsed['family'])
+        if not families:
+            return 0
+
+        scope = parsed['scope']
+        if scope is not None and ':' not in scope:
+            scope = None
+
+        dropped = cls.default().invalidate(families, scope)
+        if 'project field-list' in families:
+            FieldSchemaCache.default().invalidate()
+        return dropped
+
+    def stats(self) -> Dict[str, Any]:
+        """Return entry counts and sizes per command family."""
+        index = self._load_index()
+        now = time.time()
+        families = {}
+        for entry in index.values():
+            family = families.setdefault(entry['family'], {'entries': 0, 'bytes': 0, 'fresh': 0})
+            family['entries'] += 1
+            family['bytes'] += entry['size']
+            family['fresh'] += entry['expires'] > now
+        return {
+            'dir': str(self.dir),
+            'entries': len(index),
+            'bytes': sum(entry['size'] for entry in index.values()),
+            'families': families,
+        }
+
+
+class FieldSchemaCache:
+    """
+    Persisted per-project map of field names to field ids and option ids.
+
+    Each project's map is built once from gh project field-list with
+    GHProjectHelpers.build_field_map() and stored under
+    <root>/fields/. Lookups are dict hits; an unknown field or option
+    name triggers one refresh in case the schema changed.
+    """
+
+    TTL = GHResponseCache.TTLS['project field-list']
+
+    _default = None
+
+    def __init__(self, root: Union[str, Path, None] = None):
+        self.root = Path(root or os.environ.get('GH_PROJECT_CACHE_DIR') or GHResponseCache.ROOT_DIR)
+        self.dir = self.root / 'fields'
+        self._maps: Dict[str, Dict] = {}
+
+    @classmethod
+    def default(cls) -> 'FieldSchemaCache':
+        """Return the process-wide schema cache instance."""
+        if cls._default is None:
+            cls._default = cls()
+        return cls._default
+
+    def _path(self, owner: str, project: Union[int, str]) -> Path:
+        name = hashlib.sha256(f'{owner}:{project}'.encode('utf-8')).hexdigest()[:16]
+        return self.dir / f'{name}.json'
+
+    def fields(self, owner: str, project: Union[int, str], refresh: bool = False) -> Dict[str, Dict]:
+        """
+        Return the field map for a project, fetching it if stale or missing.
+
+        Args:
+            owner: Project owner
+            project: Project number
+            refresh: Ignore any cached map
+
+        Returns:
+            Dict as returned by GHProjectHelpers.build_field_map()
+        """
+        key = f'{owner}:{project}'
+        path = self._path(owner, project)
+
+        if not refresh:
+            cached = self._maps.get(key)
+            if cached is None:
+                try:
+                    with open(path) as f:
+                        cached = json.load(f)
+                except (OSError, json.JSONDecodeError):
+                    cached = None
+            if cached is not None and cached.get('fetched', 0) + self.TTL > time.time():
+                self._maps[key] = cached
+                return cached['fields']
+
+        data = GHProjectHelpers.run_gh_command(
+            f"project field-list {project} --owner {shlex.quote(owner)}", use_cache=False)
+        fields = data.get('fields', data) if isinstance(data, dict) else data
+        cached = {'owner': owner, 'project': str(project), 'fetched': time.time(),
+                  'fields': GHProjectHelpers.build_field_map(fields)}
+
+        self.dir.mkdir(parents=True, exist_ok=True)
+        tmp_path = path.with_name(path.name + f'.{os.getpid()}.tmp')
+        with open(tmp_path, 'w') as f:
+            json.dump(cached, f)
+        os.replace(tmp_path, path)
+
+        self._maps[key] = cached
+        return cached['fields']
+
+    def field(self, owner: str, project: Union[int, str], field_name: str) -> Optional[Dict]:
+        """Return {'id', 'dataType', 'options'} for a field, or None."""
+        field = self.fields(owner, project).get(field_name)
+        if field is None:
+            field = self.fields(owner, project, refresh=True).get(field_name)
+        return field
+
+    def option_id(self, owner: str, project: Union[int, str], field_name: str,
+                  option_name: str) -> Optional[str]:
+        """Return the option id of a single-select value, or None."""
+        field = self.field(owner, project, field_name)
+        if field is None:
+            return None
+        if option_name not in field['options']:
+            field = self.fields(owner, project, refresh=True).get(field_name) or field
+        return field['options'].get(option_name)
+
+    def invalidate(self) -> None:
+        """Forget all cached field maps."""
+        self._maps.clear()
+        if self.dir.exists():
+            for path in self.dir.glob('*.json'):
+                path.unlink()
+
+
+class ItemsBinaryCache:
+    """
+    Parsed copy of an items JSON export, stored next to it in marshal form.
+
+    The cache at <source>.ghsnap holds two sections: the ProjectItemStore
+    state (field code arrays, value tables and display columns) and the
+    complete decoded item list, in chunks of CHUNK_ITEMS items. Counting
+    and display commands load only the columnar section, which takes
+    milliseconds; commands that emit whole items stream the item chunks,
+    which skips JSON decoding.
+
+    The header carries the source's absolute path, size, mtime and
+    SHA-256. The cache is used only when path and size match and either
+    the mtime matches or, after a touch or a rewrite with the same
+    content, the content hash still does; anything else (including a
+    copy of the source under another path) falls back to the JSON file.
+
+    The first complete read of an export of at least BUILD_MIN_BYTES
+    through iter_items() writes its cache on the way; the 'cache-items'
+    command builds one ahead of time. Set GH_PROJECT_SNAPSHOT=0 to
+    neither use nor write caches.
+
+    File layout:
+        MAGIC, header length (4 bytes, little endian), marshal(header dict),
+        marshal(store state), marshal(list of item dicts) per chunk
+        (byte lengths in the header's 'chunks')
+    """
+
+    MAGIC = b'GHSNAP3\n'
+    SUFFIX = '.ghsnap'
+    CHUNK_ITEMS = 1000
+    BUILD_MIN_BYTES = 1 << 20
+
+    @staticmethod
+    def enabled() -> bool:
+        return os.environ.get('GH_PROJECT_SNAPSHOT', '1') != '0'
+
+    @classmethod
+    def cache_path(cls, source: Union[str, Path]) -> Path:
+        """Path of the binary cache for a source file."""
+        source = Path(source)
+        return source.with_name(source.name + cls.SUFFIX)
+
+    @staticmethod
+    def file_hash(path: Union[str, Path]) -> str:
+        """SHA-256 of a file's contents."""
+        digest = hashlib.sha256()
+        with open(path, 'rb') as f:
+            for block in iter(lambda: f.read(1 << 20), b''):
+                digest.update(block)
+        return digest.hexdigest()
+
+    @classmethod
+    def _read_header(cls, f) -> Optional[Dict[str, Any]]:
+        if f.read(len(cls.MAGIC)) != cls.MAGIC:
+            return None
+        length = int.from_bytes(f.read(4), 'little')
+        header = marshal.loads(f.read(length))
+        return header if isinstance(header, dict) else None
+
+    @classmethod
+    def read_header(cls, source: Union[str, Path]) -> Optional[Dict[str, Any]]:
+        """Return the header of a source's cache, or None if there is no readable cache."""
+        try:
+            with open(cls.cache_path(source), 'rb') as f:
+                return cls._read_header(f)
+        except (OSError, EOFError, ValueError, TypeError):
+            return None
+
+    @classmethod
+    def is_current(cls, header: Optional[Dict[str, Any]], source: Union[str, Path]) -> bool:
+        """Whether a cache header still describes the source file (path, size, then mtime or hash)."""
+        if header is None:
+            return False
+        try:
+            stat = os.stat(source)
+            if header.get('source') != str(Path(source).resolve()) or header.get('size') != stat.st_size:
+                return False
+            return header.get('mtime_ns') == stat.st_mtime_ns or header.get('sha256') == cls.file_hash(source)
+        except OSError:
+            return False
+
+    @staticmethod
+    def _decode(data: bytes) -> Any:
+        # Every container allocated would otherwise trigger cyclic GC
+        # passes over the growing data; none of it can be part of a
+        # cycle, so pause collection while decoding
+        gc_was_enabled = gc.isenabled()
+        gc.disable()
+        try:
+            return marshal.loads(data)
+        finally:
+            if gc_was_enabled:
+                gc.enable()
+
+    @classmethod
+    def _open(cls, source: Union[str, Path]):
+        # The cache file positioned after a current header, with the header; else None
+        if not cls.enabled():
+            return None
+        try:
+            f = open(cls.cache_path(source), 'rb')
+        except OSError:
+            return None
+        try:
+            header = cls._read_header(f)
+            if cls.is_current(header, source):
+                return f, header
+        except (OSError, EOFError, ValueError, TypeError):
+            pass
+        f.close()
+        return None
+
+    @classmethod
+    def _iter_chunks(cls, f, header: Dict[str, Any]) -> Iterator[Dict]:
+        with f:
+            try:
+                f.seek(header['store_bytes'], os.SEEK_CUR)
+                for length in header['chunks']:
+                    chunk = cls._decode(f.read(length))
+                    yield from chunk
+            except (OSError, EOFError, ValueError, TypeError, KeyError) as e:
+                raise GHProjectError(f"Corrupt snapshot {f.name}: {e}; rebuild it with cache-items")
+
+    @classmethod
+    def iter_cached(cls, source: Union[str, Path]) -> Optional[Iterator[Dict]]:
+        """
+        Stream the cached items for a source file if the cache is current.
+
+        Items are decoded one chunk (CHUNK_ITEMS items) at a time.
+
+        Args:
+            source: Path of the items JSON file
+
+        Returns:
+            Iterator over item dicts, or None when the caller should parse the JSON
+        """
+        opened = cls._open(source)
+        return cls._iter_chunks(*opened) if opened else None
+
+    @classmethod
+    def load(cls, source: Union[str, Path]) -> Optional[List[Dict]]:
+        """
+        Return the cached items for a source file if the cache is current.
+
+        Args:
+            source: Path of the items JSON file
+
+        Returns:
+            List of item dicts, or None when the caller should parse the JSON
+        """
+        items = cls.iter_cached(source)
+        try:
+            return list(items) if items is not None else None
+        except GHProjectError:
+            return None
+
+    @classmethod
+    def load_store(cls, source: Union[str, Path]) -> Optional['ProjectItemStore']:
+        """
+        Return a ProjectItemStore for a source file if the cache is current.
+
+        Args:
+            source: Path of the items JSON file
+
+        Returns:
+            ProjectItemStore, or None when the caller should read the items
+        """
+        opened = cls._open(source)
+        if not opened:
+            return None
+        f, header = opened
+        try:
+            with f:
+                state = cls._decode(f.read(header['store_bytes']))
+        except (OSError, EOFError, ValueError, TypeError, KeyError):
+            return None
+        return ProjectItemStore.from_state(state) if isinstance(state, dict) else None
+
+    @classmethod
+    def should_build(cls, source: Union[str, Path]) -> bool:
+        """Whether reading source in full should write its cache (enabled, and at least BUILD_MIN_BYTES)."""
+        try:
+            return cls.enabled() and os.stat(source).st_size >= cls.BUILD_MIN_BYTES
+        except OSError:
+            return False
+
+    @classmethod
+    def write_through(cls, source: Union[str, Path], items: Iterable[Dict], strict: bool = False,
+                      summary: Optional[Dict[str, Any]] = None) -> Iterator[Dict]:
+        """
+        Yield items unchanged while writing the binary cache of source.
+
+        Items are buffered one chunk at a time. The cache is written
+        (atomically, through a per-process temp file) only once the items
+        run out, so an abandoned iteration leaves no cache behind.
+
+        Args:
+            source: Path of the items JSON file the items were read from
+            items: The source's items, in file order
+            strict: Raise on write errors instead of leaving the source uncached
+            summary: Dict to fill with the cache path, item count and sizes
+
+        Yields:
+            The input items
+
+        Raises:
+            GHProjectError: If strict and the cache cannot be written
+        """
+        source = Path(source)
+        path = cls.cache_path(source)
+        tmp_path = path.with_name(path.name + f'.{os.getpid()}.tmp')
+        chunks_path = path.with_name(path.name + f'.{os.getpid()}.chunks')
+        try:
+            stat = source.stat()
+            header = {'version': 3, 'source': str(source.resolve()), 'size': stat.st_size,
+                      'mtime_ns': stat.st_mtime_ns, 'sha256': cls.file_hash(source)}
+            chunks = open(chunks_path, 'wb')
+        except OSError as e:
+            if strict:
+                raise GHProjectError(f"Could not write snapshot {path}: {e}")
+            yield from items
+            return
+
+        store = ProjectItemStore()
+        lengths = []
+        try:
+            with chunks:
+                iterator = iter(items)
+                while True:
+                    chunk = list(islice(iterator, cls.CHUNK_ITEMS))
+                    if not chunk:
+                        break
+                    for item in chunk:
+                        store.append(item)
+                    # Encoded before the caller sees (and may modify) the items
+                    data = marshal.dumps(chunk)
+                    if chunks is not None:
+                        try:
+                            chunks.write(data)
+                            lengths.append(len(data))
+                        except OSError as e:
+                            if strict:
+                                raise GHProjectError(f"Could not write snapshot {path}: {e}")
+                            chunks = None
+                    yield from chunk
+                if chunks is None:
+                    return
+
+            store_bytes = marshal.dumps(store.to_state())
+            header.update(count=len(store), store_bytes=len(store_bytes), chunks=lengths)
+            header_bytes = marshal.dumps(header)
+            with open(tmp_path, 'wb') as f, open(chunks_path, 'rb') as chunk_data:
+                f.write(cls.MAGIC + len(header_bytes).to_bytes(4, 'little') + header_bytes)
+                f.write(store_bytes)
+                shutil.copyfileobj(chunk_data, f)
+            os.replace(tmp_path, path)
+        except (OSError, ValueError) as e:
+            if strict:
+                raise GHProjectError(f"Could not write snapshot {path}: {e}")
+            return
+        finally:
+            for leftover in (chunks_path, tmp_path):
+                if leftover.exists():
+                    leftover.unlink()
+
+        if summary is not None:
+            summary.update(source=str(source), cache=str(path), items=len(store),
+                           source_bytes=header['size'], snapshot_bytes=path.stat().st_size)
+
+    @classmethod
+    def build(cls, source: Union[str, Path]) -> Dict[str, Any]:
+        """
+        Parse a source file and write its binary cache.
+
+        Args:
+            source: Path of the items JSON file
+
+        Returns:
+            Summary with the cache path, item count and sizes
+
+        Raises:
+            GHProjectError: If the source cannot be parsed or the cache cannot be written
+        """
+        summary: Dict[str, Any] = {}
+        items = GHProjectHelpers.iter_items(source, use_cache=False)
+        for _ in cls.write_through(source, items, strict=True, summary=summary):
+            pass
+        return summary
+
+    @classmethod
+    def status(cls, source: Union[str, Path]) -> Dict[str, Any]:
+        """Report whether a source file has a current binary cache (reads only the header)."""
+        header = cls.read_header(source)
+        return {'source': str(source), 'cache': str(cls.cache_path(source)),
+                'exists': header is not None,
+                'current': cls.enabled() and cls.is_current(header, source),
+                'items': header.get('count') if header else None}
+
+
+class SnapshotStore:
+    """
+    Storage shared by the local snapshots kept under the cache directory.
+
+    Each snapshot has a directory named after its (owner, key) pair below
+    <root>/<SUBDIR>, holding items.json ({"items": [...]}, as read by
+    iter_items()) and state.json (watermark and sync settings). Both are
+    written through per-process temp files and os.replace(), items first,
+    so readers never see a partial file and a crash in between only costs
+    a redundant refetch. Subclasses define SUBDIR and their own sync().
+    """
+
+    SUBDIR = 'snapshots'
+
+    def __init__(self, root: Union[str, Path, None] = None):
+        self.root = Path(root or os.environ.get('GH_PROJECT_CACHE_DIR') or GHResponseCache.ROOT_DIR)
+
+    @staticmethod
+    def now() -> str:
+        """Current local time as an ISO 8601 string, as recorded in state.json."""
+        return datetime.now().astimezone().isoformat(timespec='seconds')
+
+    def dir(self, owner: str, key: Union[int, str]) -> Path:
+        safe = ''.join(ch if ch.isalnum() or ch in '-_.' else '_' for ch in f'{owner}-{key}')
+        return self.root / self.SUBDIR / safe
+
+    def items_path(self, owner: str, key: Union[int, str]) -> Path:
+        """Path of the snapshot items file."""
+        return self.dir(owner, key) / 'items.json'
+
+    def load_state(self, owner: str, key: Union[int, str]) -> Dict[str, Any]:
+        """Return the sync state of a snapshot ({} if it was never synced)."""
+        try:
+            with open(self.dir(owner, key) / 'state.json') as f:
+                return json.load(f)
+        except (OSError, json.JSONDecodeError):
+            return {}
+
+    def _read(self, owner: str, key: Union[int, str], missing: str) -> Iterator[Dict]:
+        # Stream a snapshot's items; missing is the error for a snapshot never synced
+        path = self.items_path(owner, key)
+        if not path.exists():
+            raise GHProjectError(missing)
+        return GHProjectHelpers.iter_items(path)
+
+    def _write(self, owner: str, key: Union[int, str], items: Iterable[Dict], state: Dict[str, Any]) -> int:
+        directory = self.dir(owner, key)
+        directory.mkdir(parents=True, exist_ok=True)
+        suffix = f'.{os.getpid()}.tmp'
+
+        items_path = directory / 'items.json'
+        tmp_path = items_path.with_name(items_path.name + suffix)
+        count = 0
+        with open(tmp_path, 'w', encoding='utf-8') as out:
+            out.write('{"items": [')
+            for item in items:
+                out.write(',\n' if count else '\n')
+                out.write(json.dumps(item))
+                count += 1
+            out.write(f'\n], "totalCount": {count}}}\n')
+
+        state['count'] = count
+        state_path = directory / 'state.json'
+        state_tmp_path = state_path.with_name(state_path.name + suffix)
+        with open(state_tmp_path, 'w') as f:
+            json.dump(state, f, indent=2)
+
+        # Items first, then state, so a crash in between only causes a redundant refetch
+        os.replace(tmp_path, items_path)
+        os.replace(state_tmp_path, state_path)
+        return count
+
+
+class ProjectSnapshotStore(SnapshotStore):
+    """
+    Local snapshot of a project's items, kept current by delta syncs.
+
+    The first sync pulls every item. Later syncs page through the project
+    fetching only item ids and the updatedAt of each item and of its
+    linked issue or pull request, then fetch full data just for items
+    that are new or changed since the last watermark, merge them in
+    and record items that disappeared as removals.
+
+    Layout (one directory per project):
+        <root>/snapshots/<owner>-<number>/items.json   {"items": [...]} as read by iter_items()
+        <root>/snapshots/<owner>-<number>/state.json   watermark, projection, removals
+    """
+
+    # Removal records kept in state.json
+    MAX_REMOVALS = 1000
+
+    @staticmethod
+    def parse_ref(ref: str) -> tuple:
+        """
+        Split an 'OWNER/NUMBER' snapshot reference.
+
+        Examples:
+            'my-org/3' -> ('my-org', 3)
+            '@me/12' -> ('@me', 12)
+        """
+        owner, sep, number = ref.rpartition('/')
+        if not sep or not owner or not number.isdigit():
+            raise GHProjectError(f"Invalid snapshot reference (expected OWNER/NUMBER): {ref}")
+        return owner, int(number)
+
+    @staticmethod
+    def changed_at(item: Dict) -> str:
+        """Latest of the item's and its content's updatedAt ('' if neither is known)."""
+        return max(item.get('updatedAt') or '', (item.get('content') or {}).get('updatedAt') or '')
+
+    def iter_items(self, owner: str, number: int) -> Iterator[Dict]:
+        """
+        Stream the items of a synced snapshot.
+
+        Raises:
+            GHProjectError: If the project has not been synced
+        """
+        return self._read(owner, number, f"No snapshot for {owner}/{number}; run sync first")
+
+    def sync(self, owner: str, number: int, fields: Optional[List[str]] = None,
+             content: Optional[List[str]] = None, full: bool = False) -> Dict[str, Any]:
+        """
+        Bring the local snapshot of a project up to date.
+
+        Args:
+            owner: Project owner ('@me', organization or user login)
+            number: Project number
+            fields: Field projection for a new snapshot (kept for later syncs)
+            content: Content projection for a new snapshot (kept for later syncs)
+            full: Refetch every item even if a snapshot exists
+
+        Returns:
+            Dict with 'mode', 'fetched', 'added', 'updated', 'removed', 'count' and 'watermark'
+        """
+        state = self.load_state(owner, number)
+        items_path = self.items_path(owner, number)
+        now = self.now()
+
+        if state and not full:
+            fields, content = state.get('fields'), state.get('content')
+
+        if full or not state or not items_path.exists():
+            items = []
+            for page in GHProjectHelpers.iter_project_item_pages(owner, number, fields, content):
+                items.extend(page['items'])
+
+            watermark = max((self.changed_at(item) for item in items), default='')
+            new_state = {'owner': owner, 'number': number, 'fields': fields, 'content': content,
+                         'watermark': watermark, 'synced_at': now, 'removals': state.get('removals', [])}
+
+            tracker = ProjectVelocityTracker(self.dir(owner, number))
+            present = {item['id'] for item in items}
+            transitions = tracker.update(items, tracker.item_ids() - present, now, items)
+
+            count = self._write(owner, number, items, new_state)
+            return {'mode': 'full', 'fetched': len(items), 'added': len(items), 'updated': 0,
+                    'removed': 0, 'count': count, 'watermark': watermark, 'transitions': transitions}
+
+        watermark = state.get('watermark') or ''
+
+        # Cheap scan: ids and the item's and its content's updatedAt, in project
+        # order. Editing, commenting on or closing the linked issue does not
+        # move the item's own updatedAt, so both are compared.
+        order = []
+        changed = []
+        scanned_watermark = watermark
+        for page in GHProjectHelpers.iter_project_item_pages(owner, number, [], ['updatedAt']):
+            for item in page['items']:
+                order.append(item['id'])
+                stamp = self.changed_at(item)
+                # >= so items updated in the same second as the watermark are not missed
+                if stamp >= watermark:
+                    changed.append(item['id'])
+                    scanned_watermark = max(scanned_watermark, stamp)
+
+        current = {item['id']: item for item in GHProjectHelpers.iter_items(items_path)}
+        changed.extend(item_id for item_id in order if item_id not in current and item_id not in changed)
+
+        fetched = {item['id']: item for item in GHProjectHelpers.fetch_items_by_id(changed, fields, content)}
+
+        present = set(order)
+        removed = [item_id for item_id in current if item_id not in present]
+        added = sum(1 for item_id in fetched if item_id not in current)
+
+        removals = state.get('removals', []) + [{'id': item_id, 'removed_at': now} for item_id in removed]
+        for item in fetched.values():
+            current[item['id']] = item
+
+        new_watermark = max([scanned_watermark] + [self.changed_at(item) for item in fetched.values()])
+        state.update(watermark=new_watermark, synced_at=now, removals=removals[-self.MAX_REMOVALS:])
+
+        transitions = ProjectVelocityTracker(self.dir(owner, number)).update(
+            fetched.values(), removed, now, (current[item_id] for item_id in order if item_id in current))
+
+        count = self._write(owner, number, (current[item_id] for item_id in order if item_id in current), state)
+        return {'mode': 'delta', 'fetched': len(fetched), 'added': added, 'updated': len(fetched) - added,
+                'removed': len(removed), 'count': count, 'watermark': new_watermark, 'transitions': transitions}
+
+
+class IssueSnapshotStore(SnapshotStore):
+    """
+    Local snapshot of a repository's issues and pull requests, for joining
+    labels, bodies and state onto project items.
+
+    Project item exports carry neither labels nor bodies, so triage would
+    otherwise need one gh issue view per item. One paginated GraphQL scan
+    (100 issues per request) fills the snapshot; later syncs read issues
+    newest-updated first and stop at the watermark, so they cost a request
+    or two. Issues deleted or transferred away are only dropped by a full
+    sync.
+
+    Layout (one directory per repository, see SnapshotStore):
+        <root>/issues/<owner>-<name>/items.json   {"items": [...]} issue records
+        <root>/issues/<owner>-<name>/state.json   watermark, projection
+
+    Example:
+        store = IssueSnapshotStore()
+        store.sync('my-org/app')
+        index = store.index(['my-org/app'])
+        for item in IssueSnapshotStore.join(project_items, index):
+            ...  # items now carry content labels, body and state
+    """
+
+    SUBDIR = 'issues'
+    PAGE_SIZE = 100
+    MAX_LABELS = 50
+
+    CONNECTIONS = {'issues': ('Issue', 'states: [OPEN, CLOSED]'),
+                   'pullRequests': ('PullRequest', 'states: [OPEN, CLOSED, MERGED]')}
+
+    @staticmethod
+    def parse_repo(repo: str) -> tuple:
+        """
+        Split an OWNER/NAME repository reference (URLs are accepted).
+
+        Examples:
+            'my-org/app' -> ('my-org', 'app')
+            'https://github.com/my-org/app' -> ('my-org', 'app')
+        """
+        if repo.startswith('http'):
+            repo = repo.split('github.com/')[-1]
+        parts = repo.strip('/').split('/')
+        if len(parts) < 2 or not parts[0] or not parts[1]:
+            raise GHProjectError(f"Invalid repository (expected OWNER/NAME): {repo}")
+        return parts[0], parts[1]
+
+    def iter_items(self, owner: str, name: str) -> Iterator[Dict]:
+        """
+        Stream the issue records of a synced repository.
+
+        Raises:
+            GHProjectError: If the repository has not been synced
+        """
+        return self._read(owner, name, f"No issue snapshot for {owner}/{name}; run issue-snapshot first")
+
+    @classmethod
+    def build_query(cls, connection: str, body: bool = True) -> str:
+        """GraphQL query for one page of issues or pull requests, newest-updated first."""
+        states = cls.CONNECTIONS[connection][1]
+        return f"""query($owner: String!, $name: String!, $first: Int!, $after: String) {{
+  rateLimit {{ remaining resetAt }}
+  repository(owner: $owner, name: $name) {{
+    {connection}(first: $first, after: $after, {states}, orderBy: {{field: UPDATED_AT, direction: DESC}}) {{
+      totalCount
+      pageInfo {{ hasNextPage endCursor }}
+      nodes {{ number title url state updatedAt{' body' if body else ''} labels(first: {cls.MAX_LABELS}) {{ nodes {{ name }} }} }}
+    }}
+  }}
+}}"""
+
+    @classmethod
+    def iter_repository_issues(cls, owner: str, name: str, connection: str = 'issues', body: bool = True,
+                               since: Optional[str] = None) -> Iterator[Dict]:
+        """
+        Page through a repository's issues or pull requests.
+
+        Args:
+            owner: Repository owner
+            name: Repository name
+            connection: 'issues' or 'pullRequests'
+            body: Fetch bodies (the bulk of the payload)
+            since: Stop at the first record updated before this timestamp
+
+        Yields:
+            Flat records: number, title, url, state, updatedAt, labels, type, repository and body
+        """
+        query = cls.build_query(connection, body)
+        variables = {'owner': owner, 'name': name, 'first': cls.PAGE_SIZE, 'after': None}
+        item_type = cls.CONNECTIONS[connection][0]
+
+        while True:
+            data = GHProjectHelpers.run_gh_graphql(query, variables)
+            page = ((data.get('repository') or {}).get(connection)) or {}
+            for node in page.get('nodes') or []:
+                if not node:
+                    continue
+                # Newest first: >= so records updated in the watermark's second are kept
+                if since and (node.get('updatedAt') or '') < since:
+                    return
+                record = {key: node.get(key) for key in ('number', 'title', 'url', 'state', 'updatedAt')}
+                record.update(type=item_type, repository=f'{owner}/{name}',
+                              labels=[label['name'] for label in (node.get('labels') or {}).get('nodes') or []
+                                      if label])
+                if body:
+                    record['body'] = node.get('body') or ''
+                yield record
+            page_info = page.get('pageInfo') or {}
+            if not page_info.get('hasNextPage'):
+                return
+            variables['after'] = page_info.get('endCursor')
+
+    def sync(self, repo: str, full: bool = False, pull_requests: bool = True,
+             body: bool = True) -> Dict[str, Any]:
+        """
+        Bring the issue snapshot of a repository up to date.
+
+        Args:
+            repo: OWNER/NAME
+            full: Refetch everything even if a snapshot exists
+            pull_requests: Also snapshot pull requests (projects often hold both)
+            body: Store bodies; the projection is kept for later syncs
+
+        Returns:
+            Dict with 'repo', 'mode', 'fetched', 'added', 'updated', 'count' and 'watermark'
+        """
+        owner, name = self.parse_repo(repo)
+        state = self.load_state(owner, name)
+        items_path = self.items_path(owner, name)
+        delta = bool(state) and not full and items_path.exists()
+        if delta:
+            pull_requests, body = state.get('pull_requests', True), state.get('body', True)
+
+        watermark = state.get('watermark') if delta else None
+        connections = ['issues', 'pullRequests'] if pull_requests else ['issues']
+        fetched = {}
+        for connection in connections:
+            for record in self.iter_repository_issues(owner, name, connection, body, watermark):
+                fetched[record['url']] = record
+
+        current = {record['url']: record for record in self.iter_items(owner, name)} if delta else {}
+        added = sum(1 for url in fetched if url not in current)
+        current.update(fetched)
+
+        new_watermark = max([watermark or ''] + [record.get('updatedAt') or '' for record in fetched.values()])
+        new_state = {'repo': f'{owner}/{name}', 'pull_requests': pull_requests, 'body': body,
+                     'watermark': new_watermark,
+                     'synced_at': self.now()}
+        count = self._write(owner, name, current.values(), new_state)
+        return {'repo': f'{owner}/{name}', 'mode': 'delta' if delta else 'full', 'fetched': len(fetched),
+                'added': added, 'updated': len(fetched) - added, 'count': count, 'watermark': new_watermark}
+
+    def index(self, repos: List[str]) -> Dict[str, Any]:
+        """
+        Load issue snapshots into join tables.
+
+        Returns:
+            {'url': {url: record}, 'number': {(repo, number): record}, 'repos': [...]}
+        """
+        by_url, by_number, names = {}, {}, []
+        for repo in repos:
+            owner, name = self.parse_repo(repo)
+            names.append(f'{owner}/{name}'.lower())
+            for record in self.iter_items(owner, name):
+                by_url[record['url']] = record
+                by_number[(names[-1], record['number'])] = record
+        return {'url': by_url, 'number': by_number, 'repos': names}
+
+    @staticmethod
+    def join(items: Iterable[Dict], index: Dict[str, Any]) -> Iterator[Dict]:
+        """
+        Hash-join project items with issue snapshots.
+
+        Items are matched on content URL, then on (repository, number);
+        items without a repository match on number alone when a single
+        repository is joined. Matched items are yielded as copies whose
+        content carries the issue's labels, state and body (values the
+        item already has win); others are yielded unchanged.
+
+        Args:
+            items: Iterable of project items
+            index: Join tables from index()
+
+        Yields:
+            Project items, enriched where a match was found
+        """
+        by_url, by_number = index['url'], index['number']
+        single = index['repos'][0] if len(index['repos']) == 1 else None
+
+        for item in items:
+            content = item.get('content') or {}
+            record = by_url.get(content.get('url'))
+            if record is None and content.get('number') is not None:
+                repository = content.get('repository')
+                if isinstance(repository, dict):
+                    repository = repository.get('nameWithOwner')
+                repository = repository.lower() if isinstance(repository, str) else single
+                record = by_number.get((repository, content.get('number')))
+            if record is None:
+                yield item
+                continue
+
+            enriched = dict(content)
+            for key in ('labels', 'state', 'body'):
+                if not enriched.get(key) and key in record:
+                    enriched[key] = record[key]
+            yield {**item, 'content': enriched}
+
+
+class ProjectVelocityTracker:
+    """
+    Status transition history and rolling velocity counters for a snapshot.
+
+    Every sync reports the items it fetched and the ids that disappeared.
+    Status changes are appended to transitions.jsonl and folded into
+    per-day and per-week counters as they happen, so velocity reports
+    read a small precomputed file instead of replaying history.
+
+    Files (next to the snapshot's items.json):
+        transitions.jsonl   [timestamp, item id, from status, to status] rows
+        status-state.json   item id -> [status, entered at, first seen]
+        velocity.json       counters per day/week, current WIP, burndown
+
+    Counters per period: opened, done (moved into a done status),
+    reopened, removed, transitions, cycle time (first seen -> done) and
+    time spent in each status (credited when an item leaves it).
+    Transitions are dated by the item's updatedAt, the closest record of
+    when the change happened. Items without a Status are tracked as
+    'Unset'; only ids a sync reports as removed leave the history. The
+    first sync only sets the baseline. Items already in the project at
+    the baseline, or first seen already done, have no observed start, so
+    they count towards throughput but not towards cycle time.
+    """
+
+    DONE_STATUSES = ('Done',)
+    DAYS_KEPT = 400
+    WEEKS_KEPT = 156
+
+    def __init__(self, directory: Union[str, Path], done_statuses: Optional[List[str]] = None):
+        self.directory = Path(directory)
+        env_statuses = os.environ.get('GH_PROJECT_DONE_STATUSES')
+        self.done_statuses = set(done_statuses or (env_statuses.split(',') if env_statuses else self.DONE_STATUSES))
+        self.current: Optional[Dict[str, list]] = None
+        self.velocity: Dict[str, Any] = {}
+
+    @staticmethod
+    def status_of(item: Dict) -> Optional[str]:
+        status = GHProjectHelpers.get_item_field_values(item).get('Status')
+        return GHProjectHelpers.display_value(status) if status is not None else None
+
+    @staticmethod
+    def period_keys(timestamp: str) -> tuple:
+        """Return the ('YYYY-MM-DD', 'YYYY-Www') UTC period keys of a timestamp."""
+        moment = GHProjectHelpers.parse_timestamp(timestamp).astimezone(timezone.utc)
+        year, week, _ = moment.isocalendar()
+        return moment.strftime('%Y-%m-%d'), f'{year}-W{week:02d}'
+
+    def load_velocity(self) -> Dict[str, Any]:
+        """Return the precomputed counters ({} before the first sync)."""
+        try:
+            with open(self.directory / 'velocity.json') as f:
+                return json.load(f)
+        except (OSError, json.JSONDecodeError):
+            return {}
+
+    def _load(self) -> None:
+        if self.current is not None:
+            return
+        self.velocity = self.load_velocity()
+        try:
+            with open(self.directory / 'status-state.json') as f:
+                self.current = json.load(f)
+        except (OSError, json.JSONDecodeError):
+            self.current = {}
+            self.velocity = {}
+
+    def item_ids(self) -> set:
+        """Ids of the items the history currently tracks."""
+        self._load()
+        return set(self.current)
+
+    def _bucket(self, period: str, key: str) -> Dict[str, Any]:
+        buckets = self.velocity.setdefault(period, {})
+        bucket = buckets.get(key)
+        if bucket is None:
+            bucket = buckets[key] = {'opened': 0, 'done': 0, 'reopened': 0, 'removed': 0, 'transitions': 0,
+                                     'cycle_seconds': 0.0, 'cycle_count': 0, 'status_seconds': {}}
+        return bucket
+
+    def _count(self, timestamp: str, name: str, amount: float = 1) -> None:
+        for period, key in zip(('daily', 'weekly'), self.period_keys(timestamp)):
+            self._bucket(period, key)[name] += amount
+
+    def _apply(self, item_id: str, status: Optional[str], timestamp: str, log: List[list]) -> None:
+        # status None means the item was removed from the project
+        previous = self.current.get(item_id)
+        if previous is None and status is None:
+            return
+        if previous is not None and previous[0] == status:
+            return
+
+        log.append([timestamp, item_id, previous[0] if previous else None, status])
+        wip = self.velocity['wip']
+        is_done = status in self.done_statuses
+
+        if previous is None:
+            self._count(timestamp, 'opened')
+            first_seen = timestamp
+            if is_done:
+                self._count(timestamp, 'done')
+        else:
+            old_status, entered, first_seen = previous
+            wip[old_status] = wip.get(old_status, 0) - 1
+            if not wip[old_status]:
+                del wip[old_status]
+
+            moment = GHProjectHelpers.parse_timestamp(timestamp)
+            spent = max(0.0, (moment - GHProjectHelpers.parse_timestamp(entered)).total_seconds())
+            for period, key in zip(('daily', 'weekly'), self.period_keys(timestamp)):
+                bucket = self._bucket(period, key)
+                bucket['transitions'] += 1
+                totals = bucket['status_seconds'].setdefault(old_status, [0.0, 0])
+                totals[0] += spent
+                totals[1] += 1
+
+            was_done = old_status in self.done_statuses
+            if status is None:
+                self._count(timestamp, 'removed')
+            elif is_done and not was_done:
+                self._count(timestamp, 'done')
+                if first_seen:
+                    cycle = max(0.0, (moment - GHProjectHelpers.parse_timestamp(first_seen)).total_seconds())
+                    self._count(timestamp, 'cycle_seconds', cycle)
+                    self._count(timestamp, 'cycle_count')
+            elif was_done and not is_done:
+                self._count(timestamp, 'reopened')
+
+        if status is None:
+            del self.current[item_id]
+        else:
+            self.current[item_id] = [status, timestamp, first_seen]
+            wip[status] = wip.get(status, 0) + 1
+
+    def update(self, changed: Iterable[Dict], removed: Iterable[str], synced_at: str,
+               snapshot: Optional[Iterable[Dict]] = None) -> int:
+        """
+        Fold one sync into the history.
+
+        Args:
+            changed: Items fetched by the sync (new or updated)
+            removed: Ids of items no longer in the project
+            synced_at: Sync time (ISO 8601), used for removals and undated items
+            snapshot: Every item after the sync; seeds the baseline on the first call
+
+        Returns:
+            Number of status transitions recorded
+        """
+        self._load()
+        log: List[list] = []
+
+        if not self.velocity:
+            self.velocity = {'baseline': synced_at, 'done_statuses': sorted(self.done_statuses),
+                             'wip': {}, 'daily': {}, 'weekly': {}, 'burndown': {}}
+            for item in (snapshot if snapshot is not None else changed):
+                status = self.status_of(item) or 'Unset'
+                since = (item.get('content') or {}).get('updatedAt') or item.get('updatedAt') or synced_at
+                self.current[item['id']] = [status, since, None]
+                self.velocity['wip'][status] = self.velocity['wip'].get(status, 0) + 1
+        else:
+            for item in changed:
+                timestamp = item.get('updatedAt') or (item.get('content') or {}).get('updatedAt')
+                if GHProjectHelpers.parse_timestamp(timestamp) is None:
+                    timestamp = synced_at
+                self._apply(item['id'], self.status_of(item) or 'Unset', timestamp, log)
+            for item_id in removed:
+                self._apply(item_id, None, synced_at, log)
+
+        # Burndown: open (not done) and total items as of the day's last sync
+        total = sum(self.velocity['wip'].values())
+        done = sum(count for status, count in self.velocity['wip'].items() if status in self.done_statuses)
+        self.velocity['burndown'][self.period_keys(synced_at)[0]] = {'open': total - done, 'total': total}
+        self.velocity['updated'] = synced_at
+
+        for period, kept in (('daily', self.DAYS_KEPT), ('weekly', self.WEEKS_KEPT), ('burndown', self.DAYS_KEPT)):
+            buckets = self.velocity[period]
+            for key in sorted(buckets)[:-kept]:
+                del buckets[key]
+
+        self._save(log)
+        return len(log)
+
+    def _save(self, log: List[list]) -> None:
+        self.directory.mkdir(parents=True, exist_ok=True)
+        if log:
+            with open(self.directory / 'transitions.jsonl', 'a') as f:
+                for row in log:
+                    f.write(json.dumps(row) + '\n')
+        for name, value in (('status-state.json', self.current), ('velocity.json', self.velocity)):
+            path = self.directory / name
+            tmp_path = path.with_name(path.name + f'.{os.getpid()}.tmp')
+            with open(tmp_path, 'w') as f:
+                json.dump(value, f)
+            os.replace(tmp_path, path)
+
+    def report(self, period: str = 'week', last: int = 12) -> Dict[str, Any]:
         """
-        Parse project list JSON and return formatted project info.
+        Build a velocity report from the precomputed counters.
 
         Args:
-            json_data: Raw JSON string or parsed list
+            period: 'day' or 'week'
+            last: Number of most recent periods to include (gaps are zero-filled)
 
         Returns:
-            List of dicts with project info
+            Dict with 'periods' (opened, done, reopened, removed, transitions,
+            mean cycle days and mean days per status left), 'throughput'
+            (mean done per period, recent vs previous half and trend),
+            'wip' (current items per status) and 'burndown' (daily open/total)
         """
-        if isinstance(json_data, str):
-            data = json.loads(json_data)
-        else:
-            data = json_data
+        velocity = self.load_velocity()
+        if not velocity:
+            raise GHProjectError("No velocity history yet; run sync at least once")
 
-        projects = []
-        for project in data:
-            projects.append({
-                'number': project.get('number'),
-                'id': project.get('id'),
-                'title': project.get('title'),
-                'url': project.get('url'),
-                'created': project.get('createdAt'),
-                'updated': project.get('updatedAt')
+        buckets = velocity['daily' if period == 'day' else 'weekly']
+        end = GHProjectHelpers.parse_timestamp(velocity['updated']).astimezone(timezone.utc)
+        keys = []
+        for back in range(last - 1, -1, -1):
+            moment = end - timedelta(days=back if period == 'day' else 7 * back)
+            keys.append(self.period_keys(moment.isoformat())[0 if period == 'day' else 1])
+
+        periods = []
+        for key in keys:
+            bucket = buckets.get(key) or {}
+            periods.append({
+                'period': key,
+                'opened': bucket.get('opened', 0),
+                'done': bucket.get('done', 0),
+                'reopened': bucket.get('reopened', 0),
+                'removed': bucket.get('removed', 0),
+                'transitions': bucket.get('transitions', 0),
+                'cycle_days': (round(bucket['cycle_seconds'] / bucket['cycle_count'] / 86400, 2)
+                               if bucket.get('cycle_count') else None),
+                'days_in_status': {status: round(seconds / count / 86400, 2)
+                                   for status, (seconds, count) in (bucket.get('status_seconds') or {}).items()},
             })
 
-        return projects
+        done = [entry['done'] for entry in periods]
+        half = len(done) // 2
+        recent = sum(done[half:]) / max(1, len(done) - half)
+        previous = sum(done[:half]) / half if half else None
+        trend = 'flat'
+        if previous is not None and recent > previous * 1.1:
+            trend = 'up'
+        elif previous is not None and recent < previous * 0.9:
+            trend = 'down'
 
-    @staticmethod
-    def filter_items(items: List[Dict], filters: Dict[str, Any]) -> List[Dict]:
-        """
-        Filter project items based on field values.
+        burndown = velocity.get('burndown', {})
+        return {
+            'period': period,
+            'baseline': velocity.get('baseline'),
+            'updated': velocity.get('updated'),
+            'done_statuses': velocity.get('done_statuses'),
+            'periods': periods,
+            'throughput': {'mean_done': round(sum(done) / len(done), 2) if done else 0,
+                           'recent_mean_done': round(recent, 2),
+                           'previous_mean_done': round(previous, 2) if previous is not None else None,
+                           'trend': trend},
+            'wip': velocity.get('wip', {}),
+            'burndown': [{'date': day, **burndown[day]}
+                         for day in sorted(burndown)[-(last * 7 if period == 'week' else last):]],
+        }
 
-        Args:
-            items: List of project items
-            filters: Dict of field_name: expected_value pairs
 
-        Returns:
-            Filtered list of items
+class FilterExpression:
+    """
+    Compiled filter expression for project items.
 
-        Examples:
-            filter_items(items, {'Status': 'In Progress', 'Priority': 'P1'})
-            filter_items(items, {'Status': ['Backlog', 'Todo']})  # Multiple values
-        """
-        filtered = []
+    Grammar (keywords are case-insensitive):
+        expr       := term ('or' term)*
+        term       := factor ('and' factor)*
+        factor     := 'not' factor | '(' expr ')' | 'has' '(' NAME ')' | comparison
+        comparison := NAME OP VALUE | NAME ['not'] 'in' '(' VALUE (',' VALUE)* ')'
+        OP         := = | == | != | < | <= | > | >= | ~ (case-insensitive substring)
 
-        for item in items:
-            field_values = item.get('fieldValues', [])
-            matches = True
-
-            for field_name, expected_value in filters.items():
-                # Handle both single value and list of values
-                expected_values = expected_value if isinstance(expected_value, list) else [expected_value]
-
-                # Find the field value in this item
-                field_found = False
-                for field_val in field_values:
-                    if field_val.get('name') == field_name:
-                        actual_value = field_val.get('name') or field_val.get('text') or field_val.get('number')
-                        if actual_value in expected_values:
-                            field_found = True
-                            break
+    NAME is a project field ('Status', "Story Points") or one of the item
+    attributes updated, type, title, number, id, url, state, body, label.
+    label tests each of the item's labels: 'label = bug' matches items
+    with that label, 'label != bug' items without it. VALUE is a quoted
+    string, a bare word (P1, Todo), a number, a date (2024-01-31) or a
+    duration (12h, 7d, 2w). Comparing updated against a duration compares
+    the item's age: 'updated < 7d' means updated within the last 7 days,
+    'updated > 30d' means untouched for over 30 days.
 
-                if not field_found:
-                    matches = False
-                    break
+    Items without the named field match only != and 'not in'.
 
-            if matches:
-                filtered.append(item)
+    The text is parsed once into a tree of closures. When a
+    ProjectItemIndex is supplied, equality and 'in' terms at the top level
+    of the expression narrow the candidates through the index before the
+    full predicate runs.
 
-        return filtered
+    Example:
+        expr = FilterExpression('Status in ("Todo","Backlog") and Priority <= P1 '
+                                'and updated > 7d and not has(Assignee)')
+        stale_urgent = list(expr.filter(items))
+    """
 
-    @staticmethod
-    def filter_items_missing_field(items: List[Dict], field_name: str) -> List[Dict]:
-        """
-        Filter items that are missing a specific field value.
+    ATTRIBUTES = ('updated', 'type', 'title', 'number', 'id', 'url', 'state', 'body', 'label')
+    KEYWORDS = ('and', 'or', 'not', 'in', 'has')
+    DURATION_UNITS = {'m': 60, 'h': 3600, 'd': 86400, 'w': 7 * 86400}
 
-        Args:
-            items: List of project items
-            field_name: Name of the field to check
+    TOKEN_RE = re.compile(r"""
+        \s*(?:
+            (?P<string>"(?:[^"\\]|\\.)*"|'(?:[^'\\]|\\.)*')
+          | (?P<op><=|>=|!=|==|=|<|>|~)
+          | (?P<punct>[(),])
+          | (?P<word>[^\s"'(),<>=!~]+)
+        )""", re.VERBOSE)
 
-        Returns:
-            Items without the specified field set
-        """
-        missing = []
+    def __init__(self, text: str):
+        self.text = text
+        self._tokens = self._tokenize(text)
+        self._pos = 0
+        self._now = datetime.now().astimezone()
+        self.tree = self._parse_expr()
+        if self._pos < len(self._tokens):
+            self._error(f"Unexpected {self._tokens[self._pos][1]!r}")
+        self.predicate = self._compile(self.tree)
+        del self._tokens
 
-        for item in items:
-            field_values = item.get('fieldValues', [])
-            has_field = any(fv.get('name') == field_name for fv in field_values)
+    # -- parsing ---------------------------------------------------------
 
-            if not has_field:
-                missing.append(item)
+    def _error(self, message: str) -> None:
+        raise GHProjectError(f"Invalid filter expression: {message} in {self.text!r}")
 
-        return missing
+    def _tokenize(self, text: str) -> List[tuple]:
+        tokens = []
+        pos = 0
+        text = text.rstrip()
+        while pos < len(text):
+            match = self.TOKEN_RE.match(text, pos)
+            if not match or match.end() == pos:
+                self._error(f"Unexpected character at {pos}")
+            kind = match.lastgroup
+            value = match.group(kind)
+            if kind == 'string':
+                value = json.loads('"' + value[1:-1].replace('"', '\\"').replace("\\'", "'") + '"') \
+                    if value[0] == "'" else json.loads(value)
+            elif kind == 'word' and value.lower() in self.KEYWORDS:
+                kind, value = 'keyword', value.lower()
+            tokens.append((kind, value))
+            pos = match.end()
+        return tokens
 
-    @staticmethod
-    def extract_field_info(fields: List[Dict], field_name: str) -> Optional[Dict]:
-        """
-        Extract field ID and metadata for a specific field.
+    def _peek(self) -> tuple:
+        return self._tokens[self._pos] if self._pos < len(self._tokens) else (None, None)
 
-        Args:
-            fields: List of project fields from gh project field-list
-            field_name: Name of the field to find
+    def _accept(self, kind: str, value: Any = None) -> bool:
+        token_kind, token_value = self._peek()
+        if token_kind == kind and (value is None or token_value == value):
+            self._pos += 1
+            return True
+        return False
 
-        Returns:
-            Dict with field info or None if not found
+    def _expect(self, kind: str, value: Any = None) -> Any:
+        token_kind, token_value = self._peek()
+        if token_kind != kind or (value is not None and token_value != value):
+            self._error(f"Expected {value or kind}, got {token_value!r}")
+        self._pos += 1
+        return token_value
 
-        Example return:
-            {
-                'id': 'PVTF_...',
-                'name': 'Priority',
-                'dataType': 'SINGLE_SELECT',
-                'options': [
-                    {'id': 'abc123', 'name': 'P0'},
-                    {'id': 'def456', 'name': 'P1'}
-                ]
-            }
-        """
-        for field in fields:
-            if field.get('name') == field_name:
-                return {
-                    'id': field.get('id'),
-                    'name': field.get('name'),
-                    'dataType': field.get('dataType'),
-                    'options': field.get('options', [])
-                }
-        return None
+    def _parse_expr(self) -> tuple:
+        terms = [self._parse_term()]
+        while self._accept('keyword', 'or'):
+            terms.append(self._parse_term())
+        return terms[0] if len(terms) == 1 else ('or', terms)
 
-    @staticmethod
-    def get_option_id(field_info: Dict, option_name: str) -> Optional[str]:
-        """
-        Get the option ID for a single-select field value.
+    def _parse_term(self) -> tuple:
+        factors = [self._parse_factor()]
+        while self._accept('keyword', 'and'):
+            factors.append(self._parse_factor())
+        return factors[0] if len(factors) == 1 else ('and', factors)
 
-        Args:
-            field_info: Field info dict from extract_field_info()
-            option_name: Name of the option (e.g., 'P1', 'In Progress')
+    def _parse_factor(self) -> tuple:
+        if self._accept('keyword', 'not'):
+            return ('not', self._parse_factor())
+        if self._accept('punct', '('):
+            node = self._parse_expr()
+            self._expect('punct', ')')
+            return node
+        if self._accept('keyword', 'has'):
+            self._expect('punct', '(')
+            name = self._parse_name()
+            self._expect('punct', ')')
+            return ('has', name)
 
-        Returns:
-            Option ID string or None if not found
-        """
-        options = field_info.get('options', [])
-        for option in options:
-            if option.get('name') == option_name:
-                return option.get('id')
-        return None
+        name = self._parse_name()
+        negate = self._accept('keyword', 'not')
+        if self._accept('keyword', 'in'):
+            self._expect('punct', '(')
+            values = [self._parse_value()]
+            while self._accept('punct', ','):
+                values.append(self._parse_value())
+            self._expect('punct', ')')
+            node = ('in', name, values)
+            return ('not', node) if negate else node
+        if negate:
+            self._error("Expected 'in' after 'not'")
+
+        if self._peek()[0] != 'op':
+            self._error(f"Expected an operator after {name!r}, got {self._peek()[1]!r}")
+        op = self._expect('op')
+        return ('cmp', name, '=' if op == '==' else op, self._parse_value())
+
+    def _parse_name(self) -> str:
+        kind, value = self._peek()
+        if kind not in ('word', 'string'):
+            self._error(f"Expected a field name, got {value!r}")
+        self._pos += 1
+        return value
+
+    def _parse_value(self) -> Any:
+        kind, value = self._peek()
+        if kind == 'string':
+            self._pos += 1
+            return value
+        if kind != 'word':
+            self._error(f"Expected a value, got {value!r}")
+        self._pos += 1
+
+        if re.fullmatch(r'-?\d+', value):
+            return int(value)
+        if re.fullmatch(r'-?\d+\.\d*', value):
+            return float(value)
+        duration = re.fullmatch(r'(\d+)([mhdw])', value)
+        if duration:
+            return ('duration', int(duration.group(1)) * self.DURATION_UNITS[duration.group(2)])
+        return value
+
+    # -- compilation -----------------------------------------------------
+
+    def _getter(self, name: str):
+        if name == 'updated':
+            parse_time = GHProjectHelpers.parse_timestamp
+
+            def get_updated(values: Dict, item: Dict) -> Any:
+                return parse_time(item.get('updatedAt') or (item.get('content') or {}).get('updatedAt'))
+            return get_updated
+        if name in ('id',):
+            return lambda values, item: item.get('id')
+        if name == 'label':
+            return lambda values, item: GHProjectHelpers.get_item_labels(item)
+        if name in self.ATTRIBUTES:
+            key = name
+            return lambda values, item: (item.get('content') or {}).get(key)
+        return lambda values, item: values.get(name)
 
     @staticmethod
-    def group_items_by_field(items: List[Dict], field_name: str) -> Dict[str, List[Dict]]:
-        """
-        Group items by a field value (e.g., Status, Priority).
+    def _compare(actual: Any, op: str, expected: Any) -> bool:
+        if op == '~':
+            return str(expected).lower() in str(actual).lower()
+        if isinstance(actual, (int, float)) and isinstance(expected, str):
+            try:
+                expected = float(expected)
+            except ValueError:
+                actual = str(actual)
+        elif isinstance(expected, (int, float)) and not isinstance(actual, (int, float)):
+            try:
+                actual = float(actual)
+            except (TypeError, ValueError):
+                expected = str(expected)
+        if op == '=':
+            return actual == expected
+        if op == '!=':
+            return actual != expected
+        try:
+            if op == '<':
+                return actual < expected
+            if op == '<=':
+                return actual <= expected
+            if op == '>':
+                return actual > expected
+            return actual >= expected
+        except TypeError:
+            return False
 
-        Args:
-            items: List of project items
-            field_name: Name of field to group by
+    def _compile(self, node: tuple):
+        kind = node[0]
 
-        Returns:
-            Dict mapping field values to lists of items
+        if kind == 'and':
+            parts = [self._compile(child) for child in node[1]]
+            return lambda values, item: all(part(values, item) for part in parts)
+        if kind == 'or':
+            parts = [self._compile(child) for child in node[1]]
+            return lambda values, item: any(part(values, item) for part in parts)
+        if kind == 'not':
+            inner = self._compile(node[1])
+            return lambda values, item: not inner(values, item)
 
-        Example:
-            {
-                'In Progress': [item1, item2],
-                'Done': [item3, item4],
-                'Backlog': [item5]
-            }
-        """
-        groups = {}
+        name = node[1]
+        get = self._getter(name)
 
-        for item in items:
-            field_value = None
+        if name == 'label':
+            return self._compile_label(node, get)
 
-            for fv in item.get('fieldValues', []):
-                if fv.get('name') == field_name:
-                    field_value = fv.get('name') or fv.get('text') or str(fv.get('number', ''))
-                    break
+        if kind == 'has':
+            return lambda values, item: get(values, item) not in (None, '')
 
-            if field_value is None:
-                field_value = 'Unset'
+        if kind == 'in':
+            accepted = set(node[2]) | {str(value) for value in node[2]}
 
-            if field_value not in groups:
-                groups[field_value] = []
+            def match_in(values: Dict, item: Dict) -> bool:
+                actual = get(values, item)
+                return actual is not None and (actual in accepted or str(actual) in accepted)
+            return match_in
 
-            groups[field_value].append(item)
+        op, expected = node[2], node[3]
+        compare = self._compare
 
-        return groups
+        if name == 'updated':
+            now = self._now
+            if isinstance(expected, tuple):
+                # Durations compare age: 'updated < 7d' is "updated within 7 days"
+                seconds = expected[1]
+                age_op = {'<': '<', '<=': '<=', '>': '>', '>=': '>=', '=': '=', '!=': '!='}.get(op)
+                if age_op is None:
+                    self._error(f"Operator {op} cannot be used with a duration")
 
-    @staticmethod
-    def count_by_field(items: List[Dict], field_name: str) -> Dict[str, int]:
-        """
-        Count items by field value.
+                def match_age(values: Dict, item: Dict) -> bool:
+                    updated = get(values, item)
+                    if updated is None:
+                        return op == '!='
+                    return compare((now - updated).total_seconds(), age_op, seconds)
+                return match_age
 
-        Args:
-            items: List of project items
-            field_name: Name of field to count by
+            threshold = GHProjectHelpers.parse_timestamp(str(expected))
+            if threshold is None:
+                self._error(f"Expected a date or duration for updated, got {expected!r}")
 
-        Returns:
-            Dict mapping field values to counts
+            def match_time(values: Dict, item: Dict) -> bool:
+                updated = get(values, item)
+                if updated is None:
+                    return op == '!='
+                return compare(updated, op, threshold)
+            return match_time
+
+        if isinstance(expected, tuple):
+            self._error(f"Durations can only be compared with updated, not {name}")
+
+        def match(values: Dict, item: Dict) -> bool:
+            actual = get(values, item)
+            if actual is None:
+                return op == '!='
+            return compare(actual, op, expected)
+        return match
+
+    def _compile_label(self, node: tuple, get):
+        # Labels are a list: a term holds if any label satisfies it, and
+        # != holds if none equals the value
+        kind = node[0]
+        if kind == 'has':
+            return lambda values, item: bool(get(values, item))
+        if kind == 'in':
+            accepted = {str(value) for value in node[2]}
+            return lambda values, item: any(label in accepted for label in get(values, item))
+
+        op, expected = node[2], node[3]
+        if isinstance(expected, tuple):
+            self._error("Durations can only be compared with updated, not label")
+        expected = str(expected)
+        compare = self._compare
+        if op == '!=':
+            return lambda values, item: expected not in get(values, item)
+        return lambda values, item: any(compare(label, op, expected) for label in get(values, item))
+
+    # -- evaluation ------------------------------------------------------
+
+    def equality_terms(self) -> Dict[str, List[Any]]:
         """
-        groups = GHProjectHelpers.group_items_by_field(items, field_name)
-        return {key: len(value) for key, value in groups.items()}
+        Return field equality/'in' terms that every match must satisfy.
 
-    @staticmethod
-    def find_stale_items(items: List[Dict], days: int = 7, status_filter: Optional[List[str]] = None) -> List[Dict]:
+        Only terms joined by 'and' at the top level qualify; these are the
+        terms that can be pushed down to a ProjectItemIndex.
         """
-        Find items that haven't been updated in N days.
+        nodes = self.tree[1] if self.tree[0] == 'and' else [self.tree]
+        terms = {}
+        for node in nodes:
+            if node[0] == 'cmp' and node[2] == '=' and not isinstance(node[3], tuple):
+                name, values = node[1], [node[3]]
+            elif node[0] == 'in':
+                name, values = node[1], list(node[2])
+            else:
+                continue
+            if name in self.ATTRIBUTES:
+                continue
+            # The index holds raw values; accept both forms of numeric literals
+            values += [str(value) for value in values if not isinstance(value, str)]
+            if name in terms:
+                terms[name] = [value for value in terms[name] if value in values]
+            else:
+                terms[name] = values
+        return terms
+
+    def matches(self, item: Dict, values: Optional[Dict[str, Any]] = None) -> bool:
+        """
+        Test one item.
 
         Args:
-            items: List of project items
-            days: Number of days to consider stale
-            status_filter: Only check items with these statuses (optional)
+            item: Project item dict
+            values: Precomputed get_item_field_values(item) (optional)
+        """
+        if values is None:
+            values = GHProjectHelpers.get_item_field_values(item)
+        return self.predicate(values, item)
 
-        Returns:
-            List of stale items with additional metadata
+    def filter(self, items: Iterable[Dict], index: Optional['ProjectItemIndex'] = None) -> Iterator[Dict]:
         """
-        threshold = datetime.now() - timedelta(days=days)
-        stale = []
+        Yield the items matching the expression, in input order.
 
-        for item in items:
-            # Check status filter if provided
-            if status_filter:
-                item_status = None
-                for fv in item.get('fieldValues', []):
-                    if fv.get('name') == 'Status':
-                        item_status = fv.get('name')
-                        break
+        Args:
+            items: Iterable of project items (ignored when index is given)
+            index: ProjectItemIndex to push equality terms down to (optional)
+        """
+        if index is None:
+            for item in items:
+                if self.predicate(GHProjectHelpers.get_item_field_values(item), item):
+                    yield item
+            return
 
-                if item_status not in status_filter:
-                    continue
+        terms = self.equality_terms()
+        positions = index.query(terms) if terms else range(len(index))
+        for pos in positions:
+            if self.predicate(index.values[pos], index.items[pos]):
+                yield index.items[pos]
 
-            # Check update timestamp
-            updated_at_str = item.get('content', {}).get('updatedAt')
-            if not updated_at_str:
-                continue
 
-            try:
-                updated_at = datetime.fromisoformat(updated_at_str.replace('Z', '+00:00'))
-                if updated_at < threshold:
-                    days_stale = (datetime.now() - updated_at).days
-                    stale_item = item.copy()
-                    stale_item['days_stale'] = days_stale
-                    stale_item['last_updated'] = updated_at_str.split('T')[0]
-                    stale.append(stale_item)
-            except (ValueError, AttributeError):
-                continue
+class ItemPipeline:
+    """
+    Run several operations over one load of project items.
+
+    Each step names an operation and its parameters. Steps read the most
+    recent list-valued result (or an earlier one named with "from", or the
+    loaded "items"), so a filter followed by a count counts the filtered
+    items. Every step's result is stored under its "as" name (default: the
+    operation name, suffixed on repeats) and returned in one document.
+
+    Example:
+        pipeline = ItemPipeline([
+            {'op': 'filter', 'field': {'Status': ['Todo', 'In Progress']}, 'as': 'open'},
+            {'op': 'count', 'field': 'Priority'},
+            {'op': 'stale', 'days': 14, 'from': 'open'},
+            {'op': 'aggregate', 'from': 'items'},
+        ])
+        report = pipeline.run(GHProjectHelpers.iter_items('items.json'))
+    """
+
+    # op -> parameter name -> type used when parsing --op strings
+    OPERATIONS = {
+        'filter': {'field': 'filters', 'where': str, 'missing': str},
+        'count': {'field': str},
+        'aggregate': {'field': list, 'pivot': list, 'stale_days': 'ints', 'stale_status': list,
+                      'require': list},
+        'stale': {'days': int, 'status': list},
+        'stale-histogram': {'days': 'ints', 'status': list, 'by': str, 'top': int},
+        'missing': {'field': str},
+        'format': {'columns': list, 'limit': int},
+        'suggest-priority': {'only_missing': bool},
+        'total': {},
+    }
+    COMMON = {'as': str, 'from': str, 'emit': bool}
 
-        return stale
+    def __init__(self, steps: List[Dict[str, Any]]):
+        self.steps = []
+        names = {}
+        for number, step in enumerate(steps, 1):
+            op = step.get('op')
+            if op not in self.OPERATIONS:
+                raise GHProjectError(f"Pipeline step {number}: unknown op {op!r} "
+                                     f"(expected one of {', '.join(self.OPERATIONS)})")
+            unknown = set(step) - set(self.OPERATIONS[op]) - set(self.COMMON) - {'op'}
+            if unknown:
+                raise GHProjectError(f"Pipeline step {number} ({op}): unknown parameter(s) "
+                                     f"{', '.join(sorted(unknown))}")
+            name = step.get('as')
+            if name is None:
+                names[op] = names.get(op, 0) + 1
+                name = op if names[op] == 1 else f"{op}-{names[op]}"
+            self.steps.append(dict(step, **{'as': name}))
 
     @staticmethod
-    def format_item_for_display(item: Dict) -> Dict[str, str]:
+    def load_spec(path: str) -> List[Dict[str, Any]]:
         """
-        Format an item for human-readable display.
+        Load pipeline steps from a JSON or YAML spec file.
+
+        The spec is either a list of steps or an object with a "steps" list.
+        YAML needs PyYAML; JSON works with the standard library alone.
 
         Args:
-            item: Project item dict
+            path: Spec file path (.json, .yaml or .yml)
 
         Returns:
-            Dict with formatted fields
-        """
-        content = item.get('content', {})
+            List of step dicts
 
-        # Extract field values
-        status = None
-        priority = None
+        Raises:
+            GHProjectError: If the spec cannot be parsed
+        """
+        with open(path) as f:
+            text = f.read()
 
-        for fv in item.get('fieldValues', []):
-            if fv.get('name') == 'Status':
-                status = fv.get('name')
-            elif fv.get('name') == 'Priority':
-                priority = fv.get('name')
+        if path.endswith(('.yaml', '.yml')):
+            try:
+                import yaml
+            except ImportError:
+                raise GHProjectError("YAML pipeline specs need PyYAML (pip install pyyaml), or use JSON")
+            spec = yaml.safe_load(text)
+        else:
+            try:
+                spec = json.loads(text)
+            except json.JSONDecodeError as e:
+                raise GHProjectError(f"Invalid pipeline spec {path}: {e}")
 
-        return {
-            'id': item.get('id'),
-            'number': content.get('number', 'draft'),
-            'title': content.get('title', 'Untitled'),
-            'type': content.get('type', 'Unknown'),
-            'status': status or 'Unset',
-            'priority': priority or 'Unset',
-            'url': content.get('url', ''),
-            'updated': content.get('updatedAt', '').split('T')[0] if content.get('updatedAt') else ''
-        }
+        steps = spec.get('steps') if isinstance(spec, dict) else spec
+        if not isinstance(steps, list):
+            raise GHProjectError(f"Pipeline spec {path} must be a list of steps or have a 'steps' list")
+        return steps
 
-    @staticmethod
-    def extract_owner_from_repo(repo: str) -> str:
+    @classmethod
+    def parse_op(cls, text: str) -> Dict[str, Any]:
         """
-        Extract owner from repository string.
+        Parse a command-line step such as 'filter field=Status=Todo as=todo'.
+
+        The first word is the operation; the rest are key=value pairs.
+        Repeated keys collect into lists, and filter fields take NAME=VALUE
+        (repeat a name to accept several values).
 
         Args:
-            repo: Repository string (e.g., 'owner/repo', 'https://github.com/owner/repo')
+            text: Step string
 
         Returns:
-            Owner name
+            Step dict
 
-        Examples:
-            'owner/repo' -> 'owner'
-            'https://github.com/owner/repo' -> 'owner'
+        Example:
+            parse_op('stale days=14 status=Todo status="In Progress"')
+            # {'op': 'stale', 'days': 14, 'status': ['Todo', 'In Progress']}
         """
-        if '/' not in repo:
-            raise ValueError(f"Invalid repository format: {repo}")
+        words = shlex.split(text)
+        if not words:
+            raise GHProjectError("Empty --op")
+        op = words[0]
+        params = dict(cls.OPERATIONS.get(op, {}), **cls.COMMON)
+        step: Dict[str, Any] = {'op': op}
 
-        # Handle URL format
-        if repo.startswith('http'):
-            repo = repo.split('github.com/')[-1]
+        for word in words[1:]:
+            key, sep, value = word.partition('=')
+            key = key.replace('-', '_')
+            if not sep:
+                if params.get(key) is bool:
+                    step[key] = True
+                    continue
+                raise GHProjectError(f"--op {op}: expected key=value, got {word!r}")
+            kind = params.get(key, str)
 
-        # Extract owner
-        parts = repo.split('/')
-        return parts[0]
+            if kind == 'filters':
+                name, sep, expected = value.partition('=')
+                if not sep:
+                    raise GHProjectError(f"--op {op}: field needs NAME=VALUE, got {value!r}")
+                step.setdefault(key, {}).setdefault(name, []).append(expected)
+            elif kind in (list, 'ints'):
+                step.setdefault(key, []).append(int(value) if kind == 'ints' else value)
+            elif kind is int:
+                step[key] = int(value)
+            elif kind is bool:
+                step[key] = value.lower() in ('1', 'true', 'yes')
+            else:
+                step[key] = value
+        return step
 
-    @staticmethod
-    def suggest_priority(title: str, body: str = "", labels: List[str] = None) -> tuple[str, str]:
+    def run(self, items: Iterable[Dict]) -> Dict[str, Any]:
         """
-        Suggest a priority based on keywords in title, body, and labels.
+        Run every step over the items.
 
         Args:
-            title: Issue/item title
-            body: Issue/item body
-            labels: List of label names
+            items: Project items; consumed once and kept in memory for the run
 
         Returns:
-            Tuple of (priority, reason)
+            Dict with 'steps' (name, op, input and size per step) and
+            'results' (each step's output, unless the step set emit to false)
         """
-        if labels is None:
-            labels = []
+        helpers = GHProjectHelpers
+        results: Dict[str, Any] = {'items': items if isinstance(items, list) else list(items)}
+        index = None
+        current = 'items'
+        summary = []
+        emitted = {}
 
-        combined_text = f"{title} {body}".lower()
-        label_text = " ".join(labels).lower()
+        for step in self.steps:
+            op, name = step['op'], step['as']
+            source = step.get('from', current)
+            if source not in results:
+                raise GHProjectError(f"Pipeline step {name}: unknown input {source!r}")
+            data = results[source]
+            if not isinstance(data, list):
+                raise GHProjectError(f"Pipeline step {name}: input {source!r} is not a list of items")
 
-        # P0 indicators
-        p0_keywords = ['critical', 'blocking', 'urgent', 'security', 'production down',
-                       'data loss', 'outage', 'severe']
-        if any(kw in combined_text or kw in label_text for kw in p0_keywords):
-            return 'P0', 'Critical keywords detected (blocking, security, urgent)'
+            # The loaded items get one shared index for every filter that reads them
+            if source == 'items' and op in ('filter', 'missing') and index is None:
+                index = ProjectItemIndex(data)
+            step_index = index if source == 'items' else None
 
-        # P1 indicators
-        p1_keywords = ['bug', 'error', 'broken', 'failing', 'regression', 'important']
-        if any(kw in combined_text or kw in label_text for kw in p1_keywords):
-            return 'P1', 'Bug or high-priority keywords detected'
+            if op == 'filter':
+                # Only the first filter applied can use the index over the loaded items
+                output = data
+                if step.get('field'):
+                    output = helpers.filter_items(output, step['field'], step_index)
+                    step_index = None
+                if step.get('missing'):
+                    output = helpers.filter_items_missing_field(output, step['missing'], step_index)
+                    step_index = None
+                if step.get('where'):
+                    output = list(FilterExpression(step['where']).filter(output, step_index))
+                if output is data:
+                    output = list(data)
+            elif op == 'count':
+                output = helpers.count_by_field(data, step['field'])
+            elif op == 'aggregate':
+                pivot = step.get('pivot', ('Status', 'Priority'))
+                output = helpers.aggregate_items(data, step.get('field'), tuple(pivot) if pivot else None,
+                                                 step.get('stale_days'), step.get('stale_status'),
+                                                 step.get('require'))
+            elif op == 'stale':
+                output = list(helpers.iter_stale_items(data, step.get('days', 7), step.get('status')))
+            elif op == 'stale-histogram':
+                output = ProjectItemTimeline(data, step.get('by', 'Status')).histogram(
+                    step.get('days', [7, 14, 30]), step.get('status'), step.get('top', 0))
+            elif op == 'missing':
+                output = helpers.filter_items_missing_field(data, step['field'], step_index)
+            elif op == 'format':
+                rows = (helpers.format_item_for_display(item) for item in islice(data, step.get('limit')))
+                columns = step.get('columns')
+                output = [{column: row[column] for column in columns} for row in rows] if columns else list(rows)
+            elif op == 'suggest-priority':
+                output = list(helpers.suggest_priorities(data, only_missing=step.get('only_missing', False)))
+            else:
+                output = len(data)
 
-        # P2 indicators
-        p2_keywords = ['enhancement', 'feature', 'improve', 'add']
-        if any(kw in combined_text or kw in label_text for kw in p2_keywords):
-            return 'P2', 'Enhancement or feature keywords detected'
+            results[name] = output
+            # List results become the default input of the next step
+            if isinstance(output, list) and op not in ('format', 'suggest-priority'):
+                current = name
+            summary.append({'name': name, 'op': op, 'input': source,
+                            'size': len(output) if isinstance(output, (list, dict)) else output})
+            if step.get('emit', True):
+                emitted[name] = output
 
-        # Default to P3
-        return 'P3', 'Standard priority (no high-urgency indicators)'
+        return {'steps': summary, 'results': emitted}
 
 
 def main():
     """CLI interface for helper functions"""
     parser = argparse.ArgumentParser(description='GitHub Projects CLI Helper')
+    parser.add_argument('--trace', metavar='PATH',
+                        help='Record every gh call (latency, exit status, payload size) to PATH '
+                             '(same as GH_PROJECT_TRACE)')
+    parser.add_argument('--trace-format', choices=GHCallTracer.FORMATS,
+                        default=os.environ.get('GH_PROJECT_TRACE_FORMAT', 'summary'),
+                        help='summary (JSON latency histograms) or chrome (chrome://tracing file)')
     subparsers = parser.add_subparsers(dest='command', help='Command to execute')
 
     # Filter items command
     filter_parser = subparsers.add_parser('filter-items', help='Filter project items')
-    filter_parser.add_argument('items_file', help='JSON file with items')
+    filter_parser.add_argument('items_file', nargs='?', help='JSON file with items')
+    filter_parser.add_argument('--snapshot', metavar='OWNER/NUMBER', help='Read items from a synced snapshot')
+    filter_parser.add_argument('--where', metavar='EXPR',
+                               help='Filter expression, e.g. \'Status in ("Todo","Backlog") and '
+                                    'Priority <= P1 and updated > 7d and not has(Assignee)\'')
     filter_parser.add_argument('--field', action='append', nargs=2, metavar=('NAME', 'VALUE'),
-                               help='Field filter (can be used multiple times)')
+                               help='Field filter (can be used multiple times; '
+                                    'repeat a field name to match any of several values)')
+    filter_parser.add_argument('--issues', action='append', metavar='OWNER/REPO',
+                               help='Join labels, body and state from the issue snapshot of OWNER/REPO '
+                                    '(see issue-snapshot; can be used multiple times)')
+
+    # Sync command
+    sync_parser = subparsers.add_parser('sync', help='Sync a local snapshot of project items (delta after first run)')
+    sync_parser.add_argument('--owner', required=True, help='Project owner (@me, org or user)')
+    sync_parser.add_argument('--project', type=int, required=True, help='Project number')
+    sync_parser.add_argument('--field', action='append',
+                             help='Only keep this field value (first sync only; can be used multiple times)')
+    sync_parser.add_argument('--content', nargs='*', choices=GHProjectHelpers.CONTENT_FIELDS,
+                             help='Content attributes to keep (first sync only; default: all)')
+    sync_parser.add_argument('--full', action='store_true', help='Refetch every item')
+
+    # Issue snapshot command
+    issue_parser = subparsers.add_parser('issue-snapshot',
+                                         help='Sync a local snapshot of a repository\'s issues and pull requests')
+    issue_parser.add_argument('--repo', required=True, action='append',
+                              help='OWNER/REPO (can be used multiple times)')
+    issue_parser.add_argument('--full', action='store_true', help='Refetch everything')
+    issue_parser.add_argument('--no-pull-requests', action='store_true',
+                              help='Only snapshot issues (first sync only)')
+    issue_parser.add_argument('--no-body', action='store_true',
+                              help='Do not store bodies; keeps the snapshot small (first sync only)')
 
     # Extract field ID command
     field_parser = subparsers.add_parser('extract-field', help='Extract field information')
@@ -433,18 +5103,154 @@ def main():
 
     # Count items command
     count_parser = subparsers.add_parser('count-by-field', help='Count items by field value')
-    count_parser.add_argument('items_file', help='JSON file with items')
+    count_parser.add_argument('items_file', nargs='?', help='JSON file with items')
+    count_parser.add_argument('--snapshot', metavar='OWNER/NUMBER', help='Read items from a synced snapshot')
     count_parser.add_argument('--field', required=True, help='Field name to count by')
 
     # Find stale items command
     stale_parser = subparsers.add_parser('find-stale', help='Find stale items')
-    stale_parser.add_argument('items_file', help='JSON file with items')
+    stale_parser.add_argument('items_file', nargs='?', help='JSON file with items')
+    stale_parser.add_argument('--snapshot', metavar='OWNER/NUMBER', help='Read items from a synced snapshot')
     stale_parser.add_argument('--days', type=int, default=7, help='Days threshold')
     stale_parser.add_argument('--status', action='append', help='Filter by status')
 
+    # Stale histogram command
+    histogram_parser = subparsers.add_parser('stale-histogram',
+                                             help='Age distribution of items per Status')
+    histogram_parser.add_argument('items_file', nargs='?', help='JSON file with items')
+    histogram_parser.add_argument('--snapshot', metavar='OWNER/NUMBER', help='Read items from a synced snapshot')
+    histogram_parser.add_argument('--days', type=int, nargs='+', default=[7, 14, 30],
+                                  help='Age thresholds (default 7 14 30)')
+    histogram_parser.add_argument('--status', action='append', help='Only report this status')
+    histogram_parser.add_argument('--by', default='Status', help='Field to group by (default Status)')
+    histogram_parser.add_argument('--top', type=int, default=5,
+                                  help='Oldest items to list per group as {id, days_stale} (default 5)')
+
+    # Velocity command
+    velocity_parser = subparsers.add_parser('velocity',
+                                            help='Throughput, cycle time and burndown from sync history')
+    velocity_parser.add_argument('--snapshot', metavar='OWNER/NUMBER', required=True,
+                                 help='Synced snapshot to report on')
+    velocity_parser.add_argument('--period', choices=['day', 'week'], default='week', help='Bucket size')
+    velocity_parser.add_argument('--last', type=int, default=12, help='Number of periods (default 12)')
+
+    # Org report command
+    org_parser = subparsers.add_parser('org-report',
+                                       help='Aggregate every project of an owner in parallel (JSONL sections)')
+    org_owner = org_parser.add_mutually_exclusive_group(required=True)
+    org_owner.add_argument('--owner', help='Organization or user login (@me for yourself)')
+    org_owner.add_argument('--repo', help='OWNER/REPO; reports on the projects of its owner')
+    org_parser.add_argument('--workers', type=int, default=4, help='Projects processed at once (default 4)')
+    org_parser.add_argument('--source', choices=['fetch', 'sync', 'snapshot'], default='fetch',
+                            help='fetch items live, delta-sync local snapshots, or read snapshots as is')
+    org_parser.add_argument('--project', type=int, action='append',
+                            help='Only this project number (can be used multiple times)')
+    org_parser.add_argument('--limit', type=int, default=100, help='Maximum projects to list')
+    org_parser.add_argument('--include-closed', action='store_true', help='Also report on closed projects')
+    org_parser.add_argument('--field', action='append', help='Field to count by (default Status, Priority)')
+    org_parser.add_argument('--no-pivot', action='store_true', help='Skip the Status x Priority cross-tab')
+    org_parser.add_argument('--stale-days', type=int, nargs='+', help='Age thresholds (default 7 14 30)')
+    org_parser.add_argument('--require', action='append',
+                            help='Field whose absence is counted (default: the counted fields)')
+
+    # Aggregate command
+    aggregate_parser = subparsers.add_parser('aggregate',
+                                             help='Single-pass status report (counts, pivot, types, stale, missing)')
+    aggregate_parser.add_argument('items_file', nargs='?', help='JSON file with items')
+    aggregate_parser.add_argument('--snapshot', metavar='OWNER/NUMBER', help='Read items from a synced snapshot')
+    aggregate_parser.add_argument('--field', action='append',
+                                  help='Field to count by (can be used multiple times; default Status, Priority)')
+    aggregate_parser.add_argument('--pivot', nargs=2, metavar=('ROW', 'COLUMN'), default=['Status', 'Priority'],
+                                  help='Fields for the cross-tab (default Status Priority)')
+    aggregate_parser.add_argument('--no-pivot', action='store_true', help='Skip the cross-tab')
+    aggregate_parser.add_argument('--stale-days', type=int, nargs='+', help='Age thresholds (default 7 14 30)')
+    aggregate_parser.add_argument('--stale-status', action='append', help='Only age items with this status')
+    aggregate_parser.add_argument('--require', action='append',
+                                  help='Field whose absence is counted (default: the counted fields)')
+
+    # Pipeline command
+    pipeline_parser = subparsers.add_parser('pipeline',
+                                            help='Load items once and run several operations over them')
+    pipeline_parser.add_argument('items_file', nargs='?', help='JSON file with items')
+    pipeline_parser.add_argument('--snapshot', metavar='OWNER/NUMBER', help='Read items from a synced snapshot')
+    pipeline_parser.add_argument('--spec', help='JSON or YAML file with the list of steps')
+    pipeline_parser.add_argument('--op', action='append',
+                                 help='Step as "OP key=value ...", e.g. "filter field=Status=Todo" '
+                                      '(can be used multiple times; runs after --spec steps)')
+    pipeline_parser.add_argument('--issues', action='append', metavar='OWNER/REPO',
+                                 help='Join labels, body and state from the issue snapshot of OWNER/REPO '
+                                      '(see issue-snapshot; can be used multiple times)')
+
     # Format items command
     format_parser = subparsers.add_parser('format-items', help='Format items for display')
-    format_parser.add_argument('items_file', help='JSON file with items')
+    format_parser.add_argument('items_file', nargs='?', help='JSON file with items')
+    format_parser.add_argument('--snapshot', metavar='OWNER/NUMBER', help='Read items from a synced snapshot')
+    format_parser.add_argument('--columns', type=lambda text: [c.strip() for c in text.split(',') if c.strip()],
+                               help=f'Comma-separated columns to output (from {",".join(GHProjectHelpers.DISPLAY_COLUMNS)})')
+    format_parser.add_argument('--format', dest='output_format', choices=GHProjectHelpers.RENDER_FORMATS,
+                               default='json', help='Output format (default json)')
+    format_parser.add_argument('--limit', type=int, help='Stop after this many items')
+
+    # Fetch items command
+    fetch_parser = subparsers.add_parser('fetch-items',
+                                         help='Fetch all project items via paginated GraphQL')
+    fetch_parser.add_argument('--owner', required=True, help='Project owner (@me, org or user)')
+    fetch_parser.add_argument('--project', type=int, required=True, help='Project number')
+    fetch_parser.add_argument('--output', required=True, help='JSON file to write items to')
+    fetch_parser.add_argument('--field', action='append',
+                              help='Only fetch this field value (can be used multiple times)')
+    fetch_parser.add_argument('--content', nargs='*', choices=GHProjectHelpers.CONTENT_FIELDS,
+                              help='Content attributes to fetch (default: all)')
+    fetch_parser.add_argument('--for', dest='preset', choices=sorted(GHProjectHelpers.FETCH_PRESETS),
+                              help='Fetch only what this command needs')
+    fetch_parser.add_argument('--page-size', type=int, default=GHProjectHelpers.GRAPHQL_PAGE_SIZE,
+                              help='Items per request (max 100)')
+    fetch_parser.add_argument('--limit', type=int, help='Stop after this many items')
+
+    # Bulk edit command
+    bulk_parser = subparsers.add_parser('bulk-edit',
+                                        help='Update item fields from a JSONL file in batched GraphQL requests')
+    bulk_parser.add_argument('rows_file', help='JSONL file of {"item_id", "field", "value"[, "type"]} rows')
+    bulk_parser.add_argument('--project-id', required=True, help='Project node id (PVT_...)')
+    bulk_parser.add_argument('--fields-file', help='JSON file from gh project field-list')
+    bulk_parser.add_argument('--owner', help='Project owner (to fetch fields when --fields-file is not given)')
+    bulk_parser.add_argument('--project', help='Project number (to fetch fields when --fields-file is not given)')
+    bulk_parser.add_argument('--batch-size', type=int, default=50, help='Mutations per request')
+    bulk_parser.add_argument('--dry-run', action='store_true', help='Resolve rows without sending mutations')
+
+    # Batch gh command runner
+    batch_parser = subparsers.add_parser('gh-batch', help='Run many gh commands concurrently')
+    batch_parser.add_argument('commands_file',
+                              help='File with one gh command per line (string or JSON argv list)')
+    batch_parser.add_argument('--max-concurrency', type=int, default=8, help='Maximum processes in flight')
+    batch_parser.add_argument('--timeout', type=float, help='Per-call timeout in seconds')
+    batch_parser.add_argument('--raw', action='store_true', help='Do not add --format json')
+    batch_parser.add_argument('--as-completed', action='store_true',
+                              help='Print results as they finish instead of in input order')
+
+    # Rate limit command
+    subparsers.add_parser('rate-limit', help='Show remaining GitHub API budget')
+
+    # Resolve field command
+    resolve_parser = subparsers.add_parser('resolve-field',
+                                           help='Look up field and option ids from the schema cache')
+    resolve_parser.add_argument('--owner', required=True, help='Project owner')
+    resolve_parser.add_argument('--project', required=True, help='Project number')
+    resolve_parser.add_argument('--field', required=True, help='Field name')
+    resolve_parser.add_argument('--option', help='Single-select option name')
+
+    # Cache commands
+    subparsers.add_parser('cache-stats', help='Show gh response cache statistics')
+    cache_clear_parser = subparsers.add_parser('cache-clear', help='Clear cached gh responses')
+    cache_clear_parser.add_argument('--family', action='append',
+                                    help='Only clear this command family, e.g. "project item-list"')
+
+    # Binary items cache command
+    cache_items_parser = subparsers.add_parser('cache-items',
+                                               help='Cache a parsed binary copy of an items file next to it')
+    cache_items_parser.add_argument('items_file', nargs='+', help='JSON file(s) with items')
+    cache_items_parser.add_argument('--check', action='store_true',
+                                    help='Only report whether each cache is current')
 
     # Extract owner command
     owner_parser = subparsers.add_parser('extract-owner', help='Extract owner from repo string')
@@ -456,6 +5262,20 @@ def main():
     priority_parser.add_argument('--body', default='', help='Item body')
     priority_parser.add_argument('--labels', nargs='*', default=[], help='Item labels')
 
+    # Batch priority suggestion command
+    batch_priority_parser = subparsers.add_parser('suggest-priority-batch',
+                                                  help='Suggest priorities for all items (JSONL output)')
+    batch_priority_parser.add_argument('items_file', nargs='?', help='JSON file with items')
+    batch_priority_parser.add_argument('--snapshot', metavar='OWNER/NUMBER',
+                                       help='Read items from a synced snapshot')
+    batch_priority_parser.add_argument('--workers', type=int, default=1,
+                                       help='Worker processes for scoring; helps when items carry long bodies')
+    batch_priority_parser.add_argument('--only-missing', action='store_true',
+                                       help='Only score items without a Priority value')
+    batch_priority_parser.add_argument('--issues', action='append', metavar='OWNER/REPO',
+                                       help='Join labels, body and state from the issue snapshot of OWNER/REPO '
+                                            '(see issue-snapshot; can be used multiple times)')
+
     args = parser.parse_args()
 
     if not args.command:
@@ -463,20 +5283,53 @@ def main():
         return 1
 
     helpers = GHProjectHelpers()
+    if args.trace:
+        GHCallTracer.configure(args.trace, args.trace_format)
+
+    def open_items():
+        # Items come from a file argument or a synced snapshot,
+        # joined with issue snapshots when --issues is given
+        if getattr(args, 'snapshot', None):
+            items = ProjectSnapshotStore().iter_items(*ProjectSnapshotStore.parse_ref(args.snapshot))
+        elif not args.items_file:
+            raise GHProjectError("Provide an items file or --snapshot OWNER/NUMBER")
+        else:
+            items = helpers.iter_items(args.items_file)
+        if getattr(args, 'issues', None):
+            items = IssueSnapshotStore.join(items, IssueSnapshotStore().index(args.issues))
+        return items
+
+    def open_store():
+        # Columnar store from a binary cache, if the input has a current one
+        if getattr(args, 'snapshot', None):
+            path = ProjectSnapshotStore().items_path(*ProjectSnapshotStore.parse_ref(args.snapshot))
+        else:
+            path = args.items_file
+        return ItemsBinaryCache.load_store(path) if path else None
 
     try:
         if args.command == 'filter-items':
-            with open(args.items_file) as f:
-                data = json.load(f)
-
-            items = data.get('items', data) if isinstance(data, dict) else data
+            items = open_items()
 
+            # Repeating --field with the same name accepts any of the values
             filters = {}
-            if args.field:
-                filters = {name: value for name, value in args.field}
+            for name, value in args.field or []:
+                filters.setdefault(name, []).append(value)
+
+            if filters:
+                items = helpers.iter_filtered_items(items, filters)
+            if args.where:
+                items = FilterExpression(args.where).filter(items)
+            helpers.write_json_array(items)
+
+        elif args.command == 'sync':
+            summary = ProjectSnapshotStore().sync(args.owner, args.project, args.field, args.content, args.full)
+            print(json.dumps(summary, indent=2))
 
-            filtered = helpers.filter_items(items, filters)
-            print(json.dumps(filtered, indent=2))
+        elif args.command == 'issue-snapshot':
+            store = IssueSnapshotStore()
+            for repo in args.repo:
+                print(json.dumps(store.sync(repo, args.full, not args.no_pull_requests, not args.no_body)))
 
         elif args.command == 'extract-field':
             with open(args.fields_file) as f:
@@ -486,28 +5339,167 @@ def main():
             print(json.dumps(field_info, indent=2))
 
         elif args.command == 'count-by-field':
-            with open(args.items_file) as f:
-                data = json.load(f)
-
-            items = data.get('items', data) if isinstance(data, dict) else data
-            counts = helpers.count_by_field(items, args.field)
+            store = open_store()
+            if store is not None:
+                counts = store.count_by_field(args.field)
+            else:
+                counts = helpers.count_by_field(open_items(), args.field)
             print(json.dumps(counts, indent=2))
 
         elif args.command == 'find-stale':
-            with open(args.items_file) as f:
-                data = json.load(f)
-
-            items = data.get('items', data) if isinstance(data, dict) else data
-            stale = helpers.find_stale_items(items, args.days, args.status)
-            print(json.dumps(stale, indent=2))
+            store = open_store()
+            if store is not None:
+                # Ages come from the cached columns; only stale items are copied
+                timeline = ProjectItemTimeline.from_store(store)
+                items = list(open_items())
+                helpers.write_json_array(helpers.find_stale_items(items, args.days, args.status,
+                                                                  timeline=timeline))
+            else:
+                helpers.write_json_array(helpers.iter_stale_items(open_items(), args.days, args.status))
 
         elif args.command == 'format-items':
-            with open(args.items_file) as f:
-                data = json.load(f)
+            unknown = set(args.columns or ()) - set(helpers.DISPLAY_COLUMNS)
+            if unknown:
+                raise GHProjectError(f"Unknown column(s): {', '.join(sorted(unknown))} "
+                                     f"(available: {', '.join(helpers.DISPLAY_COLUMNS)})")
+            store = open_store()
+            if store is not None:
+                rows = (store.format_item_for_display(pos) for pos in range(len(store)))
+            else:
+                rows = (helpers.format_item_for_display(item) for item in open_items())
+            helpers.render_rows(rows, args.output_format, args.columns, args.limit)
+
+        elif args.command == 'fetch-items':
+            fields, content = args.field, args.content
+            if args.preset:
+                preset = helpers.FETCH_PRESETS[args.preset]
+                fields = fields or preset['fields']
+                content = content if content is not None else preset['content']
+
+            summary = helpers.fetch_project_items(args.owner, args.project, args.output,
+                                                  fields, content, args.page_size, args.limit)
+            print(json.dumps(summary, indent=2))
 
-            items = data.get('items', data) if isinstance(data, dict) else data
-            formatted = [helpers.format_item_for_display(item) for item in items]
-            print(json.dumps(formatted, indent=2))
+        elif args.command == 'bulk-edit':
+            fields, schema = None, None
+            if args.fields_file:
+                with open(args.fields_file) as f:
+                    fields = json.load(f)
+                fields = fields.get('fields', fields) if isinstance(fields, dict) else fields
+            elif args.owner and args.project:
+                # Resolved through FieldSchemaCache, which refetches on unknown names
+                schema = (args.owner, args.project)
+            else:
+                raise GHProjectError("bulk-edit needs --fields-file or --owner and --project")
+
+            def read_rows():
+                with open(args.rows_file) as f:
+                    for line in f:
+                        if line.strip():
+                            yield json.loads(line)
+
+            summary = {'rows': 0, 'ok': 0, 'failed': 0, 'requests': 0}
+            for result in helpers.bulk_update_fields(args.project_id, read_rows(), fields,
+                                                     args.batch_size, args.dry_run, schema):
+                summary['rows'] += 1
+                summary['ok' if result['ok'] else 'failed'] += 1
+                summary['requests'] = max(summary['requests'], result.get('request', 0))
+                print(json.dumps(result))
+            print(json.dumps({'summary': summary}))
+            if summary['failed']:
+                return 1
+
+        elif args.command == 'gh-batch':
+            commands = []
+            with open(args.commands_file) as f:
+                for line in f:
+                    line = line.strip()
+                    if line and not line.startswith('#'):
+                        commands.append(json.loads(line) if line.startswith('[') else line)
+
+            async def run_batch() -> int:
+                failed = 0
+                pending = {}
+                next_index = 0
+                async for result in helpers.iter_gh_commands(commands, args.max_concurrency,
+                                                             args.timeout, not args.raw):
+                    failed += not result['ok']
+                    if args.as_completed:
+                        print(json.dumps(result), flush=True)
+                        continue
+                    # Hold results back until every earlier command has finished
+                    pending[result['index']] = result
+                    while next_index in pending:
+                        print(json.dumps(pending.pop(next_index)), flush=True)
+                        next_index += 1
+                return failed
+
+            if asyncio.run(run_batch()):
+                return 1
+
+        elif args.command == 'rate-limit':
+            print(json.dumps(GHRequestScheduler.default().refresh_budget(), indent=2))
+
+        elif args.command == 'resolve-field':
+            schema = FieldSchemaCache.default()
+            field = schema.field(args.owner, args.project, args.field)
+            if field is None:
+                raise GHProjectError(f"Field not found: {args.field}")
+            result = {'field': args.field, 'id': field['id'], 'dataType': field['dataType']}
+            if args.option is not None:
+                result['option'] = args.option
+                result['optionId'] = schema.option_id(args.owner, args.project, args.field, args.option)
+            print(json.dumps(result, indent=2))
+
+        elif args.command == 'cache-stats':
+            print(json.dumps(GHResponseCache.default().stats(), indent=2))
+
+        elif args.command == 'cache-clear':
+            dropped = GHResponseCache.default().invalidate(args.family)
+            if not args.family:
+                FieldSchemaCache.default().invalidate()
+            print(json.dumps({'dropped': dropped}, indent=2))
+
+        elif args.command == 'stale-histogram':
+            timeline = ProjectItemTimeline(open_items(), args.by)
+            print(json.dumps(timeline.histogram(args.days, args.status, args.top), indent=2))
+
+        elif args.command == 'velocity':
+            store = ProjectSnapshotStore()
+            tracker = ProjectVelocityTracker(store.dir(*ProjectSnapshotStore.parse_ref(args.snapshot)))
+            print(json.dumps(tracker.report(args.period, args.last), indent=2))
+
+        elif args.command == 'org-report':
+            owner = args.owner or helpers.extract_owner_from_repo(args.repo)
+            failed = False
+            for section in helpers.org_report(owner, args.workers, args.source, args.field,
+                                              None if args.no_pivot else ('Status', 'Priority'),
+                                              args.stale_days, args.require, args.limit,
+                                              args.include_closed, args.project):
+                failed = failed or 'error' in section
+                print(json.dumps(section), flush=True)
+            if failed:
+                return 1
+
+        elif args.command == 'aggregate':
+            report = helpers.aggregate_items(open_items(), args.field,
+                                             None if args.no_pivot else tuple(args.pivot),
+                                             args.stale_days, args.stale_status, args.require)
+            print(json.dumps(report, indent=2))
+
+        elif args.command == 'pipeline':
+            steps = ItemPipeline.load_spec(args.spec) if args.spec else []
+            steps += [ItemPipeline.parse_op(op) for op in args.op or []]
+            if not steps:
+                raise GHProjectError("pipeline needs --spec or at least one --op")
+            print(json.dumps(ItemPipeline(steps).run(open_items()), indent=2))
+
+        elif args.command == 'cache-items':
+            for path in args.items_file:
+                if args.check:
+                    print(json.dumps(ItemsBinaryCache.status(path)))
+                else:
+                    print(json.dumps(ItemsBinaryCache.build(path)))
 
         elif args.command == 'extract-owner':
             owner = helpers.extract_owner_from_repo(args.repo)
@@ -517,6 +5509,10 @@ def main():
             priority, reason = helpers.suggest_priority(args.title, args.body, args.labels)
             print(json.dumps({'priority': priority, 'reason': reason}, indent=2))
 
+        elif args.command == 'suggest-priority-batch':
+            for result in helpers.suggest_priorities(open_items(), args.workers, only_missing=args.only_missing):
+                print(json.dumps(result))
+
         return 0
 
     except Exception as e:
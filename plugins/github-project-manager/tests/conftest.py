@@ -0,0 +1,61 @@
+"""
+Shared fixtures for the gh_project_helpers tests.
+
+Tests that talk to GitHub run against benchmarks/fake-gh/gh, which is put
+first on PATH and serves a SyntheticProject described by GH_FAKE_PROJECT.
+"""
+
+import json
+import os
+import sys
+from pathlib import Path
+
+import pytest
+
+PLUGIN_DIR = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(PLUGIN_DIR / 'helpers'))
+sys.path.insert(0, str(PLUGIN_DIR / 'benchmarks'))
+
+import gh_project_helpers  # noqa: E402
+
+FAKE_GH_DIR = PLUGIN_DIR / 'benchmarks' / 'fake-gh'
+NOW = '2026-01-01T00:00:00Z'
+
+
+@pytest.fixture(autouse=True)
+def isolated_state(tmp_path, monkeypatch):
+    """Keep caches, snapshots and process-wide singletons out of the working tree and between tests."""
+    monkeypatch.setenv('GH_PROJECT_CACHE_DIR', str(tmp_path / 'cache'))
+    monkeypatch.setenv('GH_RATE_LIMIT_RPS', '1000')
+    monkeypatch.delenv('GH_PROJECT_TRACE', raising=False)
+    for cls in (gh_project_helpers.GHRequestScheduler, gh_project_helpers.GHResponseCache,
+                gh_project_helpers.FieldSchemaCache, gh_project_helpers.GHCallTracer):
+        monkeypatch.setattr(cls, '_default', None)
+
+
+@pytest.fixture
+def fake_gh(tmp_path, monkeypatch):
+    """
+    Put the fake gh on PATH; returns a function that configures the served project
+    and a reader for the calls it received.
+    """
+    log = tmp_path / 'fake-gh.log'
+    monkeypatch.setenv('PATH', f"{FAKE_GH_DIR}{os.pathsep}{os.environ['PATH']}")
+    monkeypatch.setenv('GH_FAKE_LOG', str(log))
+
+    class FakeGH:
+        def project(self, **spec):
+            spec.setdefault('now', NOW)
+            monkeypatch.setenv('GH_FAKE_PROJECT', json.dumps(spec))
+            return self
+
+        def env(self, name, value):
+            monkeypatch.setenv(name, str(value))
+            return self
+
+        def calls(self):
+            if not log.exists():
+                return []
+            return [json.loads(line) for line in log.read_text().splitlines()]
+
+    return FakeGH().project(items=250)
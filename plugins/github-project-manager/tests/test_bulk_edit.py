@@ -0,0 +1,49 @@
+"""Tests for bulk_update_fields id resolution against the fake gh."""
+
+from gh_project_helpers import FieldSchemaCache, GHProjectHelpers
+
+
+def field_list_calls(fake_gh):
+    return [argv for argv in fake_gh.calls() if argv[:2] == ['project', 'field-list']]
+
+
+def test_new_option_refreshes_cached_schema(fake_gh):
+    # A schema cached before the 'Blocked' option was added
+    fake_gh.project(items=10, fields={'Status': 5, 'Priority': 4})
+    assert 'Blocked' not in FieldSchemaCache.default().fields('acme', 1)['Status']['options']
+    calls_before = len(field_list_calls(fake_gh))
+
+    fake_gh.project(items=10, fields={'Status': 6, 'Priority': 4})
+    rows = [{'item_id': 'PVTI_synthetic_1_0', 'field': 'Status', 'value': 'Blocked'},
+            {'item_id': 'PVTI_synthetic_1_1', 'field': 'Status', 'value': 'Todo'},
+            {'item_id': 'PVTI_synthetic_1_2', 'field': 'Status', 'value': 'Nonexistent'}]
+    results = sorted(GHProjectHelpers.bulk_update_fields('PVT_synthetic', rows, schema=('acme', 1)),
+                     key=lambda result: result['line'])
+
+    assert [result['ok'] for result in results] == [True, True, False]
+    assert results[2]['error'] == 'Unknown option for Status: Nonexistent'
+    # One refetch for the field, not one per unknown value
+    assert len(field_list_calls(fake_gh)) == calls_before + 1
+
+
+def test_unknown_field_refreshes_cached_schema(fake_gh):
+    fake_gh.project(items=10, fields={'Status': 5})
+    FieldSchemaCache.default().fields('acme', 1)
+
+    fake_gh.project(items=10, fields={'Status': 5, 'Team': 3})
+    rows = [{'item_id': 'PVTI_synthetic_1_0', 'field': 'Team', 'value': 'Team 2'}]
+    results = list(GHProjectHelpers.bulk_update_fields('PVT_synthetic', rows, schema=('acme', 1)))
+
+    assert results[0]['ok'] is True
+
+
+def test_fields_list_resolution(fake_gh):
+    fields = GHProjectHelpers.run_gh_command('project field-list 1 --owner acme', use_cache=False)['fields']
+    rows = [{'item_id': 'PVTI_synthetic_1_0', 'field': 'Priority', 'value': 'P1'},
+            {'item_id': 'PVTI_synthetic_1_1', 'field': 'Missing', 'value': 'x'},
+            {'item_id': 'PVTI_synthetic_1_2', 'field': 'Status', 'value': None}]
+    results = sorted(GHProjectHelpers.bulk_update_fields('PVT_synthetic', rows, fields, dry_run=True),
+                     key=lambda result: result['line'])
+
+    assert [result['ok'] for result in results] == [True, False, True]
+    assert results[1]['error'] == 'Unknown field: Missing'
@@ -0,0 +1,108 @@
+"""Tests for GraphQL item pagination (iter_project_item_pages / fetch_project_items) against the fake gh."""
+
+import json
+
+import pytest
+
+from gh_project_helpers import GHProjectError, GHProjectHelpers
+from synthetic_project import SyntheticProject
+from conftest import NOW
+
+
+def graphql_queries(fake_gh):
+    calls = [argv for argv in fake_gh.calls() if argv[:2] == ['api', 'graphql']]
+    return [next(arg[len('query='):] for arg in argv if arg.startswith('query=')) for argv in calls]
+
+
+def test_pages_cover_every_item_in_order(fake_gh):
+    fake_gh.project(items=250)
+    pages = list(GHProjectHelpers.iter_project_item_pages('acme', 1))
+
+    assert [len(page['items']) for page in pages] == [100, 100, 50]
+    assert all(page['totalCount'] == 250 for page in pages)
+    ids = [item['id'] for page in pages for item in page['items']]
+    assert ids == [f'PVTI_synthetic_1_{i}' for i in range(250)]
+    # One request per page: the organization query resolves on the first try
+    assert len(graphql_queries(fake_gh)) == 3
+
+
+def test_items_are_normalized(fake_gh):
+    fake_gh.project(items=5)
+    item = next(iter(GHProjectHelpers.iter_project_item_pages('acme', 1)))['items'][0]
+    expected = SyntheticProject(items=5, now=NOW).item(0)
+
+    assert item['id'] == expected['id']
+    assert item['content']['type'] == expected['content']['type']
+    assert item['content']['title'] == expected['content']['title']
+    assert item['updatedAt'] == expected['content']['updatedAt']
+    assert GHProjectHelpers.get_item_field_values(item) == GHProjectHelpers.get_item_field_values(expected)
+
+
+def test_fetch_writes_readable_file(fake_gh, tmp_path):
+    fake_gh.project(items=230)
+    output = tmp_path / 'items.json'
+    summary = GHProjectHelpers.fetch_project_items('acme', 1, output, page_size=50)
+
+    assert summary['items'] == 230 and summary['pages'] == 5 and summary['totalCount'] == 230
+    assert len(list(GHProjectHelpers.iter_items(output, use_cache=False))) == 230
+    assert json.loads(output.read_text())['totalCount'] == 230
+    assert not (tmp_path / 'items.json.part').exists()
+
+
+def test_limit_stops_paging(fake_gh, tmp_path):
+    fake_gh.project(items=1000)
+    output = tmp_path / 'items.json'
+    summary = GHProjectHelpers.fetch_project_items('acme', 1, output, limit=150)
+
+    items = list(GHProjectHelpers.iter_items(output, use_cache=False))
+    assert summary['items'] == 150 and len(items) == 150
+    assert items[-1]['id'] == 'PVTI_synthetic_1_149'
+    # Pages after the one that reached the limit are never requested
+    assert summary['pages'] == 2
+    assert len(graphql_queries(fake_gh)) == 2
+
+
+def test_user_owner_falls_back_from_organization(fake_gh):
+    fake_gh.project(items=120).env('GH_FAKE_OWNER', 'user')
+    pages = list(GHProjectHelpers.iter_project_item_pages('octocat', 1))
+
+    assert sum(len(page['items']) for page in pages) == 120
+    queries = graphql_queries(fake_gh)
+    assert 'organization(' in queries[0]
+    # The owner type is resolved once; later pages go straight to user
+    assert all('user(' in query for query in queries[1:])
+    assert len(queries) == 3
+
+
+def test_viewer_owner(fake_gh):
+    fake_gh.project(items=10).env('GH_FAKE_OWNER', 'organization')
+    pages = list(GHProjectHelpers.iter_project_item_pages('@me', 1))
+
+    assert len(pages[0]['items']) == 10
+    assert 'viewer {' in graphql_queries(fake_gh)[0]
+
+
+def test_unknown_owner_raises(fake_gh):
+    # Resolves as neither an organization nor a user
+    fake_gh.env('GH_FAKE_OWNER', 'nobody')
+    with pytest.raises(GHProjectError):
+        list(GHProjectHelpers.iter_project_item_pages('ghost', 1))
+
+
+def test_field_projection_uses_aliases(fake_gh):
+    fake_gh.project(items=40)
+    items = [item for page in GHProjectHelpers.iter_project_item_pages('acme', 1, ['Status', 'Priority'],
+                                                                          ['number'])
+             for item in page['items']]
+    query = graphql_queries(fake_gh)[0]
+
+    assert 'fieldValueByName(name: "Status")' in query
+    assert 'fieldValueByName(name: "Priority")' in query
+    assert 'fieldValues(' not in query
+
+    project = SyntheticProject(items=40, now=NOW)
+    for index, item in enumerate(items):
+        expected = GHProjectHelpers.get_item_field_values(project.item(index))
+        assert GHProjectHelpers.get_item_field_values(item) == {
+            name: value for name, value in expected.items() if name in ('Status', 'Priority')}
+        assert 'title' not in item['content']
@@ -0,0 +1,117 @@
+"""Tests for FilterExpression parsing and evaluation."""
+
+from datetime import datetime, timedelta, timezone
+
+import pytest
+
+from gh_project_helpers import FilterExpression, GHProjectError, ProjectItemIndex
+from synthetic_project import SyntheticProject
+from conftest import NOW
+
+
+def item(item_id, updated='2026-01-01T00:00:00Z', labels=(), title='', **fields):
+    field_values = [{'name' if not isinstance(value, (int, float)) else 'number': value,
+                     'field': {'name': name.replace('_', ' ')}} for name, value in fields.items()]
+    return {'id': item_id, 'content': {'type': 'Issue', 'title': title, 'updatedAt': updated},
+            'fieldValues': field_values, 'labels': list(labels)}
+
+
+ITEMS = [
+    item('a', Status='Todo', Priority='P0', Story_Points=3, labels=['bug'], title='Crash on login'),
+    item('b', Status='Todo', Priority='P2', Story_Points=8, title="Don't crash"),
+    item('c', Status='In Progress', Priority='P1', labels=['bug', 'security'], title='Fix "quotes"'),
+    item('d', Status='Done', updated='2025-11-15T08:00:00Z', title='Ship it'),
+]
+
+
+def ids(text, items=ITEMS):
+    return [entry['id'] for entry in FilterExpression(text).filter(items)]
+
+
+def test_and_binds_tighter_than_or():
+    assert ids('Status = Done or Status = Todo and Priority = P0') == ['a', 'd']
+    assert ids('(Status = Done or Status = Todo) and Priority = P0') == ['a']
+
+
+def test_not_binds_tighter_than_and():
+    assert ids('not Status = Todo and has(Priority)') == ['c']
+    assert ids('not (Status = Todo and has(Priority))') == ['c', 'd']
+    assert ids('Status = todo OR Status = Done AND NOT has(Priority)') == ['d']
+
+
+def test_quoting():
+    assert ids('"Story Points" >= 5') == ['b']
+    assert ids("Status = 'In Progress'") == ['c']
+    assert ids('Status in ("Todo", \'Done\')') == ['a', 'b', 'd']
+    assert ids("title = 'Don\\'t crash'") == ['b']
+    assert ids('title ~ "\\"quotes\\""') == ['c']
+
+
+def test_comparisons():
+    assert ids('Priority <= P1') == ['a', 'c']
+    assert ids('Priority > P0') == ['b', 'c']
+    assert ids('"Story Points" = 3') == ['a']
+    assert ids('"Story Points" < 4.5') == ['a']
+    assert ids('title ~ CRASH') == ['a', 'b']
+    # Items without the field match only != and 'not in'
+    assert ids('Priority != P0') == ['b', 'c', 'd']
+    assert ids('Priority not in (P0, P2)') == ['c', 'd']
+    assert ids('label = bug') == ['a', 'c']
+    assert ids('label != bug') == ['b', 'd']
+    assert ids('label in (security, wontfix)') == ['c']
+
+
+def test_date_literals():
+    assert ids('updated < 2025-12-01') == ['d']
+    assert ids('updated >= 2025-11-15T08:00:00Z') == ['a', 'b', 'c', 'd']
+    assert ids('updated > "2025-11-15T08:00:00+00:00"') == ['a', 'b', 'c']
+
+
+def test_durations_compare_age():
+    now = datetime.now(timezone.utc)
+    items = [item(str(days), updated=(now - timedelta(days=days)).strftime('%Y-%m-%dT%H:%M:%SZ'))
+             for days in (1, 10, 40)]
+
+    assert ids('updated < 7d', items) == ['1']
+    assert ids('updated > 2w', items) == ['40']
+    assert ids('updated >= 48h and updated <= 30d', items) == ['10']
+
+
+@pytest.mark.parametrize('text', [
+    'Status =',
+    'Status in (Todo',
+    'Status in Todo',
+    'and Status = Todo',
+    'Status Todo',
+    'Status not = Todo',
+    'Status = Todo)',
+    '(Status = Todo',
+    'has Status',
+    'Status = "unterminated',
+    'Priority < 7d',
+    'label = 2w',
+    'updated = banana',
+])
+def test_invalid_syntax_raises(text):
+    with pytest.raises(GHProjectError, match='Invalid filter expression'):
+        FilterExpression(text)
+
+
+@pytest.mark.parametrize('text', [
+    'Status = Todo',
+    'Status in (Todo, "In Progress") and Priority <= P1',
+    'Status = Done and Priority = P3 and Size in (S, M)',
+    'Status = Todo or Priority = P0',
+    'not Status = Done and has(Team)',
+    'Status != Todo and Team ~ 3',
+    'Iteration = "Iteration 5" and label = bug',
+    'updated < 2025-12-15 and Status in (Todo, Backlog)',
+])
+def test_index_and_scan_agree(text):
+    items = list(SyntheticProject(items=3000, now=NOW).iter_items())
+    expr = FilterExpression(text)
+
+    scanned = [entry['id'] for entry in expr.filter(items)]
+    indexed = [entry['id'] for entry in expr.filter([], ProjectItemIndex(items))]
+    assert indexed == scanned
+    assert scanned
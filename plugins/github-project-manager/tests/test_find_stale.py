@@ -0,0 +1,52 @@
+"""Tests for the find-stale command with and without a binary items cache."""
+
+import json
+import sys
+from datetime import datetime, timezone
+
+import pytest
+
+import gh_project_helpers
+from gh_project_helpers import GHProjectHelpers, ItemsBinaryCache, ProjectItemTimeline, ProjectItemStore
+from synthetic_project import SyntheticProject
+from conftest import NOW
+
+# Items of the synthetic project are up to a few months older than NOW
+DAYS = (datetime.now(timezone.utc) - datetime.fromisoformat(NOW.replace('Z', '+00:00'))).days + 10
+
+
+def run(monkeypatch, capsys, *argv):
+    monkeypatch.setattr(sys, 'argv', ['gh_project_helpers.py', *argv])
+    assert gh_project_helpers.main() in (0, None)
+    return json.loads(capsys.readouterr().out)
+
+
+@pytest.fixture
+def source(tmp_path):
+    path = tmp_path / 'items.json'
+    SyntheticProject(items=400, now=NOW).write(str(path))
+    return path
+
+
+@pytest.mark.parametrize('status', [[], ['--status', 'Todo', '--status', 'In Progress']])
+def test_cached_timeline_matches_scan(source, monkeypatch, capsys, status):
+    scanned = run(monkeypatch, capsys, 'find-stale', str(source), '--days', str(DAYS), *status)
+    assert 0 < len(scanned) < 400
+
+    ItemsBinaryCache.build(source)
+
+    def no_scan(*args, **kwargs):
+        raise AssertionError('find-stale scanned every item despite a current cache')
+    monkeypatch.setattr(GHProjectHelpers, 'iter_stale_items', no_scan)
+    assert run(monkeypatch, capsys, 'find-stale', str(source), '--days', str(DAYS), *status) == scanned
+
+
+def test_timeline_from_store_matches_items(source):
+    items = list(GHProjectHelpers.iter_items(source, use_cache=False))
+    from_items = ProjectItemTimeline(items)
+    from_store = ProjectItemTimeline.from_store(ProjectItemStore(items))
+
+    assert from_store.ids == from_items.ids and from_store.groups == from_items.groups
+    assert from_store.epochs == from_items.epochs and from_store.positions == from_items.positions
+    now = datetime.now(timezone.utc).timestamp()
+    assert from_store.histogram([7, 30, 90], now=now) == from_items.histogram([7, 30, 90], now=now)
@@ -0,0 +1,87 @@
+"""Tests for gh argv construction and the concurrent gh runners against the fake gh."""
+
+import time
+
+from gh_project_helpers import GHProjectHelpers
+
+TITLE = """$(touch pwned) it's "quoted"; echo done"""
+
+
+def test_argv_from_string_and_list():
+    build = GHProjectHelpers.build_gh_argv
+    assert build('project view 3 --owner acme') == ['gh', 'project', 'view', '3', '--owner', 'acme',
+                                                    '--format', 'json']
+    assert build('gh project view 3', format_json=False) == ['gh', 'project', 'view', '3']
+    assert build(['project', 'item-edit', '--text', 'a b']) == ['gh', 'project', 'item-edit', '--text', 'a b',
+                                                                '--format', 'json']
+    assert build('project item-create 1 --title "Fix: it\'s broken"', format_json=False)[-1] == "Fix: it's broken"
+
+
+def test_format_json_not_duplicated():
+    build = GHProjectHelpers.build_gh_argv
+    assert build('project list --format json').count('--format') == 1
+    assert build('project list --format=json') == ['gh', 'project', 'list', '--format=json']
+    assert build(['project', 'list', '--format', 'json']).count('--format') == 1
+
+
+def test_arguments_reach_gh_verbatim(fake_gh, tmp_path, monkeypatch):
+    # No shell: metacharacters in values are passed through, never run
+    monkeypatch.chdir(tmp_path)
+    created = GHProjectHelpers.run_gh_command(['project', 'item-create', '1', '--owner', 'acme', '--title', TITLE])
+
+    assert created['title'] == TITLE
+    assert fake_gh.calls()[-1] == ['project', 'item-create', '1', '--owner', 'acme', '--title', TITLE,
+                                   '--format', 'json']
+    assert not (tmp_path / 'pwned').exists()
+
+
+def test_concurrent_results_in_command_order(fake_gh):
+    fake_gh.env('GH_FAKE_LATENCY', 0.05)
+    commands = [f'project item-list 1 --owner acme --limit {limit}' for limit in range(1, 13)]
+    results = GHProjectHelpers.run_gh_commands_sync(commands, max_concurrency=6)
+
+    assert [result['index'] for result in results] == list(range(12))
+    assert all(result['ok'] and result['error'] is None for result in results)
+    assert [len(result['data']['items']) for result in results] == list(range(1, 13))
+    assert [result['argv'][-3] for result in results] == [str(limit) for limit in range(1, 13)]
+
+
+def test_completion_order_keeps_every_result(fake_gh):
+    commands = [['project', 'item-list', '1', '--owner', 'acme', '--limit', str(limit)] for limit in range(1, 9)]
+    results = GHProjectHelpers.run_gh_commands_sync(commands, ordered=False)
+
+    assert sorted(result['index'] for result in results) == list(range(8))
+    assert all(len(result['data']['items']) == int(result['argv'][-3]) for result in results)
+
+
+def test_failures_are_reported_per_command(fake_gh):
+    commands = ['project item-list 1 --owner acme --limit 2', 'project bogus 1', 'project view 1 --owner acme']
+    results = GHProjectHelpers.run_gh_commands_sync(commands)
+
+    assert [result['ok'] for result in results] == [True, False, True]
+    failed = results[1]
+    assert failed['returncode'] == 1 and failed['data'] is None
+    assert 'Command failed: gh project bogus 1 --format json' in failed['error']
+    assert 'unsupported command' in failed['error']
+    assert results[2]['data']['number'] == 1
+
+
+def test_timeout_and_missing_gh(fake_gh, monkeypatch):
+    fake_gh.env('GH_FAKE_LATENCY', 2)
+    result, = GHProjectHelpers.run_gh_commands_sync(['project view 1 --owner acme'], timeout=0.2)
+    assert not result['ok'] and 'timed out after 0.2s' in result['error']
+
+    monkeypatch.setenv('PATH', '')
+    result, = GHProjectHelpers.run_gh_commands_sync(['project view 1 --owner acme'])
+    assert not result['ok'] and result['error'] == 'gh CLI not found on PATH'
+
+
+def test_concurrency_is_bounded(fake_gh):
+    fake_gh.env('GH_FAKE_LATENCY', 0.2)
+    commands = [f'project item-list 1 --owner acme --limit {limit}' for limit in range(1, 7)]
+    start = time.monotonic()
+    results = GHProjectHelpers.run_gh_commands_sync(commands, max_concurrency=2)
+
+    assert all(result['ok'] for result in results)
+    # Six 0.2s calls, two at a time, take at least three rounds
+    assert time.monotonic() - start >= 0.55
@@ -0,0 +1,70 @@
+"""Tests for joining issue snapshots onto project items with --issues."""
+
+import json
+import sys
+
+import pytest
+
+import gh_project_helpers
+from gh_project_helpers import GHProjectError, IssueSnapshotStore, ProjectSnapshotStore, SnapshotStore
+from synthetic_project import SyntheticProject
+from conftest import NOW
+
+
+def run(monkeypatch, capsys, *argv):
+    monkeypatch.setattr(sys, 'argv', ['gh_project_helpers.py', *argv])
+    assert gh_project_helpers.main() in (0, None)
+    return json.loads(capsys.readouterr().out)
+
+
+@pytest.fixture
+def bare_items(tmp_path):
+    # Project exports carry no labels, state or body; the join supplies them
+    path = tmp_path / 'items.json'
+    SyntheticProject(items=60, now=NOW).write(str(path))
+    items = json.loads(path.read_text())['items']
+    for item in items:
+        item.pop('labels', None)
+        for key in ('labels', 'state', 'body'):
+            item['content'].pop(key, None)
+    path.write_text(json.dumps({'items': items}))
+    return path
+
+
+def test_issues_join_enriches_items(fake_gh, bare_items, monkeypatch, capsys):
+    fake_gh.project(items=60)
+    summary = IssueSnapshotStore().sync('acme/app')
+    assert summary['count'] > 0
+    records = {record['url']: record for record in IssueSnapshotStore().iter_items('acme', 'app')}
+
+    joined = run(monkeypatch, capsys, 'filter-items', str(bare_items), '--issues', 'acme/app')
+    assert len(joined) == 60
+    matched = [item for item in joined if item['content'].get('url') in records]
+    assert matched
+    for item in matched:
+        record = records[item['content']['url']]
+        for key in ('labels', 'state', 'body'):
+            assert item['content'].get(key) == record.get(key)
+
+    # Drafts have no URL or number and pass through unchanged
+    drafts = [item for item in joined if item['content'].get('type') == 'DraftIssue']
+    assert all('labels' not in item['content'] for item in drafts)
+
+    label = next(label for item in matched for label in item['content']['labels'])
+    labelled = run(monkeypatch, capsys, 'filter-items', str(bare_items), '--issues', 'acme/app',
+                   '--where', f'label = "{label}"')
+    expected = {item['id'] for item in matched if label in item['content']['labels']}
+    assert {item['id'] for item in labelled} == expected
+
+
+def test_stores_are_separate(fake_gh):
+    issues, projects = IssueSnapshotStore(), ProjectSnapshotStore()
+    assert not isinstance(issues, ProjectSnapshotStore)
+    assert isinstance(issues, SnapshotStore) and isinstance(projects, SnapshotStore)
+    assert issues.dir('acme', 'app').parent.name == 'issues'
+    assert projects.dir('acme', 1).parent.name == 'snapshots'
+
+    with pytest.raises(GHProjectError, match='run issue-snapshot first'):
+        list(issues.iter_items('acme', 'app'))
+    with pytest.raises(GHProjectError, match='run sync first'):
+        list(projects.iter_items('acme', 1))
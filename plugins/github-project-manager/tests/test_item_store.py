@@ -0,0 +1,41 @@
+"""Tests for ProjectItemStore, the columnar item store."""
+
+from gh_project_helpers import ProjectItemStore
+
+
+def make_item(index, **values):
+    return {'id': f'item-{index}', 'content': {'number': index, 'title': f'Item {index}'},
+            'fieldValues': [{'name' if isinstance(value, str) else 'number': value, 'field': {'name': name}}
+                            for name, value in values.items()]}
+
+
+def test_round_trip_field_values():
+    store = ProjectItemStore([make_item(1, Status='Todo'), make_item(2, Priority='P1'), make_item(3)])
+
+    assert len(store) == 3
+    assert store.value(0, 'Status') == 'Todo'
+    assert store.value(0, 'Priority') is None
+    assert store.value(1, 'Priority') == 'P1'
+    assert store.item_field_values(2) == {}
+
+
+def test_column_widens_past_65535_distinct_values():
+    # Regression: the widened column used to miss the row that triggered widening
+    count = 0xFFFF + 10
+    store = ProjectItemStore(make_item(i, Title=f'title {i}', Status='Todo' if i % 2 else 'Done')
+                             for i in range(count))
+
+    assert store.columns['Title'].typecode == 'L'
+    assert all(len(column) == count for column in store.columns.values())
+    for pos in (0, 0xFFFE, 0xFFFF, count - 1):
+        assert store.value(pos, 'Title') == f'title {pos}'
+        assert store.value(pos, 'Status') == ('Todo' if pos % 2 else 'Done')
+
+
+def test_state_round_trip_after_widening():
+    count = 0xFFFF + 2
+    store = ProjectItemStore(make_item(i, Title=f'title {i}') for i in range(count))
+    restored = ProjectItemStore.from_state(store.to_state())
+
+    assert len(restored) == count
+    assert restored.value(count - 1, 'Title') == f'title {count - 1}'
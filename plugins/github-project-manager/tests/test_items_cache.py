@@ -0,0 +1,123 @@
+"""Tests for ItemsBinaryCache, the .ghsnap copy of an items export."""
+
+import gc
+import os
+import shutil
+
+from gh_project_helpers import GHProjectHelpers, ItemsBinaryCache
+from synthetic_project import SyntheticProject
+from conftest import NOW
+
+
+def write_items(path, items=50):
+    SyntheticProject(items=items, now=NOW).write(str(path))
+    return path
+
+
+def test_build_and_load(tmp_path):
+    source = write_items(tmp_path / 'items.json')
+    summary = ItemsBinaryCache.build(source)
+
+    assert summary['items'] == 50 and summary['cache'] == str(tmp_path / 'items.json.ghsnap')
+    assert ItemsBinaryCache.load(source) == list(GHProjectHelpers.iter_items(source, use_cache=False))
+    assert len(ItemsBinaryCache.load_store(source)) == 50
+    assert ItemsBinaryCache.status(source)['current'] is True
+
+
+def test_touch_keeps_cache_but_edit_and_copy_do_not(tmp_path):
+    source = write_items(tmp_path / 'items.json')
+    ItemsBinaryCache.build(source)
+
+    os.utime(source, ns=(0, 0))
+    assert ItemsBinaryCache.load(source) is not None
+
+    # A copy has another path, and the header pins the original one
+    copy = tmp_path / 'copy.json'
+    shutil.copy(source, copy)
+    shutil.copy(ItemsBinaryCache.cache_path(source), ItemsBinaryCache.cache_path(copy))
+    assert ItemsBinaryCache.load(copy) is None
+
+    write_items(source, items=51)
+    assert ItemsBinaryCache.load(source) is None
+
+
+def test_disabled_by_environment(tmp_path, monkeypatch):
+    source = write_items(tmp_path / 'items.json')
+    ItemsBinaryCache.build(source)
+    monkeypatch.setenv('GH_PROJECT_SNAPSHOT', '0')
+
+    assert ItemsBinaryCache.load(source) is None
+
+
+def test_loading_leaves_garbage_collection_alone(tmp_path):
+    source = write_items(tmp_path / 'items.json')
+    ItemsBinaryCache.build(source)
+    frozen = gc.get_freeze_count()
+
+    assert ItemsBinaryCache.load(source) is not None
+    assert gc.get_freeze_count() == frozen
+    assert gc.isenabled()
+
+
+def count_decodes(monkeypatch):
+    decoded = []
+    decode = ItemsBinaryCache._decode
+
+    def counting(data):
+        decoded.append(len(data))
+        return decode(data)
+    monkeypatch.setattr(ItemsBinaryCache, '_decode', staticmethod(counting))
+    return decoded
+
+
+def test_cache_hit_streams_chunks(tmp_path, monkeypatch):
+    monkeypatch.setattr(ItemsBinaryCache, 'CHUNK_ITEMS', 10)
+    source = write_items(tmp_path / 'items.json')
+    ItemsBinaryCache.build(source)
+    decoded = count_decodes(monkeypatch)
+
+    items = GHProjectHelpers.iter_items(source)
+    first = next(items)
+    # One chunk of ten is decoded, not the whole list
+    assert len(decoded) == 1
+    assert [first] + list(items) == list(GHProjectHelpers.iter_items(source, use_cache=False))
+    assert len(decoded) == 5
+
+
+def test_full_read_builds_cache(tmp_path, monkeypatch):
+    monkeypatch.setattr(ItemsBinaryCache, 'BUILD_MIN_BYTES', 0)
+    monkeypatch.setattr(ItemsBinaryCache, 'CHUNK_ITEMS', 16)
+    source = write_items(tmp_path / 'items.json')
+
+    expected = list(GHProjectHelpers.iter_items(source))
+    assert ItemsBinaryCache.status(source)['current'] is True
+    assert ItemsBinaryCache.read_header(source)['chunks'] and len(ItemsBinaryCache.load_store(source)) == 50
+    assert ItemsBinaryCache.load(source) == expected
+    assert sorted(path.name for path in tmp_path.iterdir()) == ['items.json', 'items.json.ghsnap']
+
+
+def test_partial_read_small_file_and_disabled_write_nothing(tmp_path, monkeypatch):
+    source = write_items(tmp_path / 'items.json')
+    assert len(list(GHProjectHelpers.iter_items(source))) == 50
+
+    monkeypatch.setattr(ItemsBinaryCache, 'BUILD_MIN_BYTES', 0)
+    items = GHProjectHelpers.iter_items(source)
+    next(items)
+    items.close()
+
+    monkeypatch.setenv('GH_PROJECT_SNAPSHOT', '0')
+    assert len(list(GHProjectHelpers.iter_items(source))) == 50
+    assert sorted(path.name for path in tmp_path.iterdir()) == ['items.json']
+
+
+def test_status_reads_only_the_header(tmp_path, monkeypatch):
+    source = write_items(tmp_path / 'items.json')
+    ItemsBinaryCache.build(source)
+    decoded = count_decodes(monkeypatch)
+
+    status = ItemsBinaryCache.status(source)
+    assert status['current'] is True and status['items'] == 50
+    assert decoded == []
+
+    write_items(source, items=51)
+    assert ItemsBinaryCache.status(source)['current'] is False
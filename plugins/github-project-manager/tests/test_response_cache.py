@@ -0,0 +1,43 @@
+"""Tests for GHResponseCache index maintenance."""
+
+import os
+
+from gh_project_helpers import GHResponseCache
+
+LIST = 'project item-list 1 --owner acme --format json'
+VIEW = 'project view 1 --owner acme --format json'
+FIELDS = 'project field-list 1 --owner acme --format json'
+
+
+def test_hits_do_not_rewrite_the_index(tmp_path):
+    cache = GHResponseCache(tmp_path)
+    cache.put(LIST, '{"items": []}')
+    before = cache.index_path.read_bytes()
+    os.utime(cache.index_path, (0, 0))
+
+    for _ in range(3):
+        assert cache.get(LIST) == '{"items": []}'
+
+    assert cache.index_path.read_bytes() == before
+    assert cache.index_path.stat().st_mtime == 0
+
+
+def test_hits_still_order_eviction(tmp_path):
+    cache = GHResponseCache(tmp_path, max_entries=2)
+    cache.put(LIST, 'list')
+    cache.put(VIEW, 'view')
+    # The older entry was read since, so the next put evicts the other one
+    assert cache.get(LIST) == 'list'
+    cache.put(FIELDS, 'fields')
+
+    assert cache.get(LIST) == 'list'
+    assert cache.get(VIEW) is None
+    assert cache.get(FIELDS) == 'fields'
+
+
+def test_index_writes_leave_no_temp_files(tmp_path):
+    cache = GHResponseCache(tmp_path)
+    cache.put(LIST, 'list')
+    cache.invalidate()
+
+    assert sorted(path.name for path in cache.dir.iterdir()) == ['index.json']
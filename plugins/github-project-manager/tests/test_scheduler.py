@@ -0,0 +1,104 @@
+"""Tests for GHRequestScheduler retries and budget waits against a throttling fake gh."""
+
+import pytest
+
+from gh_project_helpers import GHProjectError, GHProjectHelpers, GHRequestScheduler
+
+ITEMS_QUERY = 'query { viewer { projectV2(number: 1) { id } } }'
+MUTATION = 'mutation { u0: archiveProjectV2Item(input: {projectId: "PVT_x", itemId: "PVTI_x"}) { item { id } } }'
+
+
+@pytest.fixture
+def scheduler(monkeypatch):
+    # Short delays so retries cost milliseconds
+    scheduler = GHRequestScheduler(rate=1000, mutation_rate=1000, max_retries=3, base_delay=0.01,
+                                   max_delay=0.02, max_wait=0.5)
+    monkeypatch.setattr(GHRequestScheduler, '_default', scheduler)
+    return scheduler
+
+
+@pytest.fixture
+def throttle(fake_gh, tmp_path):
+    """Make the fake gh fail the next calls: throttle('429', 2)."""
+    def configure(kind, count=None):
+        fake_gh.env('GH_FAKE_STATE', tmp_path / 'fake-gh.state')
+        fake_gh.env('GH_FAKE_FAIL', kind if count is None else f'{kind}:{count}')
+        return fake_gh
+    return configure
+
+
+def gh_calls(fake_gh, *prefix):
+    return [argv for argv in fake_gh.calls() if argv[:len(prefix)] == list(prefix)]
+
+
+@pytest.mark.parametrize('kind', ['429', 'secondary', '502', 'timeout'])
+def test_read_retried_until_success(scheduler, throttle, kind):
+    fake_gh = throttle(kind, 2)
+    data = GHProjectHelpers.run_gh_graphql(ITEMS_QUERY)
+
+    assert 'viewer' in data
+    assert len(gh_calls(fake_gh, 'api', 'graphql')) == 3
+    assert scheduler.stats['retries'] == 2
+    assert scheduler.stats['throttled'] == (0 if kind in ('502', 'timeout') else 2)
+
+
+def test_gives_up_after_max_retries(scheduler, throttle):
+    fake_gh = throttle('429')
+    with pytest.raises(GHProjectError, match='429'):
+        GHProjectHelpers.run_gh_graphql(ITEMS_QUERY)
+
+    assert len(gh_calls(fake_gh, 'api', 'graphql')) == scheduler.max_retries + 1
+
+
+def test_exhausted_budget_waits_for_reset(scheduler, throttle):
+    fake_gh = throttle('primary', 1).env('GH_FAKE_RESET_IN', 5)
+    data = GHProjectHelpers.run_gh_graphql(ITEMS_QUERY)
+
+    assert 'viewer' in data
+    # The budget was read from gh api rate_limit and the retry waited for the
+    # reset (capped at max_wait) instead of backing off for milliseconds
+    assert gh_calls(fake_gh, 'api', 'rate_limit')
+    assert scheduler.stats['throttled'] == 1
+    assert scheduler.stats['waited'] >= scheduler.max_wait
+
+
+@pytest.mark.parametrize('kind', ['429', 'secondary'])
+def test_throttled_mutation_retried(scheduler, throttle, kind):
+    fake_gh = throttle(kind, 1)
+    GHProjectHelpers.run_gh_graphql(MUTATION, allow_errors=True)
+
+    assert len(gh_calls(fake_gh, 'api', 'graphql')) == 2
+
+
+@pytest.mark.parametrize('kind', ['502', 'timeout'])
+def test_mutation_not_retried_after_transient_error(scheduler, throttle, kind):
+    # The server may have applied the change before failing; retrying could duplicate it
+    fake_gh = throttle(kind)
+    with pytest.raises(GHProjectError):
+        GHProjectHelpers.run_gh_command('project item-create 1 --owner acme --title X', format_json=True)
+    with pytest.raises(GHProjectError):
+        GHProjectHelpers.run_gh_graphql(MUTATION)
+
+    assert len(gh_calls(fake_gh, 'project', 'item-create')) == 1
+    assert len(gh_calls(fake_gh, 'api', 'graphql')) == 1
+    assert scheduler.stats['retries'] == 0
+
+
+def test_throttled_item_create_succeeds_once(scheduler, throttle):
+    fake_gh = throttle('secondary', 1)
+    created = GHProjectHelpers.run_gh_command('project item-create 1 --owner acme --title X')
+
+    assert created['id'] == 'PVTI_created'
+    assert len(gh_calls(fake_gh, 'project', 'item-create')) == 2
+
+
+def test_classify_buckets():
+    classify = GHRequestScheduler.classify
+    assert classify(['gh', 'api', 'graphql', '-f', f'query={MUTATION}'])['bucket'] == 'mutation'
+    assert classify(['gh', 'api', 'graphql', '-f', f'query={ITEMS_QUERY}'])['bucket'] == 'read'
+    assert classify(['gh', 'project', 'item-create', '1'])['bucket'] == 'mutation'
+    assert classify(['gh', 'project', 'item-list', '1'])['bucket'] == 'read'
+    assert classify(['gh', 'issue', 'create', '--title', 'x'])['bucket'] == 'mutation'
+    assert classify(['gh', 'issue', 'view', '3'])['bucket'] == 'read'
+    assert classify(['gh', 'api', 'repos/a/b/issues', '-f', 'title=x'])['bucket'] == 'mutation'
+    assert classify(['gh', 'api', '-X', 'GET', 'search/issues', '-f', 'q=x'])['bucket'] == 'read'
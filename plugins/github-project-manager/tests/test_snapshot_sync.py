@@ -0,0 +1,45 @@
+"""Tests for ProjectSnapshotStore delta syncs against the fake gh."""
+
+import json
+
+from gh_project_helpers import ProjectSnapshotStore
+
+
+def fetched_ids(fake_gh):
+    # Ids requested through nodes(ids: [...]) by the delta fetch
+    ids = []
+    for argv in fake_gh.calls():
+        query = next((arg for arg in argv if arg.startswith('query=')), '')
+        if 'nodes(ids:' in query:
+            ids += json.loads(query.split('nodes(ids: ', 1)[1].split(')', 1)[0])
+    return ids
+
+
+def test_full_then_unchanged_delta(fake_gh):
+    fake_gh.project(items=150)
+    store = ProjectSnapshotStore()
+
+    assert store.sync('acme', 1)['mode'] == 'full'
+    summary = store.sync('acme', 1)
+    assert summary['mode'] == 'delta' and summary['count'] == 150
+    # Only items updated in the watermark's own second are refetched
+    assert summary['fetched'] <= 2
+
+
+def test_edited_issue_is_refetched(fake_gh):
+    # The linked issue changes; the project item's updatedAt does not
+    fake_gh.project(items=150)
+    store = ProjectSnapshotStore()
+    store.sync('acme', 1)
+
+    fake_gh.env('GH_FAKE_CONTENT_EDITS', json.dumps({'7': '2026-01-01T00:00:05Z'}))
+    summary = store.sync('acme', 1)
+
+    assert 'PVTI_synthetic_1_7' in fetched_ids(fake_gh)
+    assert summary['watermark'] == '2026-01-01T00:00:05Z'
+    item = next(item for item in store.iter_items('acme', 1) if item['id'] == 'PVTI_synthetic_1_7')
+    assert item['content']['updatedAt'] == '2026-01-01T00:00:05Z'
+    assert item['content']['title'].endswith('(edited)')
+
+    # The watermark moved to the edit: the next sync only rechecks that second
+    assert store.sync('acme', 1)['fetched'] == 1
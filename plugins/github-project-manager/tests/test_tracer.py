@@ -0,0 +1,57 @@
+"""Tests for GHCallTracer trace files."""
+
+import builtins
+import fcntl
+import json
+from concurrent.futures import ProcessPoolExecutor
+
+from gh_project_helpers import GHCallTracer
+
+
+def record_calls(path, count):
+    tracer = GHCallTracer(path)
+    for i in range(count):
+        tracer.record(['gh', 'project', 'item-list', str(i)], 0.0, 0.01, 0, '{}', '')
+    return tracer.write()
+
+
+def test_write_merges_and_leaves_no_lock_file(tmp_path):
+    path = tmp_path / 'trace.json'
+    record_calls(str(path), 3)
+    record_calls(str(path), 2)
+
+    trace = json.loads(path.read_text())
+    assert trace['calls'] == 5 and trace['processes'] == 2
+    assert sorted(p.name for p in tmp_path.iterdir()) == ['trace.json']
+
+
+def test_concurrent_writers_lose_nothing(tmp_path):
+    path = str(tmp_path / 'trace.json')
+    with ProcessPoolExecutor(max_workers=4) as pool:
+        list(pool.map(record_calls, [path] * 16, [5] * 16))
+
+    trace = json.loads((tmp_path / 'trace.json').read_text())
+    assert trace['calls'] == 80 and trace['processes'] == 16
+    assert sorted(p.name for p in tmp_path.iterdir()) == ['trace.json']
+
+
+def test_write_without_flock_closes_the_lock_file(tmp_path, monkeypatch):
+    # Filesystems without flock support: write unlocked, leak no handle
+    def no_flock(*args):
+        raise OSError(37, 'No locks available')
+
+    handles = []
+
+    def tracking_open(*args, **kwargs):
+        handle = real_open(*args, **kwargs)
+        handles.append(handle)
+        return handle
+
+    real_open = builtins.open
+    monkeypatch.setattr(fcntl, 'flock', no_flock)
+    monkeypatch.setattr(builtins, 'open', tracking_open)
+    path = tmp_path / 'trace.json'
+    assert record_calls(str(path), 2) == str(path)
+
+    assert json.loads(path.read_text())['calls'] == 2
+    assert handles and all(handle.closed for handle in handles)
@@ -0,0 +1,109 @@
+"""Tests for ProjectVelocityTracker transitions and counters."""
+
+import json
+
+import pytest
+
+from gh_project_helpers import ProjectVelocityTracker
+
+BASELINE = '2026-01-05T00:00:00Z'
+DAY = '2026-01-05'
+
+
+def item(item_id, status=None, updated=BASELINE):
+    field_values = [{'name': status, 'field': {'name': 'Status'}}] if status else []
+    return {'id': item_id, 'updatedAt': updated, 'content': {'type': 'Issue', 'updatedAt': updated},
+            'fieldValues': field_values}
+
+
+@pytest.fixture
+def tracker(tmp_path):
+    tracker = ProjectVelocityTracker(tmp_path / 'history')
+    items = [item('a', 'Todo'), item('b', 'Done'), item('c')]
+    assert tracker.update(items, [], BASELINE, items) == 0
+    return tracker
+
+
+def sync(tracker, changed=(), removed=(), synced_at='2026-01-05T12:00:00Z'):
+    # Fresh instance, as each CLI sync loads the history from disk
+    fresh = ProjectVelocityTracker(tracker.directory)
+    transitions = fresh.update(list(changed), list(removed), synced_at)
+    return transitions, fresh.load_velocity()
+
+
+def day(velocity, key=DAY):
+    return velocity['daily'][key]
+
+
+def test_baseline_seeds_state_without_counting(tracker):
+    velocity = tracker.load_velocity()
+
+    assert tracker.item_ids() == {'a', 'b', 'c'}
+    assert velocity['wip'] == {'Todo': 1, 'Done': 1, 'Unset': 1}
+    assert velocity['daily'] == {} and velocity['weekly'] == {}
+    assert velocity['burndown'][DAY] == {'open': 2, 'total': 3}
+    assert not (tracker.directory / 'transitions.jsonl').exists()
+
+
+def test_status_change_records_transition_and_time_in_status(tracker):
+    transitions, velocity = sync(tracker, [item('a', 'In Progress', '2026-01-05T06:00:00Z')])
+
+    assert transitions == 1
+    assert velocity['wip'] == {'In Progress': 1, 'Done': 1, 'Unset': 1}
+    assert day(velocity)['transitions'] == 1 and day(velocity)['opened'] == 0
+    assert day(velocity)['status_seconds'] == {'Todo': [6 * 3600, 1]}
+    rows = [json.loads(line) for line in (tracker.directory / 'transitions.jsonl').read_text().splitlines()]
+    assert rows == [['2026-01-05T06:00:00Z', 'a', 'Todo', 'In Progress']]
+
+
+def test_cleared_status_is_tracked_as_unset(tracker):
+    _, velocity = sync(tracker, [item('a', None, '2026-01-05T01:00:00Z')])
+    assert velocity['wip'] == {'Unset': 2, 'Done': 1}
+    assert day(velocity)['removed'] == 0
+
+    _, velocity = sync(tracker, [item('a', 'Todo', '2026-01-05T03:00:00Z')])
+    assert velocity['wip'] == {'Todo': 1, 'Done': 1, 'Unset': 1}
+    # Clearing and re-setting the Status neither removes nor reopens the item
+    assert day(velocity)['opened'] == 0 and day(velocity)['removed'] == 0
+    assert day(velocity)['transitions'] == 2
+    assert day(velocity)['status_seconds']['Unset'] == [2 * 3600, 1]
+    assert ProjectVelocityTracker(tracker.directory).item_ids() == {'a', 'b', 'c'}
+
+
+def test_removal_drops_the_item(tracker):
+    transitions, velocity = sync(tracker, removed=['a', 'unknown'])
+
+    assert transitions == 1
+    assert day(velocity)['removed'] == 1
+    assert velocity['wip'] == {'Done': 1, 'Unset': 1}
+    assert ProjectVelocityTracker(tracker.directory).item_ids() == {'b', 'c'}
+
+
+def test_done_to_open_counts_reopened(tracker):
+    _, velocity = sync(tracker, [item('b', 'In Progress', '2026-01-05T02:00:00Z')])
+
+    assert day(velocity)['reopened'] == 1 and day(velocity)['done'] == 0
+    assert velocity['burndown'][DAY] == {'open': 3, 'total': 3}
+
+
+def test_cycle_time_runs_from_first_seen_to_done(tracker):
+    sync(tracker, [item('d', 'Todo', '2026-01-06T00:00:00Z')], synced_at='2026-01-06T00:00:00Z')
+    _, velocity = sync(tracker, [item('d', 'Done', '2026-01-08T12:00:00Z')], synced_at='2026-01-08T12:00:00Z')
+
+    assert day(velocity, '2026-01-06')['opened'] == 1
+    done_day = day(velocity, '2026-01-08')
+    assert done_day['done'] == 1
+    assert done_day['cycle_count'] == 1 and done_day['cycle_seconds'] == 2.5 * 86400
+    report = ProjectVelocityTracker(tracker.directory).report('day', last=3)
+    assert [entry['cycle_days'] for entry in report['periods']] == [None, None, 2.5]
+
+
+def test_no_cycle_time_without_an_observed_start(tracker):
+    # 'e' shows up already done; 'a' was in the project before the baseline
+    _, velocity = sync(tracker, [item('e', 'Done', '2026-01-05T02:00:00Z'),
+                                 item('a', 'Done', '2026-01-05T03:00:00Z')])
+
+    assert day(velocity)['done'] == 2 and day(velocity)['opened'] == 1
+    assert day(velocity)['cycle_count'] == 0 and day(velocity)['cycle_seconds'] == 0
+    report = ProjectVelocityTracker(tracker.directory).report('day', last=1)
+    assert report['periods'][0]['cycle_days'] is None